@@ -532,202 +532,195 @@ def infer_bleeds_entity_type(obj):
     return "UNKNOWN"
 
 
-from .gui import gui
-
-
-_classes = [
-    gui.IMPORT_OT_Stories_mdl,
-    gui.IMPORT_SCENE_OT_leeds_anim,
-    gui.DATA_PT_leeds_anim_bone_id,
-    gui.IMPORT_OT_COL2,
-    gui.EXPORT_OT_COL2,
-    gui.IMPORT_OT_tex,
-    gui.IMPORT_OT_leeds_world,
-    gui.IMPORT_OT_CW_wbl,
-    gui.EXPORT_OT_CW_wbl,
-    gui.EXPORT_OT_MDL_Bake_LeedsScalePos,
-    gui.EXPORT_PT_MDL_LeedsScalePos,
-    gui.EXPORT_OT_MDL_StampSemanticAttributes,
-    gui.EXPORT_PT_MDL_SemanticAttributes,
-    gui.OBJECT_PT_MDL_Manhunt2Properties,
-    gui.OBJECT_PT_BLeeds_2DFX,
-    gui.DATA_PT_BLeeds_2DFX_Light,
-    gui.CW_InstanceProps,
-    gui.CW_OT_LoadFromCustom,
-    gui.CW_OT_SaveToCustom,
-    gui.CW_MT_ExportChoice,
-    gui.TOPBAR_MT_file_import_bleeds,
-    gui.IMPORT_SCENE_OT_stories_lvz,
-    gui.EXPORT_SCENE_OT_stories_lvz_img,
-    gui.EXPORT_SCENE_OT_stories_mdl_ps2,
-]
+# The operator modules pull in numpy, zlib and the large importer modules, so
+# they are only loaded once Blender actually enables the add-on.
+gui = None
+
+_class_names = (
+    "IMPORT_OT_Stories_mdl",
+    "IMPORT_SCENE_OT_leeds_anim",
+    "DATA_PT_leeds_anim_bone_id",
+    "IMPORT_OT_COL2",
+    "EXPORT_OT_COL2",
+    "IMPORT_OT_tex",
+    "IMPORT_OT_leeds_world",
+    "IMPORT_OT_CW_wbl",
+    "EXPORT_OT_CW_wbl",
+    "EXPORT_OT_MDL_Bake_LeedsScalePos",
+    "EXPORT_PT_MDL_LeedsScalePos",
+    "EXPORT_OT_MDL_StampSemanticAttributes",
+    "EXPORT_PT_MDL_SemanticAttributes",
+    "OBJECT_PT_MDL_Manhunt2Properties",
+    "OBJECT_PT_BLeeds_2DFX",
+    "DATA_PT_BLeeds_2DFX_Light",
+    "CW_InstanceProps",
+    "CW_OT_LoadFromCustom",
+    "CW_OT_SaveToCustom",
+    "CW_MT_ExportChoice",
+    "TOPBAR_MT_file_import_bleeds",
+    "IMPORT_SCENE_OT_stories_lvz",
+    "EXPORT_SCENE_OT_stories_lvz_img",
+    "EXPORT_SCENE_OT_stories_mdl_ps2",
+)
+
+def load_gui():
+    # Importing the gui subpackage rebinds this module's "gui" attribute to
+    # the package, so always point it back at the gui.gui module afterwards.
+    global gui
+    from .gui import gui as gui_module
+    gui = gui_module
+    return gui
+
+
+# Each entry is (attribute name, bpy.props factory, keyword arguments).  The
+# factories are only called from register(), so Blender sees fresh property
+# definitions every time the add-on is enabled.
+_LVZ_IMG_PROGRESS_PROPERTIES = (
+    ("bleeds_lvz_img_progress", IntProperty, {
+        "name": "LVZ + IMG Import Progress",
+        "description": "Current LVZ + IMG import completion percentage",
+        "default": 0,
+        "min": 0,
+        "max": 100,
+        "subtype": "PERCENTAGE",
+    }),
+    ("bleeds_lvz_img_stage", StringProperty, {
+        "name": "LVZ + IMG Import Stage",
+        "description": "Current LVZ + IMG import stage",
+        "default": "",
+    }),
+    ("bleeds_lvz_img_status", StringProperty, {
+        "name": "Leeds Stories Map Import Status",
+        "description": "Detailed live status for the active Leeds Stories map import",
+        "default": "",
+    }),
+)
+
+_BLEEDS_MDL_OBJECT_PROPERTIES = (
+    ("bleeds_entity_type", EnumProperty, {
+        "name": "Leeds Type",
+        "description": "BLeeds Leeds-engine asset classification",
+        "items": [
+            ("UNKNOWN", "Unknown", "Not classified by BLeeds"),
+            ("SIMPLE_MODEL", "SimpleModel", "Leeds prop or simple model"),
+            ("PED_MODEL", "PedModel", "Leeds pedestrian or skinned actor model"),
+            ("CUTSCENE_MODEL", "CutsceneModel", "Leeds cutscene actor model"),
+            ("VEHICLE_MODEL", "VehModel", "Leeds vehicle model"),
+            ("OBJECT", "World Object", "Placed Leeds world or map object"),
+            ("COLLISION", "Collision", "Leeds collision object"),
+            ("2DFX", "2DFX", "Leeds 2D effect helper"),
+        ],
+        "default": "UNKNOWN",
+    }),
+    ("bleeds_is_mdl_root", BoolProperty, {
+        "name": "BLeeds MDL Root",
+        "description": "Marks this object as the root of an imported BLeeds MDL",
+        "default": False,
+    }),
+    ("bleeds_mdl_platform", EnumProperty, {
+        "name": "Platform",
+        "description": "Leeds model platform for this MDL",
+        "items": [
+            ("PS2", "PS2", "PlayStation 2"),
+            ("PSP", "PSP", "PlayStation Portable"),
+            ("PC", "PC", "Windows PC"),
+        ],
+        "default": "PS2",
+    }),
+    ("bleeds_model_game", EnumProperty, {
+        "name": "3D Models",
+        "description": "Leeds 3D model family",
+        "items": [
+            ("LCS", "LCS", "Grand Theft Auto: Liberty City Stories"),
+            ("VCS", "VCS", "Grand Theft Auto: Vice City Stories"),
+            ("MH2", "MH2", "Manhunt 2"),
+        ],
+        "default": "VCS",
+    }),
+    ("bleeds_mdl_type", EnumProperty, {
+        "name": "MDL Type",
+        "description": "Leeds MDL model class",
+        "items": [
+            ("SIM", "SimpleModel", "Prop or simple model"),
+            ("PED", "PedModel", "Pedestrian or skinned actor model"),
+            ("CUT", "CutsceneModel", "Cutscene actor model"),
+            ("VEH", "VehModel", "Vehicle model"),
+        ],
+        "default": "SIM",
+    }),
+    ("bleeds_mdl_filepath", StringProperty, {
+        "name": "Source File",
+        "description": "Original MDL file path used for import",
+        "default": "",
+        "subtype": "FILE_PATH",
+    }),
+    ("bleeds_imported_export_mode", EnumProperty, {
+        "name": "Internal PED Rebuild",
+        "description": "Imported PEDs rebuild from live mesh data",
+        "items": [("REBUILD", "Rebuild", "Rebuild using calculated live data and ped_atomic_bind basis")],
+        "default": "REBUILD",
+    }),
+    ("bleeds_export_use_normals", BoolProperty, {
+        "name": "Export Normals",
+        "description": "Export normals into PS2 MDL DMA/VIF geometry streams",
+        "default": True,
+    }),
+    ("bleeds_export_gouraud_shading", BoolProperty, {
+        "name": "Gouraud Shading",
+        "description": "Use smooth per-vertex normals when exporting Leeds MDL geometry",
+        "default": True,
+    }),
+    ("bleeds_leeds_scale_base", FloatVectorProperty, {
+        "name": "Leeds Scale (Base)",
+        "description": "Base in-game scale stored by the MDL",
+        "size": 3,
+        "default": (1.0, 1.0, 1.0),
+        "subtype": "XYZ",
+    }),
+    ("bleeds_leeds_pos_base", FloatVectorProperty, {
+        "name": "Leeds Pos (Base)",
+        "description": "Base in-game position stored by the MDL",
+        "size": 3,
+        "default": (0.0, 0.0, 0.0),
+        "subtype": "TRANSLATION",
+    }),
+)
+
+
+def register_type_properties(owner, definitions):
+    for property_name, property_type, options in definitions:
+        if not hasattr(owner, property_name):
+            setattr(owner, property_name, property_type(**options))
+
+
+def unregister_type_properties(owner, definitions):
+    for property_name, _property_type, _options in definitions:
+        if hasattr(owner, property_name):
+            delattr(owner, property_name)
 
-def register_lvz_img_progress_properties():
-    if not hasattr(bpy.types.WindowManager, "bleeds_lvz_img_progress"):
-        bpy.types.WindowManager.bleeds_lvz_img_progress = IntProperty(
-            name="LVZ + IMG Import Progress",
-            description="Current LVZ + IMG import completion percentage",
-            default=0,
-            min=0,
-            max=100,
-            subtype="PERCENTAGE",
-        )
-    if not hasattr(bpy.types.WindowManager, "bleeds_lvz_img_stage"):
-        bpy.types.WindowManager.bleeds_lvz_img_stage = StringProperty(
-            name="LVZ + IMG Import Stage",
-            description="Current LVZ + IMG import stage",
-            default="",
-        )
-    if not hasattr(bpy.types.WindowManager, "bleeds_lvz_img_status"):
-        bpy.types.WindowManager.bleeds_lvz_img_status = StringProperty(
-            name="Leeds Stories Map Import Status",
-            description="Detailed live status for the active Leeds Stories map import",
-            default="",
-        )
 
+def register_lvz_img_progress_properties():
+    register_type_properties(bpy.types.WindowManager, _LVZ_IMG_PROGRESS_PROPERTIES)
 
 
 def unregister_lvz_img_progress_properties():
-    for property_name in (
-        "bleeds_lvz_img_progress", "bleeds_lvz_img_stage", "bleeds_lvz_img_status",
-    ):
-        if hasattr(bpy.types.WindowManager, property_name):
-            delattr(bpy.types.WindowManager, property_name)
+    unregister_type_properties(bpy.types.WindowManager, _LVZ_IMG_PROGRESS_PROPERTIES)
 
 
 def register_bleeds_mdl_object_props():
-    if not hasattr(bpy.types.Object, "bleeds_entity_type"):
-        bpy.types.Object.bleeds_entity_type = EnumProperty(
-            name="Leeds Type",
-            description="BLeeds Leeds-engine asset classification",
-            items=[
-                ("UNKNOWN", "Unknown", "Not classified by BLeeds"),
-                ("SIMPLE_MODEL", "SimpleModel", "Leeds prop or simple model"),
-                ("PED_MODEL", "PedModel", "Leeds pedestrian or skinned actor model"),
-                ("CUTSCENE_MODEL", "CutsceneModel", "Leeds cutscene actor model"),
-                ("VEHICLE_MODEL", "VehModel", "Leeds vehicle model"),
-                ("OBJECT", "World Object", "Placed Leeds world or map object"),
-                ("COLLISION", "Collision", "Leeds collision object"),
-                ("2DFX", "2DFX", "Leeds 2D effect helper"),
-            ],
-            default="UNKNOWN",
-        )
+    register_type_properties(bpy.types.Object, _BLEEDS_MDL_OBJECT_PROPERTIES)
 
-    if not hasattr(bpy.types.Object, "bleeds_is_mdl_root"):
-        bpy.types.Object.bleeds_is_mdl_root = BoolProperty(
-            name="BLeeds MDL Root",
-            description="Marks this object as the root of an imported BLeeds MDL",
-            default=False,
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_mdl_platform"):
-        bpy.types.Object.bleeds_mdl_platform = EnumProperty(
-            name="Platform",
-            description="Leeds model platform for this MDL",
-            items=[
-                ("PS2", "PS2", "PlayStation 2"),
-                ("PSP", "PSP", "PlayStation Portable"),
-                ("PC", "PC", "Windows PC"),
-            ],
-            default="PS2",
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_model_game"):
-        bpy.types.Object.bleeds_model_game = EnumProperty(
-            name="3D Models",
-            description="Leeds 3D model family",
-            items=[
-                ("LCS", "LCS", "Grand Theft Auto: Liberty City Stories"),
-                ("VCS", "VCS", "Grand Theft Auto: Vice City Stories"),
-                ("MH2", "MH2", "Manhunt 2"),
-            ],
-            default="VCS",
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_mdl_type"):
-        bpy.types.Object.bleeds_mdl_type = EnumProperty(
-            name="MDL Type",
-            description="Leeds MDL model class",
-            items=[
-                ("SIM", "SimpleModel", "Prop or simple model"),
-                ("PED", "PedModel", "Pedestrian or skinned actor model"),
-                ("CUT", "CutsceneModel", "Cutscene actor model"),
-                ("VEH", "VehModel", "Vehicle model"),
-            ],
-            default="SIM",
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_mdl_filepath"):
-        bpy.types.Object.bleeds_mdl_filepath = StringProperty(
-            name="Source File",
-            description="Original MDL file path used for import",
-            default="",
-            subtype="FILE_PATH",
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_imported_export_mode"):
-        bpy.types.Object.bleeds_imported_export_mode = EnumProperty(
-            name="Internal PED Rebuild",
-            description="Imported PEDs rebuild from live mesh data",
-            items=[("REBUILD", "Rebuild", "Rebuild using calculated live data and ped_atomic_bind basis")],
-            default="REBUILD",
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_export_use_normals"):
-        bpy.types.Object.bleeds_export_use_normals = BoolProperty(
-            name="Export Normals",
-            description="Export normals into PS2 MDL DMA/VIF geometry streams",
-            default=True,
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_export_gouraud_shading"):
-        bpy.types.Object.bleeds_export_gouraud_shading = BoolProperty(
-            name="Gouraud Shading",
-            description="Use smooth per-vertex normals when exporting Leeds MDL geometry",
-            default=True,
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_leeds_scale_base"):
-        bpy.types.Object.bleeds_leeds_scale_base = FloatVectorProperty(
-            name="Leeds Scale (Base)",
-            description="Base in-game scale stored by the MDL",
-            size=3,
-            default=(1.0, 1.0, 1.0),
-            subtype="XYZ",
-        )
-
-    if not hasattr(bpy.types.Object, "bleeds_leeds_pos_base"):
-        bpy.types.Object.bleeds_leeds_pos_base = FloatVectorProperty(
-            name="Leeds Pos (Base)",
-            description="Base in-game position stored by the MDL",
-            size=3,
-            default=(0.0, 0.0, 0.0),
-            subtype="TRANSLATION",
-        )
 
 def unregister_bleeds_mdl_object_props():
-    for prop_name in (
-        "bleeds_entity_type",
-        "bleeds_is_mdl_root",
-        "bleeds_mdl_platform",
-        "bleeds_model_game",
-        "bleeds_mdl_type",
-        "bleeds_mdl_filepath",
-        "bleeds_imported_export_mode",
-        "bleeds_export_use_normals",
-        "bleeds_export_gouraud_shading",
-        "bleeds_leeds_scale_base",
-        "bleeds_leeds_pos_base",
-    ):
-        if hasattr(bpy.types.Object, prop_name):
-            delattr(bpy.types.Object, prop_name)
+    unregister_type_properties(bpy.types.Object, _BLEEDS_MDL_OBJECT_PROPERTIES)
 
 def register():
+    load_gui()
     register_bleeds_mdl_object_props()
     register_lvz_img_progress_properties()
 
-    for cls in _classes:
-        register_class(cls)
+    for class_name in _class_names:
+        register_class(getattr(gui, class_name))
 
     bpy.types.Object.cw_instance = bpy.props.PointerProperty(
         type=gui.CW_InstanceProps
@@ -743,8 +736,8 @@ def unregister():
     if hasattr(bpy.types.Object, "cw_instance"):
         del bpy.types.Object.cw_instance
 
-    for cls in reversed(_classes):
-        unregister_class(cls)
+    for class_name in reversed(_class_names):
+        unregister_class(getattr(gui, class_name))
 
     unregister_bleeds_mdl_object_props()
     unregister_lvz_img_progress_properties()
@@ -147,6 +147,18 @@ commonBoneParentsVCS: Dict[str, str] = {
     "r_toe0": "r_foot",
 }
 
+# Parent links resolved to positions in the bone order, so hierarchy builders
+# can walk the order and index straight into the parent.  -1 marks the root.
+commonBoneIndexLCS: Dict[str, int] = {name: index for index, name in enumerate(commonBoneOrder)}
+commonBoneParentIdxLCS: Tuple[int, ...] = tuple(
+    commonBoneIndexLCS.get(commonBoneParentsLCS.get(name, ""), -1) for name in commonBoneOrder
+)
+
+commonBoneIndexVCS: Dict[str, int] = {name: index for index, name in enumerate(commonBoneOrderVCS)}
+commonBoneParentIdxVCS: Tuple[int, ...] = tuple(
+    commonBoneIndexVCS.get(commonBoneParentsVCS.get(name, ""), -1) for name in commonBoneOrderVCS
+)
+
 DIRECT_ID_PROPERTY_NAMES: Tuple[str, ...] = (
     "bleeds_anim_bone_id",
     "bleeds_mdl_anim_bone_id",
@@ -35,6 +35,11 @@ class IMPORT_SCENE_OT_stories_lvz(Operator, ImportHelper):
         description="Write a concise live import log beside the selected LVZ",
         default=True,
     )
+    cache_decompressed_lvz: BoolProperty(
+        name="Cache Decompressed LVZ",
+        description="Keep the inflated LVZ beside the source as .lvz.cache.npy so repeat imports skip decompression",
+        default=False,
+    )
 
     filter_glob: StringProperty(
         default="*.lvz;*.LVZ",
@@ -46,6 +51,7 @@ class IMPORT_SCENE_OT_stories_lvz(Operator, ImportHelper):
         layout = self.layout
         layout.prop(self, "write_debug_log")
         layout.prop(self, "debug_print")
+        layout.prop(self, "cache_decompressed_lvz")
 
     def execute(self, context):
         self._import_iterator = lvz_img_importer.iter_import_lvz_img_archive(
@@ -57,6 +63,7 @@ class IMPORT_SCENE_OT_stories_lvz(Operator, ImportHelper):
             write_debug_log=self.write_debug_log,
             game_dtz_path="",
             import_game_dtz_2dfx=True,
+            cache_decompressed_lvz=self.cache_decompressed_lvz,
         )
         self._timer = context.window_manager.event_timer_add(0.05, window=context.window)
         context.window_manager.modal_handler_add(self)
@@ -222,16 +229,25 @@ class EXPORT_SCENE_OT_stories_lvz_img(Operator, ExportHelper):
                     "blds_source_lvz_path"
                 )
             if source_for_platform:
+                img_bytes = b""
+                platform_reader = None
                 try:
                     raw = Path(source_for_platform).read_bytes()
                     decomp, _ = LVZ.safe_decompress(raw)
+                    del raw
                     img_path = self.source_img_path or LVZ.find_source_img_next_to_lvz(source_for_platform)
-                    img_bytes = LVZ.read_img_file_bytes(img_path) if img_path else b""
+                    img_bytes = LVZ.open_img_file(img_path) if img_path else b""
                     platform_reader = LVZ.read_img(img_bytes=img_bytes, lvz_bytes=decomp) if img_bytes else None
                     if platform_reader is not None:
                         auto_swizzle_ps2 = platform_reader.detect_platform_from_lvz_groups().upper() == "PS2"
                 except Exception:
                     auto_swizzle_ps2 = True
+                finally:
+                    # The export may rewrite this very IMG; Windows refuses
+                    # while a mapped view of it is still open.
+                    platform_reader = None
+                    LVZ.close_img_file(img_bytes)
+                    img_bytes = b""
             result = LVZ.write_lvz_img_scene_archive(
                 context=context,
                 source_lvz_path=self.source_lvz_path,
@@ -172,9 +172,8 @@ class IMPORT_OT_CW_wbl(bpy.types.Operator, ImportHelper):
 
                 local = RC.tri_strip_to_tris(vertex_count)
                 mslot = mat_bank.get_slot(tex_id)
-                for (ia, ib, ic) in local:
-                    wf.append((base+ia, base+ib, base+ic))
-                    wf_mats.append(mslot)
+                wf.extend((local + base).tolist())
+                wf_mats.extend([mslot] * len(local))
 
                 vert_offset += vertex_count
 
@@ -15,20 +15,33 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import traceback
 import os
+import concurrent.futures
+import mmap
 import struct
-import datetime
 import bpy
+import numpy as np
 
 from bpy_extras.io_utils import ImportHelper, ExportHelper
 from bpy.props import StringProperty, CollectionProperty, BoolProperty
 
-from ..leedsLib.worldblock import read_chinatown as RC
+from ..leedsLib.worldblock import (
+    read_chinatown as RC,
+    CW_INSTANCE_DTYPE,
+    CW_LIGHT_DTYPE,
+)
 from ..ops.worldblock_importer import worldblock_importer
 
+# Precompiled layouts for the sector walk and the MDL headers.
+_SECTOR_HEADER = struct.Struct("<BB5h")
+_MDL_COUNTS = struct.Struct("<bh")
+_MDL_FACTORS = struct.Struct("<2f")
+_MDL_PART = struct.Struct("<HHB")
+
 def _ensure_bytes(d):
-    if isinstance(d, (bytes, bytearray, memoryview)):
+    if isinstance(d, (bytes, mmap.mmap)):
+        return d
+    if isinstance(d, (bytearray, memoryview)):
         return bytes(d)
     if isinstance(d, str):
         with open(d, "rb") as fh:
@@ -47,6 +60,10 @@ class IMPORT_OT_CW_wbl(bpy.types.Operator, ImportHelper):
     def draw(self, context):
         self.layout.prop(self, "import_as_mdls")
 
+    def invoke(self, context, event):
+        self._from_ui = True
+        return ImportHelper.invoke(self, context, event)
+
     def execute(self, context):
 
         fps = []
@@ -57,128 +74,117 @@ class IMPORT_OT_CW_wbl(bpy.types.Operator, ImportHelper):
         else:
             fps.append(self.filepath)
 
-        for fp in fps:
-            result = self._import_one(fp, context)
-            if result != {'FINISHED'}:
-                return result
-
-        return {'FINISHED'}
+        self._pending = fps
+        self._materials = {}
+
+        # Scripted bpy.ops calls and background runs expect the objects to
+        # exist when the operator returns, and have no window for a timer.
+        if context.window is None or not getattr(self, "_from_ui", False):
+            self._executor = None
+            result = {'FINISHED'}
+            while self._pending and result == {'FINISHED'}:
+                self._start_one(self._pending.pop(0))
+                result = self._finish_one()
+            return result
+
+        # Files are decoded one at a time on a worker thread (mmap + numpy,
+        # no bpy); the timer-driven modal loop builds each result into the
+        # scene on the main thread, so the UI keeps redrawing meanwhile.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._start_one(self._pending.pop(0))
+        self._timer = context.window_manager.event_timer_add(0.05, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def _stop(self, context):
+        try:
+            if getattr(self, "_timer", None) is not None:
+                context.window_manager.event_timer_remove(self._timer)
+        except Exception:
+            pass
+        self._timer = None
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.cancel(context)
+            self.report({'WARNING'}, "Worldblock import cancelled")
+            return {'CANCELLED'}
 
-    def _import_one(self, filepath, context):
+        if event.type != 'TIMER' or not self._job[1].done():
+            return {'PASS_THROUGH'}
+
+        result = self._finish_one()
+        if result != {'FINISHED'} or not self._pending:
+            self._stop(context)
+            return result
+
+        self._start_one(self._pending.pop(0))
+        return {'PASS_THROUGH'}
+
+    def cancel(self, context):
+        if self._job is not None:
+            future = self._job[1]
+            # A job already running can't be cancelled; let the worker
+            # finish with its log before closing it.
+            if not future.cancel():
+                concurrent.futures.wait([future])
+            self._close_log(self._job[2])
+            self._job = None
+        self._pending = []
+        self._stop(context)
+
+    def _start_one(self, filepath):
         logf = None
         if RC.DEBUG_MODE:
-            logf = open(RC.get_debug_logfile(filepath), "w", encoding="utf-8")
+            logf = RC.DebugLog(RC.get_debug_logfile(filepath))
+            import datetime
             RC.dprint(f"==== DEBUG LOG START {datetime.datetime.now()} ====", logf)
-        try:
-
-            with open(filepath, "rb") as fh:
-                file_bytes = fh.read()
-            b = _ensure_bytes(file_bytes)
-
-            hdr = RC.read_leeds_cw_transform(b, 0x00, logf)
-            PX, PY, PZ = hdr.pos
-
-            cur = os.path.dirname(filepath)
-            base = os.path.basename(filepath)
-            stem, _ = os.path.splitext(base)
 
-            coll_name = f"worldblock{base}"
-            coll = bpy.data.collections.get(coll_name)
-            if not coll:
-                coll = bpy.data.collections.new(coll_name)
-                if coll.name not in {c.name for c in bpy.context.scene.collection.children}:
-                    bpy.context.scene.collection.children.link(coll)
+        base = os.path.basename(filepath)
+        coll_name = f"worldblock{base}"
+        coll = bpy.data.collections.get(coll_name)
+        if not coll:
+            coll = bpy.data.collections.new(coll_name)
+            if coll.name not in {c.name for c in bpy.context.scene.collection.children}:
+                bpy.context.scene.collection.children.link(coll)
 
-            mat_bank = RC.MaterialBank(cur, logf)
-
-            mesh_offsets = set()
-            lights = []
-
-            sector_ofs = 0x28
-            for sector_idx in range(4):
-                if sector_ofs + 12 > len(b):
-                    break
-
-                header_bytes = b[sector_ofs:sector_ofs + 12]
-                Bool1 = bool(header_bytes[0])
-                Bool2 = bool(header_bytes[1])
-                NumInstances = struct.unpack_from("<h", header_bytes, 2)[0]
-                NumShadows = struct.unpack_from("<h", header_bytes, 4)[0]
-                NumLevels = struct.unpack_from("<h", header_bytes, 6)[0]
-                NumLights = struct.unpack_from("<h", header_bytes, 8)[0]
-                NumTextures = struct.unpack_from("<h", header_bytes, 10)[0]
-
-                RC.dprint(
-                    f"[sector {sector_idx}] Bool1={Bool1} Bool2={Bool2} "
-                    f"Instances={NumInstances} Shadows={NumShadows} "
-                    f"Levels={NumLevels} Lights={NumLights} Textures={NumTextures}",
-                    logf,
-                )
-
-                level_block_size = NumLevels * 16
-                instances_block_size = NumInstances * 16
-                shadows_block_size = NumShadows * 20
-                lights_block_size = NumLights * 20
-                textures_block_size = NumTextures * 2
-
-                level_ofs = sector_ofs + 12
-                inst_base = level_ofs + level_block_size
-                shadow_base = inst_base + instances_block_size
-                light_base = shadow_base + shadows_block_size
-                tex_base = light_base + lights_block_size
-
-                for instance_idx in range(NumInstances):
-                    inst_off = inst_base + instance_idx * 16
-                    MeshOffset = struct.unpack_from("<I", b, inst_off + 8)[0]
-                    if MeshOffset != 0:
-                        mesh_offsets.add(MeshOffset)
-
-                for light_idx in range(NumLights):
-                    l_off = light_base + light_idx * 20
-
-                    X_raw = struct.unpack_from("<I", b, l_off + 0)[0]
-                    Y_raw = struct.unpack_from("<I", b, l_off + 4)[0]
-                    Z_raw = struct.unpack_from("<I", b, l_off + 8)[0]
-                    Size_raw = struct.unpack_from("<H", b, l_off + 12)[0]
-                    Id = struct.unpack_from("<B", b, l_off + 14)[0]
-                    R = struct.unpack_from("<B", b, l_off + 16)[0]
-                    G = struct.unpack_from("<B", b, l_off + 17)[0]
-                    Bc = struct.unpack_from("<B", b, l_off + 18)[0]
-
-                    X = X_raw / 4096.0
-                    Y = Y_raw / 4096.0
-                    Z = Z_raw / 4096.0
-                    Size = Size_raw / 4096.0
-
-                    lights.append(
-                        {
-                            "X": X,
-                            "Y": Y,
-                            "Z": Z,
-                            "Size": Size,
-                            "Id": Id,
-                            "RGB": (R, G, Bc),
-                        }
-                    )
+        if self._executor is not None:
+            future = self._executor.submit(self._decode, filepath, self.import_as_mdls, logf)
+        else:
+            future = concurrent.futures.Future()
+            try:
+                future.set_result(self._decode(filepath, self.import_as_mdls, logf))
+            except Exception as exc:
+                future.set_exception(exc)
+        self._job = (filepath, future, logf, coll)
+
+    @staticmethod
+    def _close_log(logf):
+        if logf:
+            RC.dprint("==== DEBUG LOG END ====", logf)
+            logf.close()
+
+    def _finish_one(self):
+        filepath, future, logf, coll = self._job
+        self._job = None
+        try:
+            lights, meshes = future.result()
 
-                sector_size = (
-                    12
-                    + level_block_size
-                    + instances_block_size
-                    + shadows_block_size
-                    + lights_block_size
-                    + textures_block_size
-                )
-                sector_ofs += sector_size
+            stem, _ = os.path.splitext(os.path.basename(filepath))
+            mat_bank = RC.MaterialBank(os.path.dirname(filepath), logf, self._materials)
 
+            # Bound once: each bpy.data.* hop is an RNA lookup per light.
+            new_light = bpy.data.lights.new
+            new_object = bpy.data.objects.new
+            link_light = coll.objects.link
             for light_index, light in enumerate(lights):
-                light_data = bpy.data.lights.new(
-                    name=f"CW_Light_{light_index}", type="POINT"
-                )
-                light_object = bpy.data.objects.new(
-                    name=f"CW_Light_{light_index}", object_data=light_data
-                )
-                coll.objects.link(light_object)
+                light_name = f"CW_Light_{light_index}"
+                light_data = new_light(name=light_name, type="POINT")
+                light_object = new_object(name=light_name, object_data=light_data)
+                link_light(light_object)
                 light_object.location = (
                     light["X"],
                     light["Y"],
@@ -190,25 +196,13 @@ class IMPORT_OT_CW_wbl(bpy.types.Operator, ImportHelper):
                 light_data.shadow_soft_size = light["Size"]
                 light_object["CW_LightID"] = light["Id"]
 
-            if not mesh_offsets:
-                RC.dprint("no mesh offsets found in worldblock", logf)
-
             if not self.import_as_mdls:
-                self._build_merged(
-                    b,
-                    sorted(mesh_offsets),
-                    (PX, PY, PZ),
-                    stem,
-                    mat_bank,
-                    coll,
-                    logf,
-                )
+                self._build_merged(meshes, stem, mat_bank, coll, logf)
             else:
-                for mo in sorted(mesh_offsets):
-                    worldblock_importer.build_wbl(
-                        file_bytes=b,
+                for mo, decoded in meshes:
+                    worldblock_importer.build_wbl_mesh(
+                        decoded,
                         mesh_offset=mo,
-                        pos_xyz=(PX, PY, PZ),
                         material_bank=mat_bank,
                         collection=coll,
                         wbl_stem=stem,
@@ -216,6 +210,7 @@ class IMPORT_OT_CW_wbl(bpy.types.Operator, ImportHelper):
                     )
 
         except Exception as e:
+            import traceback
             tb_str = traceback.format_exc()
             if logf:
                 logf.write("IMPORT ERROR\n")
@@ -225,77 +220,160 @@ class IMPORT_OT_CW_wbl(bpy.types.Operator, ImportHelper):
             print(tb_str)
             return {'CANCELLED'}
         finally:
-            if logf:
-                RC.dprint("==== DEBUG LOG END ====", logf)
-                logf.close()
+            self._close_log(logf)
         return {'FINISHED'}
 
-    def _build_merged(self, b, mesh_offsets, pos, stem, mat_bank, coll, logf=None):
+    @staticmethod
+    def _decode(filepath, import_as_mdls, logf=None):
+        # Worker-thread half of the import: must not touch bpy.
+        b = RC.open_mapped(filepath)
+        try:
+            hdr = RC.read_leeds_cw_transform(b, 0x00, logf)
+            pos = np.array(hdr.pos, dtype=np.float64)
+
+            mesh_offsets = set()
+            lights = []
+
+            sector_ofs = 0x28
+            for sector_idx in range(4):
+                if sector_ofs + 12 > len(b):
+                    break
+
+                (
+                    Bool1, Bool2,
+                    NumInstances, NumShadows, NumLevels, NumLights, NumTextures,
+                ) = _SECTOR_HEADER.unpack_from(b, sector_ofs)
+                Bool1 = bool(Bool1)
+                Bool2 = bool(Bool2)
+
+                if RC.DEBUG_MODE:
+                    RC.dprint(
+                        f"[sector {sector_idx}] Bool1={Bool1} Bool2={Bool2} "
+                        f"Instances={NumInstances} Shadows={NumShadows} "
+                        f"Levels={NumLevels} Lights={NumLights} Textures={NumTextures}",
+                        logf,
+                    )
+
+                # Every record array in a sector follows the previous one, so
+                # all section bounds are known as soon as the header is read.
+                level_base = sector_ofs + 12
+                inst_base = level_base + 16 * max(0, NumLevels)
+                shadow_base = inst_base + 16 * max(0, NumInstances)
+                light_base = shadow_base + 20 * max(0, NumShadows)
+                tex_base = light_base + 20 * max(0, NumLights)
+                next_sector_ofs = tex_base + 2 * max(0, NumTextures)
+
+                inst_mesh = np.frombuffer(
+                    b, dtype=CW_INSTANCE_DTYPE, count=max(0, NumInstances), offset=inst_base
+                )["MeshOffset"]
+                mesh_offsets.update(inst_mesh[inst_mesh != 0].tolist())
+
+                light_table = np.frombuffer(
+                    b, dtype=CW_LIGHT_DTYPE, count=max(0, NumLights), offset=light_base
+                )
+                light_rows = zip(
+                    (light_table["pos"] / 4096.0).tolist(),
+                    (light_table["Size"] / 4096.0).tolist(),
+                    light_table["Id"].tolist(),
+                    light_table["rgb"].tolist(),
+                )
+                for (X, Y, Z), Size, Id, (R, G, Bc) in light_rows:
+                    lights.append(
+                        {
+                            "X": X,
+                            "Y": Y,
+                            "Z": Z,
+                            "Size": Size,
+                            "Id": Id,
+                            "RGB": (R, G, Bc),
+                        }
+                    )
+
+                sector_ofs = next_sector_ofs
+
+            if not mesh_offsets:
+                RC.dprint("no mesh offsets found in worldblock", logf)
+
+            if not import_as_mdls:
+                return lights, IMPORT_OT_CW_wbl._decode_merged(b, sorted(mesh_offsets), pos)
+            return lights, [
+                (mo, worldblock_importer.decode_wbl(b, mo, pos))
+                for mo in sorted(mesh_offsets)
+            ]
+        finally:
+            RC.close_mapped(b)
+
+    @staticmethod
+    def _decode_merged(b, mesh_offsets, pos):
         b = _ensure_bytes(b)
-        PX, PY, PZ = pos
-        wv, wuv, wf = [], [], []
-        wf_mats = []
-        for MeshOffset in mesh_offsets:
-            numMaterials = struct.unpack_from('<b', b, MeshOffset + 5)[0]
-            numVertices  = struct.unpack_from('<h', b, MeshOffset + 6)[0]
-            translationFactor = struct.unpack_from('<f', b, MeshOffset + 40)[0]
-            scaleFactor  = struct.unpack_from('<f', b, MeshOffset + 44)[0]
+        headers = [_MDL_COUNTS.unpack_from(b, mo + 5) for mo in mesh_offsets]
+        # Every mesh decodes into its slice of one merged buffer; a tail its
+        # parts don't cover is overwritten by the next mesh.
+        capacity = sum(max(0, nv) for _, nv in headers)
+        wv = np.empty((capacity, 3), dtype=np.float64)
+        wuv = np.empty((capacity, 2), dtype=np.float64)
+        wf = []
+        parts = []
+        base = 0
+        for MeshOffset, (numMaterials, numVertices) in zip(mesh_offsets, headers):
+            translationFactor, scaleFactor = _MDL_FACTORS.unpack_from(b, MeshOffset + 40)
 
             stride      = 16
             vertex_base = MeshOffset + 48
 
-            all_verts, all_uvs = [], []
-            for vi in range(numVertices):
-                off = vertex_base + vi*stride
-                x_raw = struct.unpack_from('<h', b, off+0)[0]
-                y_raw = struct.unpack_from('<h', b, off+2)[0]
-                z_raw = struct.unpack_from('<h', b, off+4)[0]
-                u_raw = struct.unpack_from('<h', b, off+12)[0]
-                v_raw = struct.unpack_from('<h', b, off+14)[0]
-                all_verts.append((x_raw/scaleFactor + PX, y_raw/scaleFactor + PY, z_raw/scaleFactor + PZ))
-                all_uvs.append(((u_raw/2048.0) + translationFactor*2, 1.0 - (v_raw/2048.0)))
+            mesh_end = base + max(0, numVertices)
+            positions, uvs = RC.decode_vertices(
+                b, vertex_base, numVertices, scaleFactor, pos, translationFactor,
+                out=(wv[base:mesh_end], wuv[base:mesh_end]),
+            )
 
             vert_offset = 0
             mtab = vertex_base + numVertices*stride
             for mi in range(numMaterials):
-                m_off        = mtab + mi*12
-                tex_id       = struct.unpack_from('<H', b, m_off+0)[0]
-                vertex_count = struct.unpack_from('<H', b, m_off+2)[0]
-                render_flags = struct.unpack_from('<B', b, m_off+4)[0]
+                tex_id, vertex_count, render_flags = _MDL_PART.unpack_from(b, mtab + mi*12)
 
                 uv_mul = -2.0 if render_flags == 4 else 1.0
 
-                base = len(wv)
-                for i in range(vertex_count):
-                    idx = vert_offset + i
-                    wv.append(all_verts[idx])
-                    u_norm, v_norm = all_uvs[idx]
-                    u_final = u_norm + translationFactor * uv_mul
-                    wuv.append((u_final, v_norm))
+                end = vert_offset + vertex_count
+                # Parts share the mesh's slice of the merged buffer; one
+                # running past numVertices would index the next mesh.
+                if end > numVertices:
+                    raise ValueError(
+                        f"MDL at 0x{MeshOffset:X}: part {mi} needs vertices "
+                        f"{vert_offset}-{end - 1}, mesh has {numVertices}"
+                    )
+                part_uvs = uvs[vert_offset:end]
+                part_uvs[:, 0] += translationFactor * uv_mul
+
+                local = RC.tri_strip_to_tris(len(part_uvs))
+                wf.append(local + base)
+                parts.append((tex_id, len(local)))
 
-                local = RC.tri_strip_to_tris(vertex_count)
-                mslot = mat_bank.get_slot(tex_id)
-                for (ia, ib, ic) in local:
-                    wf.append((base+ia, base+ib, base+ic))
-                    wf_mats.append(mslot)
+                base += len(part_uvs)
+                vert_offset = end
 
-                vert_offset += vertex_count
+        faces = np.concatenate(wf) if wf else np.empty((0, 3), dtype=np.int32)
+        if not (len(faces) and base):
+            return None, None, faces, parts
+        return wv[:base], wuv[:base], faces, parts
+
+    def _build_merged(self, merged, stem, mat_bank, coll, logf=None):
+        verts, uvs, faces, parts = merged
+        wf_mats = []
+        for tex_id, face_count in parts:
+            wf_mats.extend([mat_bank.get_slot(tex_id)] * face_count)
 
-        if not (wf and wv):
+        if verts is None:
             RC.dprint("nothing to create", logf)
             return
 
         name = f"CW_Worldblock{stem}"
         mesh = bpy.data.meshes.new(name)
-        mesh.from_pydata(wv, [], wf)
-        mesh.update()
+        RC.fill_tri_mesh(mesh, verts, faces)
 
         uv_layer = mesh.uv_layers.new(name="UVMap")
-        for pi, poly in enumerate(mesh.polygons):
-            poly.material_index = wf_mats[pi]
-            for li in poly.loop_indices:
-                v_idx = mesh.loops[li].vertex_index
-                uv_layer.data[li].uv = wuv[v_idx]
+        uv_layer.data.foreach_set("uv", uvs.astype(np.float32)[faces.ravel()].ravel())
+        mesh.polygons.foreach_set("material_index", np.asarray(wf_mats, dtype=np.int32))
 
         mat_bank.append_all_to_mesh(mesh)
         obj = bpy.data.objects.new(mesh.name, mesh)
@@ -602,36 +602,44 @@ def find_best_companion_txd(
 def triangle_strip_faces(
     block: BSPGeometryBlock,
     epsilon: float = 1.0e-30,
-) -> Tuple[List[Tuple[int, int, int]], List[int]]:
-    faces: List[Tuple[int, int, int]] = []
-    material_indices: List[int] = []
-    positions = [vertex.position for vertex in block.vertices]
-    for strip in block.strips:
-        start = strip.vertex_start
-        end = start + strip.vertex_count
-        for local_index in range(2, strip.vertex_count):
-            a = start + local_index - 2
-            b = start + local_index - 1
-            c = start + local_index
-            if local_index & 1:
-                a, b = b, a
-            if a < start or c >= end:
-                continue
-            pa = positions[a]
-            pb = positions[b]
-            pc = positions[c]
-            if pa == pb or pb == pc or pa == pc:
-                continue
-            ab = (pb[0] - pa[0], pb[1] - pa[1], pb[2] - pa[2])
-            ac = (pc[0] - pa[0], pc[1] - pa[1], pc[2] - pa[2])
-            cross = (
-                ab[1] * ac[2] - ab[2] * ac[1],
-                ab[2] * ac[0] - ab[0] * ac[2],
-                ab[0] * ac[1] - ab[1] * ac[0],
-            )
-            area_squared = cross[0] * cross[0] + cross[1] * cross[1] + cross[2] * cross[2]
-            if area_squared <= epsilon:
-                continue
-            faces.append((a, b, c))
-            material_indices.append(int(strip.material_index))
-    return faces, material_indices
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Every strip is unrolled at once: one row per candidate triangle, in
+    # strip order, with odd triangles swapping their first two corners.
+    strips = block.strips
+    tri_counts = np.maximum(
+        np.array([strip.vertex_count for strip in strips], dtype=np.int64) - 2, 0
+    )
+    total = int(tri_counts.sum())
+    if not total:
+        return np.empty((0, 3), dtype=np.int64), np.empty(0, dtype=np.int64)
+    strip_of_tri = np.repeat(np.arange(len(strips)), tri_counts)
+    local = np.arange(total) - np.repeat(np.cumsum(tri_counts) - tri_counts, tri_counts) + 2
+    starts = np.array([strip.vertex_start for strip in strips], dtype=np.int64)
+    c = starts[strip_of_tri] + local
+    odd = (local & 1).astype(bool)
+    a = np.where(odd, c - 1, c - 2)
+    b = np.where(odd, c - 2, c - 1)
+
+    # Drop triangles with coincident corners or (near) zero area.
+    positions = np.array(
+        [vertex.position for vertex in block.vertices], dtype=np.float64
+    ).reshape(-1, 3)
+    pa = positions[a]
+    pb = positions[b]
+    pc = positions[c]
+    ab = pb - pa
+    ac = pc - pa
+    cross_x = ab[:, 1] * ac[:, 2] - ab[:, 2] * ac[:, 1]
+    cross_y = ab[:, 2] * ac[:, 0] - ab[:, 0] * ac[:, 2]
+    cross_z = ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]
+    area_squared = cross_x * cross_x + cross_y * cross_y + cross_z * cross_z
+    keep = (
+        ~(pa == pb).all(axis=1)
+        & ~(pb == pc).all(axis=1)
+        & ~(pa == pc).all(axis=1)
+        & (area_squared > epsilon)
+    )
+
+    materials = np.array([int(strip.material_index) for strip in strips], dtype=np.int64)
+    faces = np.stack((a, b, c), axis=1)[keep]
+    return faces, materials[strip_of_tri][keep]
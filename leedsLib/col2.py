@@ -18,6 +18,8 @@
 import struct
 from pathlib import Path
 
+import numpy as np
+
 #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #
 #   This script is for .COL2 - the file format for GTA Stories collisions           #
 #   NOTE: Leeds Engine Collision 2 differs from Rockstars Renderware Col2 format    #
@@ -32,6 +34,8 @@ HEADER_SIZE = 0x20
 COLMODEL_HEADER_SIZE = 0x60
 COLBOX_SIZE = 0x30
 COL2_SIGNATURE = b"2loc"
+COL2_VERTEX = struct.Struct("<hhh")
+COL2_TRIANGLE = struct.Struct("<hhhBB")
 
 def align_value(value: int, alignment: int = 0x10) -> int:
     if alignment <= 0:
@@ -422,6 +426,13 @@ def encode_compressed_vector(value):
         return max(-32768, min(32767, iv))
     return clamp_i16(x), clamp_i16(y), clamp_i16(z)
 
+def encode_compressed_vectors(values) -> np.ndarray:
+    points = np.array([[float(v) for v in value] for value in values], dtype=np.float64).reshape(-1, 3)
+    scaled = np.rint(points * 128.0)
+    if not np.isfinite(scaled).all():
+        raise ValueError("Cannot encode a non-finite COL2 vertex.")
+    return np.clip(scaled, -32768, 32767).astype("<i2")
+
 def pack_colbox(aabb_min, aabb_max, trailer: bytes = None) -> bytes:
     aabb_min, aabb_max = clean_aabb(aabb_min, aabb_max)
     if trailer is None:
@@ -520,28 +531,30 @@ def write_col2_archive(path: str, models, pad_to_sector: bool = True) -> dict:
         if model["vertices"]:
             pad_bytes(data, 0x02)
             verts_off = len(data)
-            for vertex in model["vertices"]:
-                data.extend(struct.pack("<hhh", *encode_compressed_vector(vertex)))
+            # Whole vertex and triangle arrays are encoded in numpy and land in
+            # the archive as a single tobytes() block each.
+            data.extend(encode_compressed_vectors(model["vertices"]).tobytes())
 
         tris_off = 0
         if model["faces"]:
             pad_bytes(data, 0x02)
             tris_off = len(data)
-            for a, b, c in model["faces"]:
-                for index in (a, b, c):
-                    if int(index) < 0 or int(index) >= len(model["vertices"]):
-                        raise ValueError(
-                            f"Model {model['name']} has triangle index {index} outside "
-                            f"0..{len(model['vertices']) - 1}."
-                        )
-                a_raw = int(a) * 6
-                b_raw = int(b) * 6
-                c_raw = int(c) * 6
-                if max(a_raw, b_raw, c_raw) > 32767:
-                    raise ValueError(
-                        f"Model {model['name']} has too many vertices for COL2 int16 triangle offsets."
-                    )
-                data.extend(struct.pack("<hhhBB", a_raw, b_raw, c_raw, 0, 0))
+            faces = np.array([[int(index) for index in face] for face in model["faces"]], dtype=np.int64)
+            out_of_range = np.flatnonzero((faces < 0) | (faces >= len(model["vertices"])))
+            if len(out_of_range):
+                raise ValueError(
+                    f"Model {model['name']} has triangle index {faces.flat[out_of_range[0]]} outside "
+                    f"0..{len(model['vertices']) - 1}."
+                )
+            if int(faces.max()) * COL2_VERTEX.size > 32767:
+                raise ValueError(
+                    f"Model {model['name']} has too many vertices for COL2 int16 triangle offsets."
+                )
+            # Corners are byte offsets into the vertex array; the two trailing
+            # surface bytes stay zero.
+            triangles = np.zeros((len(faces), COL2_TRIANGLE.size // 2), dtype="<i2")
+            triangles[:, :3] = faces * COL2_VERTEX.size
+            data.extend(triangles.tobytes())
 
         model_records.append({
             "resource_id": model["resource_id"],
@@ -595,8 +608,7 @@ def write_col2_archive(path: str, models, pad_to_sector: bool = True) -> dict:
     pad_bytes(data, 0x04)
     reloc_off = len(data)
     relocation_offsets = sorted(set(relocation_offsets))
-    for off in relocation_offsets:
-        data.extend(struct.pack("<I", off))
+    data.extend(struct.pack(f"<{len(relocation_offsets)}I", *relocation_offsets))
 
     logical_size = len(data)
     struct.pack_into(
@@ -17,6 +17,8 @@
 
 import struct
 import os
+import sys
+import mmap
 import zlib
 import time
 import math
@@ -66,6 +68,10 @@ from mathutils import Matrix
 # notes, and implementation-only fallback names stay out of user logs.
 CONCISE_IMPORT_LOG = True
 
+# Debug-print lines are collected and written to the console in blocks; one
+# print() per parser line stalls the import on the Windows console.
+DEBUG_CONSOLE_FLUSH_LINES = 256
+
 
 def _concise_import_log_message(message):
     text = str(message)
@@ -290,6 +296,7 @@ class DebugOut:
         self.write_file = write_file
         self.file_path = file_path
         self._buf: List[str] = []
+        self._console_buf: List[str] = []
         self._line_count = 0
         self._fh = None
         self._concise_seen = set()
@@ -317,7 +324,9 @@ class DebugOut:
                     continue
                 tried.add(key)
                 path.parent.mkdir(parents=True, exist_ok=True)
-                self._fh = path.open("w", encoding="utf-8", buffering=1)
+                # Block-buffered: lines reach disk at the importer's flush()
+                # checkpoints and on close, not one write syscall per line.
+                self._fh = path.open("w", encoding="utf-8")
                 self.file_path = str(path)
                 return
             except Exception as e:
@@ -331,7 +340,9 @@ class DebugOut:
         # previous implementation condensed the message before printing, which
         # made the file-browser "Debug print" choice appear to do nothing.
         if self.enable_console:
-            print(raw_msg)
+            self._console_buf.append(raw_msg)
+            if len(self._console_buf) >= DEBUG_CONSOLE_FLUSH_LINES:
+                self.flush_console()
 
         msg = _concise_import_log_message(raw_msg)
         if msg is None:
@@ -357,7 +368,6 @@ class DebugOut:
             if self._fh is not None:
                 try:
                     self._fh.write(str(msg) + "\n")
-                    self._fh.flush()
                 except Exception as e:
                     print(f"[log] live write failed '{self.file_path}': {e}")
                     try:
@@ -369,7 +379,19 @@ class DebugOut:
             else:
                 self._buf.append(msg)
 
+    def flush_console(self):
+        if not self._console_buf:
+            return
+        text = "\n".join(self._console_buf) + "\n"
+        self._console_buf.clear()
+        try:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        except Exception:
+            pass
+
     def flush(self):
+        self.flush_console()
         if not self.write_file or not self.file_path:
             return
         try:
@@ -414,6 +436,26 @@ LVZ_UNPACK_ALIGN_LOG_LIMIT = 120
 LVZ_UNPACK_NEXT_SELF_LOOP_LOG_LIMIT = 80
 LVZ_OVERLAY_RESOURCE_BOUND_LOG_LIMIT = 120
 LVZ_MIN_RESOURCE_CANDIDATE_ADDR = 0x40
+# Master group table: (header addr, type/start) u32 pairs right after the
+# 0x24-byte DLRW master header, terminated by the first implausible row.
+LVZ_GROUP_TABLE_START = 0x24
+LVZ_GROUP_TABLE_STRIDE = 8
+LVZ_GROUP_TABLE_SCAN_ROWS = 0x60
+
+LVZ_MASTER_HEADER_DTYPE = np.dtype({
+    "names": ["type", "g0", "g1", "g1_dup", "count_like", "res_table_addr"],
+    "formats": ["<u4"] * 6,
+    "offsets": [0x04, 0x08, 0x0C, 0x10, 0x14, 0x20],
+    "itemsize": 0x24,
+})
+LVZ_GLOBAL32_PREFACE_DTYPE = np.dtype({
+    "names": ["tag", "type", "total", "g0", "g1", "gcnt", "cont"],
+    "formats": ["<u4"] * 7,
+    "offsets": [0x00, 0x04, 0x08, 0x0C, 0x10, 0x14, 0x18],
+    "itemsize": 0x20,
+})
+LVZ_WRLD_TAG = int.from_bytes(b"DLRW", "little")
+LVZ_TEX_TAG = int.from_bytes(b"xet\0", "little")
 
 IMG_PASS_NAMES_VCS = (
     "SUPERLOD",
@@ -448,12 +490,19 @@ IMG_MODEL_PASS_NAMES_DEFAULT = set(IMG_VISIBLE_PASS_NAMES_DEFAULT)
 IMG_NON_MODEL_PASS_NAMES = set()
 IMG_LOD_PASS_NAMES = {"SUPERLOD", "LOD"}
 
+# Scalar probes run thousands of times per LVZ scan. A precompiled Struct's
+# unpack_from measured faster than both the format-string call and
+# int.from_bytes over a slice.
+_U32 = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+_I16 = struct.Struct("<h")
+
 def read_u32(b: bytes, o: int) -> int:
-    return struct.unpack_from("<I", b, o)[0]
+    return _U32.unpack_from(b, o)[0]
 def read_u16(b: bytes, o: int) -> int:
-    return struct.unpack_from("<H", b, o)[0]
+    return _U16.unpack_from(b, o)[0]
 def read_i16(b: bytes, o: int) -> int:
-    return struct.unpack_from("<h", b, o)[0]
+    return _I16.unpack_from(b, o)[0]
 
 def align_up4(o: int) -> int:
     return (o + 3) & ~3
@@ -499,6 +548,62 @@ def safe_decompress(data: bytes) -> Tuple[bytes, bool]:
             continue
     return data, False
 
+def lvz_decompressed_cache_path(lvz_path: str) -> str:
+    return str(lvz_path) + ".cache.npy"
+
+def _read_npy_u8_bytes(path: Path) -> bytes:
+    # The cache is a flat uint8 .npy; reading the payload after its header
+    # gives the bytes in one read, with no array or mapping in between.
+    with open(path, "rb") as fh:
+        major, _minor = np.lib.format.read_magic(fh)
+        if major == 1:
+            shape, _, dtype = np.lib.format.read_array_header_1_0(fh)
+        elif major == 2:
+            shape, _, dtype = np.lib.format.read_array_header_2_0(fh)
+        else:
+            raise ValueError(f"unsupported .npy version {major}")
+        if dtype != np.uint8 or len(shape) != 1:
+            raise ValueError(f"unexpected cache layout {dtype} {shape}")
+        data = fh.read()
+    if len(data) != shape[0]:
+        raise ValueError(f"truncated cache: {len(data)} of {shape[0]} bytes")
+    return data
+
+def read_lvz_file(lvz_path: str, use_cache: bool = False) -> Tuple[bytes, bool, int]:
+    source = Path(lvz_path)
+    cache = Path(lvz_decompressed_cache_path(lvz_path))
+    if use_cache:
+        try:
+            source_stat = source.stat()
+            if cache.exists() and cache.stat().st_mtime >= source_stat.st_mtime:
+                decomp = _read_npy_u8_bytes(cache)
+                dbg(f"[io] LVZ decompressed cache hit: {cache}")
+                return decomp, True, int(source_stat.st_size)
+        except Exception as e:
+            dbg(f"[io] LVZ decompressed cache unreadable, inflating source: {e}")
+
+    raw = source.read_bytes()
+    raw_size = len(raw)
+    decomp, was_cmp = safe_decompress(raw)
+    del raw
+    if use_cache and was_cmp:
+        try:
+            np.save(str(cache), np.frombuffer(decomp, dtype=np.uint8))
+            dbg(f"[io] LVZ decompressed cache written: {cache}")
+        except Exception as e:
+            dbg(f"[io] LVZ decompressed cache write failed: {e}")
+    return decomp, was_cmp, raw_size
+
+def gather_global32_prefaces(data: bytes, addrs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    addrs = np.asarray(addrs, dtype=np.int64)
+    prefaces = np.zeros(len(addrs), dtype=LVZ_GLOBAL32_PREFACE_DTYPE)
+    in_bounds = (addrs >= 0) & (addrs + 32 <= len(data))
+    if in_bounds.any():
+        raw = np.frombuffer(data, dtype=np.uint8)
+        blocks = raw[addrs[in_bounds, None] + np.arange(32)]
+        prefaces[in_bounds] = blocks.view(LVZ_GLOBAL32_PREFACE_DTYPE).reshape(-1)
+    return prefaces, in_bounds
+
 def hexdump_bytes(b: bytes, max_len: int = 32) -> str:
     n = min(len(b), max_len)
     return " ".join(f"{x:02X}" for x in b[:n])
@@ -675,6 +780,57 @@ def read_img_file_bytes(path: str) -> bytes:
             return zf.read(chosen)
     return p.read_bytes()
 
+def map_img_file(path: str):
+    # Read-only mapping: parsers slice and struct-unpack it like bytes, so only
+    # the pages the import actually touches get loaded.
+    with open(path, "rb") as img_file:
+        if os.fstat(img_file.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+def open_img_file(path: str):
+    # Zipped IMGs still have to be inflated whole; plain ones are mapped.
+    if Path(path).suffix.lower() == ".zip":
+        return read_img_file_bytes(path)
+    return map_img_file(path)
+
+def close_img_file(data) -> None:
+    # Unmap explicitly so the IMG isn't left locked (Windows) until the GC
+    # gets to it. A view still held by a propagating traceback keeps the map
+    # exported; that one is left for the garbage collector to unmap.
+    if isinstance(data, mmap.mmap):
+        try:
+            data.close()
+        except BufferError:
+            pass
+
+def prefetch_mapped_ranges(buf, starts, ends) -> int:
+    # Hint the kernel to page in every span up front so it can read them
+    # together instead of one demand fault at a time; merged spans share a call.
+    advise = getattr(buf, "madvise", None)
+    willneed = getattr(mmap, "MADV_WILLNEED", None)
+    if advise is None or willneed is None:
+        return 0
+    size = len(buf)
+    page_mask = mmap.PAGESIZE - 1
+    spans = sorted(
+        (max(0, int(start)) & ~page_mask, min(int(end), size))
+        for start, end in zip(starts, ends)
+        if min(int(end), size) > max(0, int(start))
+    )
+    merged: List[List[int]] = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1] + mmap.PAGESIZE:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    for start, end in merged:
+        try:
+            advise(willneed, start, end - start)
+        except (OSError, ValueError):
+            return 0
+    return len(merged)
+
 def is_ver2_img_archive(img_bytes: bytes) -> bool:
     return len(img_bytes) >= 8 and img_bytes[:4] == b"VER2"
 
@@ -1399,55 +1555,48 @@ class read_lvz:
         self.master_group_table_end: int = 0
         self.master_first_group_addr: int = 0
         self.master_game_hint: str = "unknown"
+        self._master_header: Optional[LVZMaster] = None
 
     def parse_master_header(self) -> LVZMaster:
+        if self._master_header is not None:
+            return self._master_header
         lvz = self.decomp
         if len(lvz) < 0x24:
             raise ValueError("LVZ smaller than 0x24")
-        magic = lvz[0:4]
-        _type = read_u32(lvz, 0x04)
-        g0 = read_u32(lvz, 0x08)
-        g1 = read_u32(lvz, 0x0C)
-        g1d = read_u32(lvz, 0x10)
-        cnt = read_u32(lvz, 0x14)
-        rtab = read_u32(lvz, 0x20)
-        return LVZMaster(magic, _type, g0, g1, g1d, cnt, rtab)
-
-    def _peek_global32(self, addr: int):
+        magic = bytes(lvz[0:4])
+        hdr = np.frombuffer(lvz, dtype=LVZ_MASTER_HEADER_DTYPE, count=1)[0]
+        self._master_header = LVZMaster(
+            magic,
+            int(hdr["type"]),
+            int(hdr["g0"]),
+            int(hdr["g1"]),
+            int(hdr["g1_dup"]),
+            int(hdr["count_like"]),
+            int(hdr["res_table_addr"]),
+        )
+        return self._master_header
+
+    def scan_group_table_rows(self, require_wrld_room: bool) -> np.ndarray:
+        # The group table has no stored length; it ends at the first row whose
+        # pointer fails the cheap checks, so test it a window at a time.
         lvz = self.decomp
         n = len(lvz)
-        if addr < 0 or addr + 32 > n:
-            return ("(oob)", {}, "out-of-bounds")
-        blk = lvz[addr:addr+32]
-        tag = blk[0:4]
-        info = {}
-        note = ""
-        try:
-            tag_str = tag.decode("ascii", errors="replace")
-        except Exception:
-            tag_str = tag.hex()
-        if tag == b"DLRW":
-            wrld_type = read_u32(blk, 0x04)
-            total = read_u32(blk, 0x08)
-            g0 = read_u32(blk, 0x0C)
-            g1 = read_u32(blk, 0x10)
-            gcnt = read_u32(blk, 0x14)
-            cont = read_u32(blk, 0x18)
-            info = {"wrld_type": wrld_type, "total": total, "g0": g0, "g1": g1, "gcnt": gcnt, "cont": cont}
-            note = "WRLD 32B preface"
-        elif tag == b"xet\x00":
-            _hdrsz = read_u32(blk, 0x04)
-            total = read_u32(blk, 0x08)
-            g0 = read_u32(blk, 0x0C)
-            g1 = read_u32(blk, 0x10)
-            gcnt = read_u32(blk, 0x14)
-            cont = read_u32(blk, 0x18)
-            info = {"total": total, "g0": g0, "g1": g1, "gcnt": gcnt, "cont": cont, "hdrsz": _hdrsz}
-            note = "TEX 32B preface"
-        else:
-            note = "Unknown 32B header"
-            info = {"first16_hex": hexdump_bytes(blk[:16], 16)}
-        return (tag_str, info, note)
+        row_count = max(0, (n - LVZ_GROUP_TABLE_START) // LVZ_GROUP_TABLE_STRIDE)
+        table = np.frombuffer(lvz, dtype="<u4", count=row_count * 2, offset=LVZ_GROUP_TABLE_START).reshape(-1, 2)
+        start = 0
+        while start < row_count:
+            rows = table[start:start + LVZ_GROUP_TABLE_SCAN_ROWS].astype(np.int64)
+            addrs = rows[:, 0]
+            plausible = (addrs > 0) & (addrs < n) & ((addrs & 0x3) == 0)
+            if require_wrld_room:
+                plausible &= addrs + 0x20 <= n
+            else:
+                plausible &= (rows[:, 1] & 0xFFFF) == 0
+            bad = np.flatnonzero(~plausible)
+            if bad.size:
+                return table[:start + int(bad[0])]
+            start += len(rows)
+        return table
 
     def score_resource_entry_stride(self, base: int, res_count: int, stride: int, table_limit: int) -> int:
         lvz = self.decomp
@@ -1545,33 +1694,35 @@ class read_lvz:
         master = self.parse_master_header()
 
         groups: List[SlaveGroup] = []
-        cursor = 0x24
-        idx = 0
+        cursor = LVZ_GROUP_TABLE_START
 
         if master.magic == b"DLRW":
-            while cursor + 8 <= n:
-                addr = read_u32(lvz, cursor + 0)
-                group_type = read_u32(lvz, cursor + 4)
-                if not (0 < addr < n and (addr & 0x3) == 0 and addr + 0x20 <= n):
-                    break
-                tag = lvz[addr:addr + 4]
-                if tag not in (b"DLRW", b"xet\0"):
-                    break
-                tag_str, info, note = self._peek_global32(addr)
-                total = int(info.get("total", 0))
-                gcnt = int(info.get("gcnt", 0))
-                cont = int(info.get("cont", 0))
+            rows = self.scan_group_table_rows(True)
+            prefaces, _in_bounds = gather_global32_prefaces(self.decomp, rows[:, 0])
+            known = (prefaces["tag"] == LVZ_WRLD_TAG) | (prefaces["tag"] == LVZ_TEX_TAG)
+            unknown = np.flatnonzero(~known)
+            if unknown.size:
+                rows = rows[:int(unknown[0])]
+                prefaces = prefaces[:int(unknown[0])]
+            columns = zip(
+                rows.tolist(),
+                prefaces["tag"].tolist(),
+                prefaces["total"].tolist(),
+                prefaces["gcnt"].tolist(),
+                prefaces["cont"].tolist(),
+            )
+            for idx, ((addr, group_type), tag, total, gcnt, cont) in enumerate(columns):
+                note = "WRLD 32B preface" if tag == LVZ_WRLD_TAG else "TEX 32B preface"
                 groups.append(SlaveGroup(
                     idx,
                     addr,
-                    str(tag_str),
+                    tag.to_bytes(4, "little").decode("ascii", errors="replace"),
                     total,
                     gcnt,
                     cont,
                     f"{note}; group_type=0x{group_type:08X}"
                 ))
-                idx += 1
-                cursor += 8
+            cursor += LVZ_GROUP_TABLE_STRIDE * len(groups)
 
             res_count = 0
             if groups and cursor + 4 <= n:
@@ -1600,20 +1751,30 @@ class read_lvz:
             )
             return (groups, res_count, cursor)
 
-        while cursor + 8 <= n:
-            addr = read_u32(lvz, cursor + 0)
-            resv = read_u32(lvz, cursor + 4)
-            plaus = (0 < addr < n and (addr & 0x3) == 0)
-            plaus = plaus and (resv == 0 or (resv & 0xFFFF) == 0)
-            if not plaus:
-                break
-            tag, info, note = self._peek_global32(addr)
-            total = int(info.get("total", 0))
-            gcnt  = int(info.get("gcnt", 0))
-            cont  = int(info.get("cont", 0))
-            groups.append(SlaveGroup(idx, addr, str(tag), total, gcnt, cont, note))
-            idx += 1
-            cursor += 8
+        rows = self.scan_group_table_rows(False)
+        prefaces, in_bounds = gather_global32_prefaces(self.decomp, rows[:, 0])
+        columns = zip(
+            rows[:, 0].tolist(),
+            in_bounds.tolist(),
+            prefaces["tag"].tolist(),
+            prefaces["total"].tolist(),
+            prefaces["gcnt"].tolist(),
+            prefaces["cont"].tolist(),
+        )
+        for idx, (addr, readable, tag, total, gcnt, cont) in enumerate(columns):
+            if not readable:
+                groups.append(SlaveGroup(idx, addr, "(oob)", 0, 0, 0, "out-of-bounds"))
+                continue
+            tag_str = tag.to_bytes(4, "little").decode("ascii", errors="replace")
+            if tag == LVZ_WRLD_TAG:
+                note = "WRLD 32B preface"
+            elif tag == LVZ_TEX_TAG:
+                note = "TEX 32B preface"
+            else:
+                note = "Unknown 32B header"
+                total = gcnt = cont = 0
+            groups.append(SlaveGroup(idx, addr, tag_str, total, gcnt, cont, note))
+        cursor += LVZ_GROUP_TABLE_STRIDE * len(groups)
 
         res_count = int(master.count_like)
         if res_count <= 0 and cursor + 4 <= n:
@@ -3309,23 +3470,17 @@ class read_img:
         if self._wrldtool_img_offset_by_lvz_addr is not None:
             return self._wrldtool_img_offset_by_lvz_addr
 
-        mapping: Dict[int, int] = {}
-        for addr in self._iter_lvz_dlrw_headers_for_direct_contimg():
-            try:
-                total = read_u32(self.lvz_bytes, addr + 0x08)
-                cont_img = read_u32(self.lvz_bytes, addr + 0x18)
-                if total >= 0x20 and 0 <= int(cont_img) < len(self.img_bytes):
-                    mapping[int(addr)] = int(cont_img)
-            except Exception:
-                pass
+        addrs, totals, conts = self._direct_contimg_dlrw_headers()
+        mapping: Dict[int, int] = dict(zip(addrs.tolist(), conts.tolist()))
+        prefetched = prefetch_mapped_ranges(self.img_bytes, conts, conts + np.maximum(totals - 0x20, 0))
+        if prefetched:
+            dbg(f"[wrldtool-offset] prefetching {prefetched} IMG continuation spans")
 
         self._wrldtool_img_offset_by_lvz_addr = mapping
         try:
             if not self._wrldtool_img_offset_log_done:
                 dbg(f"[wrldtool-offset] direct LVZ +0x18 contIMG offsets: {len(mapping)}")
-                for i, addr in enumerate(sorted(mapping)[:64]):
-                    cont_img = mapping[addr]
-                    total = read_u32(self.lvz_bytes, addr + 0x08)
+                for i, (addr, total, cont_img) in enumerate(zip(addrs[:64].tolist(), totals[:64].tolist(), conts[:64].tolist())):
                     dbg(
                         f"[wrldtool-offset] sample {i:03d}: offsetLVZ=0x{addr:08X} "
                         f"size={int(total)} contIMG=0x{int(cont_img):08X} "
@@ -3336,47 +3491,24 @@ class read_img:
             pass
         return mapping
 
-    def _iter_lvz_dlrw_headers_for_direct_contimg(self) -> List[int]:
+    def _direct_contimg_dlrw_headers(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         lvz = self.lvz_bytes
         n = len(lvz)
-        out = []
-        seen = set()
-
-        def add(addr):
-            try:
-                addr = int(addr)
-                if addr in seen:
-                    return
-                if not (0 <= addr and addr + 0x20 <= n and (addr & 3) == 0):
-                    return
-                if lvz[addr:addr + 4] not in (b"DLRW", b"xet\0"):
-                    return
-                total = read_u32(lvz, addr + 0x08)
-                cont_img = read_u32(lvz, addr + 0x18)
-                if total < 0x20 or total > 0x4000000:
-                    return
-                if not (0 <= cont_img < len(self.img_bytes)):
-                    return
-                seen.add(addr)
-                out.append(addr)
-            except Exception:
-                pass
+        candidates: List[int] = []
 
         # Master group chain first.
-        cursor = 0x24
-        while cursor + 8 <= n:
+        cursor = LVZ_GROUP_TABLE_START
+        while cursor + LVZ_GROUP_TABLE_STRIDE <= n:
             addr = read_u32(lvz, cursor + 0)
             if not (0 < addr < n and (addr & 3) == 0 and addr + 0x20 <= n):
                 break
             if lvz[addr:addr + 4] not in (b"DLRW", b"xet\0"):
                 break
-            add(addr)
             group_count = read_u32(lvz, addr + 0x14)
             if group_count <= 0 or group_count > 4096:
                 group_count = 1
-            for child in range(1, int(group_count)):
-                add(addr + child * 0x20)
-            cursor += 8
+            candidates.extend(range(addr, addr + int(group_count) * 0x20, 0x20))
+            cursor += LVZ_GROUP_TABLE_STRIDE
 
         # Fallback scan for triggered/AREA headers.
         pos = 0
@@ -3384,11 +3516,21 @@ class read_img:
             pos = lvz.find(b"DLRW", pos)
             if pos < 0:
                 break
-            add(pos)
+            candidates.append(pos)
             pos += 4
 
-        out.sort()
-        return out
+        # Validate and classify every candidate at once: a header is IMG-backed
+        # when its +0x18 contIMG offset lands inside the IMG.
+        addrs = np.unique(np.asarray(candidates, dtype=np.int64))
+        addrs = addrs[((addrs & 3) == 0) & (addrs + 0x20 <= n)]
+        prefaces, _in_bounds = gather_global32_prefaces(lvz, addrs)
+        tags = prefaces["tag"]
+        totals = prefaces["total"].astype(np.int64)
+        conts = prefaces["cont"].astype(np.int64)
+        keep = (tags == LVZ_WRLD_TAG) | (tags == LVZ_TEX_TAG)
+        keep &= (totals >= 0x20) & (totals <= 0x4000000)
+        keep &= conts < len(self.img_bytes)
+        return addrs[keep], totals[keep], conts[keep]
 
     def img_data_base_for_lvz_dlrw_header(self, header_addr: int, fallback_global_rel: int, file_size: int):
         mapping = self.wrldtool_img_offset_by_lvz_addr()
@@ -3411,9 +3553,9 @@ class read_img:
         if n < 0x24 or lvz[:4] != b"DLRW":
             return rows
 
-        cursor = 0x24
+        cursor = LVZ_GROUP_TABLE_START
         row_index = 0
-        while cursor + 8 <= n:
+        while cursor + LVZ_GROUP_TABLE_STRIDE <= n:
             header_addr = read_u32(lvz, cursor + 0)
             start_off = read_u32(lvz, cursor + 4)
             if not (0 < header_addr < n and (header_addr & 0x3) == 0 and header_addr + 0x20 <= n):
@@ -3426,7 +3568,7 @@ class read_img:
                 "start_off": int(start_off),
             })
             row_index += 1
-            cursor += 8
+            cursor += LVZ_GROUP_TABLE_STRIDE
         return rows
 
     def detect_sector_game_hint(self) -> str:
@@ -4597,9 +4739,9 @@ class read_img:
         if n < 0x24 or lvz[:4] != b"DLRW":
             return records
 
-        cursor = 0x24
+        cursor = LVZ_GROUP_TABLE_START
         group_index = 0
-        while cursor + 8 <= n:
+        while cursor + LVZ_GROUP_TABLE_STRIDE <= n:
             group_addr = read_u32(lvz, cursor + 0)
             group_type = read_u32(lvz, cursor + 4)
             if not (0 < group_addr < n and (group_addr & 0x3) == 0 and group_addr + 0x20 <= n):
@@ -4629,7 +4771,7 @@ class read_img:
                 "wrldtool_direct_contimg": bool(used_direct_contimg),
             })
             group_index += 1
-            cursor += 8
+            cursor += LVZ_GROUP_TABLE_STRIDE
         return records
 
     def find_nested_container_records_from_lvz(self) -> List[Dict[str, int]]:
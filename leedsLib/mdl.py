@@ -21,8 +21,14 @@ import math
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Any, Optional, Iterable
 
+import numpy as np
 from mathutils import Matrix, Vector
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #
 #   This script is for Stories .MDLs, the file format for actors & props            #
 #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #
@@ -88,6 +94,10 @@ except Exception:
     )
 # Bone arrays and shared PED hierarchy constants live in BLeeds/data/bone_data.py.
 
+# HAnim IDs are stored as a byte; the LCS toe helpers (2000+) collapse to 0xFF.
+_LCS_HANIM_BONE_IDS: Tuple[int, ...] = tuple(int(v) if int(v) < 256 else 0xFF for v in kamBoneID)
+_LCS_HANIM_BONE_TYPES: Tuple[int, ...] = tuple(int(v) for v in kamBoneType)
+
 #######################################################
 # === Model Rendering Flags ===
 
@@ -256,29 +266,55 @@ class StoriesMDLContext:
         if self.print_debug_log:
             print(msg)
 
+_I8 = struct.Struct("<b")
+_U8 = struct.Struct("<B")
+_I16 = struct.Struct("<h")
+_U16 = struct.Struct("<H")
+_I32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_BU32 = struct.Struct(">I")
+_F32 = struct.Struct("<f")
+_POINT3 = struct.Struct("<3f")
+_FRAME_MATRIX_ROWS = struct.Struct("<3f4x3f4x3f4x3f4x")
+_HIERARCHY_ENTRY = struct.Struct("<II")
+_PS2_SKIN_WORDS = struct.Struct("<4I")
+
+# The Stories reader pulls thousands of tiny fields through these helpers.
+# Reading into a fixed scratch buffer keeps each field from allocating its
+# own bytes object; the views are sliced once here rather than per call.
+_READ_SCRATCH = bytearray(_FRAME_MATRIX_ROWS.size)
+_READ_VIEWS = {size: memoryview(_READ_SCRATCH)[:size] for size in (1, 2, 4, 12, _FRAME_MATRIX_ROWS.size)}
+
+def _read_into(f, size: int) -> memoryview:
+    view = _READ_VIEWS[size]
+    read_size = f.readinto(view)
+    if read_size != size:
+        raise struct.error(f"unpack requires a buffer of {size} bytes")
+    return view
+
 def read_i8(f) -> int:
-    return struct.unpack("<b", f.read(1))[0]
+    return _I8.unpack_from(_read_into(f, 1))[0]
 
 def read_u8(f) -> int:
-    return struct.unpack("<B", f.read(1))[0]
+    return _U8.unpack_from(_read_into(f, 1))[0]
 
 def read_i16(f) -> int:
-    return struct.unpack("<h", f.read(2))[0]
+    return _I16.unpack_from(_read_into(f, 2))[0]
 
 def read_u16(f) -> int:
-    return struct.unpack("<H", f.read(2))[0]
+    return _U16.unpack_from(_read_into(f, 2))[0]
 
 def read_i32(f) -> int:
-    return struct.unpack("<i", f.read(4))[0]
+    return _I32.unpack_from(_read_into(f, 4))[0]
 
 def read_u32(f) -> int:
-    return struct.unpack("<I", f.read(4))[0]
+    return _U32.unpack_from(_read_into(f, 4))[0]
 
 def read_bu32(f) -> int:
-    return struct.unpack(">I", f.read(4))[0]
+    return _BU32.unpack_from(_read_into(f, 4))[0]
 
 def read_f32(f) -> float:
-    return struct.unpack("<f", f.read(4))[0]
+    return _F32.unpack_from(_read_into(f, 4))[0]
 
 def read_string(f, ptr: int) -> str:
     if ptr == 0:
@@ -295,19 +331,21 @@ def read_string(f, ptr: int) -> str:
     return s.decode("utf-8", errors="ignore")
 
 def read_point3(f) -> Vector:
-    return Vector(struct.unpack("<3f", f.read(12)))
+    return Vector(_POINT3.unpack_from(_read_into(f, 12)))
+
+def read_frame_matrix_rows(f) -> Tuple[Vector, Vector, Vector, Vector]:
+    values = _FRAME_MATRIX_ROWS.unpack_from(_read_into(f, _FRAME_MATRIX_ROWS.size))
+    return (
+        Vector(values[0:3]),
+        Vector(values[3:6]),
+        Vector(values[6:9]),
+        Vector(values[9:12]),
+    )
 
 def read_local_matrix(f) -> Tuple[Matrix, int, Tuple[Vector, Vector, Vector, Vector]]:
     matrix_offset = f.tell()
 
-    row1 = read_point3(f)
-    f.read(4)
-    row2 = read_point3(f)
-    f.read(4)
-    row3 = read_point3(f)
-    f.read(4)
-    row4 = read_point3(f)
-    f.read(4)
+    row1, row2, row3, row4 = read_frame_matrix_rows(f)
 
     scale_factor = 1.0
     x = row4.x * scale_factor
@@ -329,14 +367,7 @@ def read_global_matrix(f, offset: int) -> Matrix:
     cur = f.tell()
     f.seek(offset)
 
-    row1 = read_point3(f)
-    f.read(4)
-    row2 = read_point3(f)
-    f.read(4)
-    row3 = read_point3(f)
-    f.read(4)
-    row4 = read_point3(f)
-    f.read(4)
+    row1, row2, row3, row4 = read_frame_matrix_rows(f)
 
     f.seek(cur)
 
@@ -731,9 +762,10 @@ def parse_hierarchy_table(ctx: StoriesMDLContext, f, hierarchy_ptr: int, arm: St
         entries: List[Dict[str, Any]] = []
 
         f.seek(entries_ptr)
-        for entry_index in range(int(count)):
-            packed = read_u32(f)
-            zero = read_u32(f)
+        entry_data = f.read(int(count) * _HIERARCHY_ENTRY.size)
+        if len(entry_data) < int(count) * _HIERARCHY_ENTRY.size:
+            raise struct.error("hierarchy entry table is truncated")
+        for entry_index, (packed, zero) in enumerate(_HIERARCHY_ENTRY.iter_unpack(entry_data)):
             bone_id = int(packed & 0xFF)
             node_index = int((packed >> 8) & 0xFF)
             bone_type = int((packed >> 16) & 0xFF)
@@ -2310,6 +2342,17 @@ def read_psp_geometry(ctx: StoriesMDLContext, f, geom_ptr: int) -> StoriesPSPGeo
             f"0x{tri_strip_offset:X}, stride={vertex_stride}, vertices={num_strip_verts}"
         )
 
+        m.verts = [None] * num_strip_verts
+        if wghtfmt:
+            m.bone_indices = [None] * num_strip_verts
+            m.bone_weights = [None] * num_strip_verts
+        if uvfmt == 1:
+            m.uvs = [None] * num_strip_verts
+        if colfmt == 5:
+            m.colors = [None] * num_strip_verts
+        if normfmt == 1:
+            m.normals = [None] * num_strip_verts
+
         for vi in range(num_strip_verts):
             vertex_file_offset = f.tell()
             vertex_data = f.read(vertex_stride)
@@ -2326,8 +2369,8 @@ def read_psp_geometry(ctx: StoriesMDLContext, f, geom_ptr: int) -> StoriesPSPGeo
                     vertex_layout,
                     list(mesh.get("bonemap") or []),
                 )
-                m.bone_indices.append(bone_indices)
-                m.bone_weights.append(bone_weights)
+                m.bone_indices[vi] = bone_indices
+                m.bone_weights[vi] = bone_weights
 
             u_val = 0.0
             v_val = 0.0
@@ -2335,7 +2378,7 @@ def read_psp_geometry(ctx: StoriesMDLContext, f, geom_ptr: int) -> StoriesPSPGeo
                 uv_offset = int(vertex_offsets["uv"])
                 u_val = float(vertex_data[uv_offset]) / 128.0 * float(mesh["uvScale"][0])
                 v_val = float(vertex_data[uv_offset + 1]) / 128.0 * float(mesh["uvScale"][1])
-                m.uvs.append((u_val, v_val))
+                m.uvs[vi] = (u_val, v_val)
 
             col_val = None
             if colfmt == 5:
@@ -2346,14 +2389,14 @@ def read_psp_geometry(ctx: StoriesMDLContext, f, geom_ptr: int) -> StoriesPSPGeo
                 b_c = ((col >> 10) & 0x1F) * 255 // 0x1F
                 a_c = 0xFF if (col & 0x8000) else 0
                 col_val = (r, g_c, b_c, a_c)
-                m.colors.append(col_val)
+                m.colors[vi] = col_val
 
             norm_val = None
             if normfmt == 1:
                 normal_offset = int(vertex_offsets["normal"])
                 nx, ny, nz = struct.unpack_from("<3b", vertex_data, normal_offset)
                 norm_val = (float(nx) / 128.0, float(ny) / 128.0, float(nz) / 128.0)
-                m.normals.append(norm_val)
+                m.normals[vi] = norm_val
 
             if posfmt == 1:
                 position_offset = int(vertex_offsets["position"])
@@ -2370,14 +2413,14 @@ def read_psp_geometry(ctx: StoriesMDLContext, f, geom_ptr: int) -> StoriesPSPGeo
             else:
                 raise Exception(f"Unsupported PSP position format: {posfmt}")
 
-            m.verts.append((px, py, pz))
+            m.verts[vi] = (px, py, pz)
 
             if wghtfmt:
                 ctx.log(
                     f"    Vertex {vi} @ 0x{vertex_file_offset:X}: pos=({px}, {py}, {pz}) "
                     f"uv=({u_val}, {v_val}) color={col_val} normal={norm_val} "
-                    f"rawWeights={raw_weight_values} bones={m.bone_indices[-1]} "
-                    f"weights={m.bone_weights[-1]}"
+                    f"rawWeights={raw_weight_values} bones={m.bone_indices[vi]} "
+                    f"weights={m.bone_weights[vi]}"
                 )
             else:
                 ctx.log(
@@ -2385,17 +2428,12 @@ def read_psp_geometry(ctx: StoriesMDLContext, f, geom_ptr: int) -> StoriesPSPGeo
                     f"uv=({u_val}, {v_val}) color={col_val} normal={norm_val}"
                 )
 
+        m.faces = [None] * max(0, num_strip_verts - 2)
         for i in range(2, num_strip_verts):
             if (i % 2) == 0:
-                v0 = i - 2
-                v1 = i - 1
-                v2 = i
+                m.faces[i - 2] = (i - 2, i - 1, i)
             else:
-                v0 = i - 1
-                v1 = i - 2
-                v2 = i
-            if v0 != v1 and v1 != v2 and v2 != v0:
-                m.faces.append((v0, v1, v2))
+                m.faces[i - 2] = (i - 1, i - 2, i)
 
         ctx.log(
             f"✔ Built PSP mesh {mesh_index}: verts={len(m.verts)}, faces={len(m.faces)}, "
@@ -2457,6 +2495,16 @@ class read_stories:
             ctx.ptr2_before_tex = read_u32(f)
             ctx.allocated_memory = read_u32(f)
 
+            LCSCLUMPPS2 = 0x00000002
+            VCSCLUMPPS2 = 0x0000AA02
+            CLUMPPSP = 0x00000002
+            LCSATOMIC1 = 0x01050001
+            LCSATOMIC2 = 0x01000001
+            VCSATOMIC1 = 0x0004AA01
+            VCSATOMIC2 = 0x0000AA01
+            VCSATOMICPSP1 = 0x00041601
+            VCSATOMICPSP2 = 0x01F40400
+
             next_ptr_offset = f.tell()
             possible_ptr = read_u32(f)
             if str(mdl_type or "").upper().strip() == "VEH" and next_ptr_offset == 0x20:
@@ -2499,14 +2547,12 @@ class read_stories:
                 return val in KNOWN_VTABLES or (val & 0xFFFF) in {v & 0xFFFF for v in KNOWN_VTABLES}
 
             inline_top_level_magic = possible_ptr in {
-                LCSCLUMPPS2 if 'LCSCLUMPPS2' in locals() else 0x00000002,
-                VCSCLUMPPS2 if 'VCSCLUMPPS2' in locals() else 0x0000AA02,
-                0x00000002,
-                0x0000AA02,
-                0x01050001,
-                0x01000001,
-                0x0004AA01,
-                0x0000AA01,
+                LCSCLUMPPS2,
+                VCSCLUMPPS2,
+                LCSATOMIC1,
+                LCSATOMIC2,
+                VCSATOMIC1,
+                VCSATOMIC2,
             }
 
             if (next_ptr_offset == 0x20 and int(ctx.allocated_memory or 0) == 0 and inline_top_level_magic):
@@ -2587,16 +2633,6 @@ class read_stories:
             f.seek(ctx.top_level_ptr)
             top_magic = read_u32(f)
 
-            LCSCLUMPPS2 = 0x00000002
-            VCSCLUMPPS2 = 0x0000AA02
-            CLUMPPSP = 0x00000002
-            LCSATOMIC1 = 0x01050001
-            LCSATOMIC2 = 0x01000001
-            VCSATOMIC1 = 0x0004AA01
-            VCSATOMIC2 = 0x0000AA01
-            VCSATOMICPSP1 = 0x00041601
-            VCSATOMICPSP2 = 0x01F40400
-
             ctx.section_type = 0
             ctx.import_type = 0
 
@@ -2853,33 +2889,52 @@ class ScalePos:
     pos: Tuple[float, float, float]
 
 def write_u8(buf: bytearray, value: int) -> None:
-    buf += struct.pack("<B", value & 0xFF)
+    buf += _U8.pack(value & 0xFF)
 
 def write_u16(buf: bytearray, value: int) -> None:
-    buf += struct.pack("<H", value & 0xFFFF)
+    buf += _U16.pack(value & 0xFFFF)
 
 def write_i16(buf: bytearray, value: int) -> None:
-    buf += struct.pack("<h", int(value))
+    buf += _I16.pack(int(value))
 
 def write_u32(buf_or_value, value=None):
 
     if value is None:
-        return struct.pack("<I", int(buf_or_value) & 0xFFFFFFFF)
+        return _U32.pack(int(buf_or_value) & 0xFFFFFFFF)
 
     buf = buf_or_value
-    buf += struct.pack("<I", int(value) & 0xFFFFFFFF)
+    buf += _U32.pack(int(value) & 0xFFFFFFFF)
     return None
 
+_U32_RUNS: Dict[int, struct.Struct] = {}
+_ZERO_WORDS = memoryview(bytes(256))
+
+def append_u32_words(buf: bytearray, *words: int) -> int:
+
+    # Grows the buffer once per run of words and packs them in place, rather
+    # than building one bytes temporary per word.
+    count = len(words)
+    packer = _U32_RUNS.get(count)
+    if packer is None:
+        packer = _U32_RUNS[count] = struct.Struct(f"<{count}I")
+    off = len(buf)
+    if packer.size <= len(_ZERO_WORDS):
+        buf += _ZERO_WORDS[:packer.size]
+    else:
+        buf += bytes(packer.size)
+    packer.pack_into(buf, off, *[int(word) & 0xFFFFFFFF for word in words])
+    return off + packer.size
+
 def reserve_u32(buf: bytearray, initial_value: int = 0) -> int:
     off = len(buf)
     write_u32(buf, initial_value)
     return off
 
 def write_i32(buf: bytearray, value: int) -> None:
-    buf += struct.pack("<i", int(value))
+    buf += _I32.pack(int(value))
 
 def write_f32(buf: bytearray, value: float) -> None:
-    buf += struct.pack("<f", float(value))
+    buf += _F32.pack(float(value))
 
 def write_cstring(
     buf: bytearray,
@@ -3230,6 +3285,9 @@ def trim_ps2_ped_dma_packet_to_byte_length(packet: bytes, target_byte_length: in
     has_dma_tag = ((first_word >> 28) & 0xF) == 0x6
     payload = raw[16:] if has_dma_tag and len(raw) >= 16 else raw
 
+    def align4(value: int) -> int:
+        return (int(value) + 3) & ~3
+
     current_total = 0
     pos = 0
     while pos < len(payload):
@@ -3241,9 +3299,6 @@ def trim_ps2_ped_dma_packet_to_byte_length(packet: bytes, target_byte_length: in
                 break
             current_total += count
 
-            def align4(value: int) -> int:
-                return (int(value) + 3) & ~3
-
             cursor = pos + 48
             cursor += 4 + align4(count * 6)
             cursor += 28
@@ -3436,6 +3491,50 @@ def validate_dma_ref_packet(packet: bytes, *, vif_profile: str = "SIM") -> None:
 
     validate_ps2_dma_vif_payload(payload, vif_profile=vif_profile)
 
+_PS2_ROUNDING_CODES: Dict[str, int] = {"FLOOR": 1, "CEIL": 2}
+
+# Optional accelerator: with numba installed a stream is rounded and clamped
+# in one compiled pass instead of three or four temporary numpy arrays.
+# It uses the same floor/ceil calls, so the output matches the numpy path.
+if numba is not None:
+    @numba.njit(cache=True)
+    def _quantize_ps2_stream_jit(values, rounding_code, lo, hi, out):
+        for i in range(values.shape[0]):
+            x = values[i]
+            if rounding_code == 1:
+                r = np.floor(x)
+            elif rounding_code == 2:
+                r = np.ceil(x)
+            elif x >= 0.0:
+                r = np.floor(x + 0.5)
+            else:
+                r = np.ceil(x - 0.5)
+            if not np.isfinite(r):
+                return False
+            out[i] = min(max(r, lo), hi)
+        return True
+else:
+    _quantize_ps2_stream_jit = None
+
+def quantize_ps2_stream(values: np.ndarray, rounding_mode: str, lo: int, hi: int) -> np.ndarray:
+
+    if _quantize_ps2_stream_jit is not None:
+        flat = np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+        out = np.empty_like(flat)
+        if not _quantize_ps2_stream_jit(flat, _PS2_ROUNDING_CODES.get(rounding_mode, 0), float(lo), float(hi), out):
+            raise ValueError("Strip stream contains a non-finite value; cannot quantise it.")
+        return out.reshape(np.shape(values))
+
+    if rounding_mode == "FLOOR":
+        rounded = np.floor(values)
+    elif rounding_mode == "CEIL":
+        rounded = np.ceil(values)
+    else:
+        rounded = np.where(values >= 0.0, np.floor(values + 0.5), np.ceil(values - 0.5))
+    if not np.isfinite(rounded).all():
+        raise ValueError("Strip stream contains a non-finite value; cannot quantise it.")
+    return np.clip(rounded, lo, hi)
+
 def build_ps2_dma_for_strip(
     verts: List[Ps2Vertex],
     *,
@@ -3464,16 +3563,12 @@ def build_ps2_dma_for_strip(
         )
 
     GLOBAL_SCALE = 100.0 * 0.00000030518203134641490805874367518203
+    positions = np.array([(v.x, v.y, v.z) for v in verts], dtype=np.float64)
     if scale_pos_override is not None:
         scale_pos = scale_pos_override
     else:
-        xs = [float(v.x) for v in verts]
-        ys = [float(v.y) for v in verts]
-        zs = [float(v.z) for v in verts]
-
-        xmin, xmax = min(xs), max(xs)
-        ymin, ymax = min(ys), max(ys)
-        zmin, zmax = min(zs), max(zs)
+        xmin, ymin, zmin = positions.min(axis=0).tolist()
+        xmax, ymax, zmax = positions.max(axis=0).tolist()
 
         cx = (xmin + xmax) * 0.5
         cy = (ymin + ymax) * 0.5
@@ -3494,109 +3589,73 @@ def build_ps2_dma_for_strip(
     sx, sy, sz = scale_pos.scale
     tx, ty, tz = scale_pos.pos
 
-    def apply_round(x: float) -> int:
-        if rounding_mode == "FLOOR":
-            return int(math.floor(x))
-        if rounding_mode == "CEIL":
-            return int(math.ceil(x))
-
-        if x >= 0.0:
-            return int(math.floor(x + 0.5))
-        return int(math.ceil(x - 0.5))
-
-    def encode_pos_i16(px: float, py: float, pz: float) -> bytes:
-
-        ix = apply_round((px - tx) / (sx * GLOBAL_SCALE)) if abs(sx) > 1.0e-12 else 0
-        iy = apply_round((py - ty) / (sy * GLOBAL_SCALE)) if abs(sy) > 1.0e-12 else 0
-        iz = apply_round((pz - tz) / (sz * GLOBAL_SCALE)) if abs(sz) > 1.0e-12 else 0
-
-        ix = max(-32768, min(32767, ix))
-        iy = max(-32768, min(32767, iy))
-        iz = max(-32768, min(32767, iz))
-
-        return struct.pack("<hhh", ix, iy, iz)
-
-    def encode_uv_bytes(u: float, v: float) -> bytes:
-        uu = int(apply_round(u * 127.5))
-        vv = int(apply_round(v * 127.5))
-        uu = max(0, min(255, uu))
-        vv = max(0, min(255, vv))
-        return struct.pack("<BB", uu, vv)
-
-    def encode_norm_bytes(nx: float, ny: float, nz: float) -> bytes:
-
-        def clamp_s8(x: int) -> int:
-            return max(-128, min(127, x))
+    # Each stream is quantised as one array, then written in a single extend.
+    scale_axes = np.array((sx, sy, sz), dtype=np.float64)
+    live_axes = np.abs(scale_axes) > 1.0e-12
+    pos_units = np.zeros_like(positions)
+    pos_units[:, live_axes] = (
+        (positions[:, live_axes] - np.array((tx, ty, tz), dtype=np.float64)[live_axes])
+        / (scale_axes[live_axes] * GLOBAL_SCALE)
+    )
+    pos_stream = quantize_ps2_stream(pos_units, rounding_mode, -32768, 32767).astype("<i2").tobytes()
 
-        ix = clamp_s8(apply_round(nx * 127.0))
-        iy = clamp_s8(apply_round(ny * 127.0))
-        iz = clamp_s8(apply_round(nz * 127.0))
-        return struct.pack("<bbb", ix, iy, iz)
+    uvs = np.array([(v.u, v.v) for v in verts], dtype=np.float64)
+    uv_stream = quantize_ps2_stream(uvs * 127.5, rounding_mode, 0, 255).astype(np.uint8).tobytes()
 
     seg_count = num_verts
     payload = bytearray()
+    extend = payload.extend
     is_ped = (str(vif_profile).upper().strip() == "PED")
     emit_normals = bool(use_normals) or is_ped
 
     if include_split_header:
-        payload.extend(write_u32(0x6C018000))
-        payload.extend(write_u32(0))
-        payload.extend(write_u32(0))
-        payload.extend(write_u32(seg_count & 0xFF))
-        payload.extend(write_u32((seg_count & 0xFF) | 0x00008000))
+        append_u32_words(
+            payload,
+            0x6C018000,
+            0,
+            0,
+            seg_count & 0xFF,
+            (seg_count & 0xFF) | 0x00008000,
+        )
 
         if is_ped:
 
-            payload.extend(write_u32(VIF_STMASK))
-            payload.extend(write_u32(0x40404040))
-            payload.extend(write_u32(VIF_STROW))
-            payload.extend(write_u32(0))
-            payload.extend(write_u32(0))
-            payload.extend(write_u32(0))
-            payload.extend(write_u32(0))
+            append_u32_words(payload, VIF_STMASK, 0x40404040, VIF_STROW, 0, 0, 0, 0)
         else:
 
-            payload.extend(write_u32(0))
-            payload.extend(write_u32(0x40404020))
-            payload.extend(write_u32(0x40404040))
+            append_u32_words(payload, 0, 0x40404020, 0x40404040)
 
     if not is_ped:
 
-        payload.extend(write_u32(VIF_UNPACK))
-        payload.extend(write_u32(0))
-        payload.extend(write_u32(0))
-        payload.extend(write_u32(seg_count))
-        payload.extend(write_u32(0x8000 | (seg_count & 0xFFFF)))
-
-        payload.extend(write_u32(VIF_STMASK))
-        payload.extend(write_u32(0x40404040))
-        payload.extend(write_u32(VIF_STROW))
-        payload.extend(write_u32(0))
-        payload.extend(write_u32(0))
-        payload.extend(write_u32(0))
-        payload.extend(write_u32(0))
+        append_u32_words(
+            payload,
+            VIF_UNPACK,
+            0,
+            0,
+            seg_count,
+            0x8000 | (seg_count & 0xFFFF),
+            VIF_STMASK,
+            0x40404040,
+            VIF_STROW,
+            0,
+            0,
+            0,
+            0,
+        )
 
     pos_header = (0x79 << 24) | ((seg_count & 0xFF) << 16) | 0x8001
-    payload.extend(write_u32(pos_header))
-    for v in verts:
-        payload.extend(encode_pos_i16(v.x, v.y, v.z))
+    append_u32_words(payload, pos_header)
+    extend(pos_stream)
     pad_bytes_to(payload, 4)
 
-    payload.extend(write_u32(VIF_STMASK))
-    payload.extend(write_u32(0x50505050))
-    payload.extend(write_u32(VIF_STROW))
-    payload.extend(write_u32(0))
-    payload.extend(write_u32(0))
-    payload.extend(write_u32(0x000000FF))
-    payload.extend(write_u32(0))
+    append_u32_words(payload, VIF_STMASK, 0x50505050, VIF_STROW, 0, 0, 0x000000FF, 0)
 
     if str(vif_profile).upper().strip() == "PED":
         tex_header = (0x76 << 24) | ((seg_count & 0xFF) << 16) | 0xC055
     else:
         tex_header = (0x76 << 24) | ((seg_count & 0xFF) << 16) | 0x808D
-    payload.extend(write_u32(tex_header))
-    for v in verts:
-        payload.extend(encode_uv_bytes(v.u, v.v))
+    append_u32_words(payload, tex_header)
+    extend(uv_stream)
     pad_bytes_to(payload, 4)
 
     if emit_normals:
@@ -3605,9 +3664,9 @@ def build_ps2_dma_for_strip(
             norm_header = (0x6A << 24) | ((seg_count & 0xFF) << 16) | 0x802B
         else:
             norm_header = (0x6A << 24) | ((seg_count & 0xFF) << 16) | 0x8047
-        payload.extend(write_u32(norm_header))
-        for v in verts:
-            payload.extend(encode_norm_bytes(v.nx, v.ny, v.nz))
+        append_u32_words(payload, norm_header)
+        normals = np.array([(v.nx, v.ny, v.nz) for v in verts], dtype=np.float64)
+        extend(quantize_ps2_stream(normals * 127.0, rounding_mode, -128, 127).astype(np.int8).tobytes())
         pad_bytes_to(payload, 4)
 
     def _encode_skin_payload(v: Ps2Vertex) -> bytes:
@@ -3627,13 +3686,10 @@ def build_ps2_dma_for_strip(
                     return None
             except Exception:
                 pass
-            out_raw = bytearray()
             try:
-                for raw_value in raw_values[:4]:
-                    out_raw.extend(struct.pack('<I', int(raw_value) & 0xFFFFFFFF))
+                return _PS2_SKIN_WORDS.pack(*[int(raw_value) & 0xFFFFFFFF for raw_value in raw_values[:4]])
             except Exception:
                 return None
-            return bytes(out_raw)
 
         idxs = list(getattr(v, 'bone_indices', (0, 0, 0, 0)) or (0, 0, 0, 0))[:4]
         wts = list(getattr(v, 'bone_weights', (0.0, 0.0, 0.0, 0.0)) or (0.0, 0.0, 0.0, 0.0))[:4]
@@ -3688,11 +3744,9 @@ def build_ps2_dma_for_strip(
         while len(pairs) < 4:
             pairs.append([0, 0.0])
 
-        out_skin = bytearray()
-        for bi_i, wt_f in pairs[:4]:
-            raw_word = _encode_ps2_ped_skin_word(bi_i, wt_f) & 0xFFFFFFFF
-            out_skin.extend(struct.pack('<I', raw_word))
-        return bytes(out_skin)
+        return _PS2_SKIN_WORDS.pack(
+            *[_encode_ps2_ped_skin_word(bi_i, wt_f) & 0xFFFFFFFF for bi_i, wt_f in pairs[:4]]
+        )
 
     has_skin_stream = is_ped or any(
         any(int(b) != 0 for b in (getattr(v, 'bone_indices', (0, 0, 0, 0)) or (0, 0, 0, 0))) or
@@ -3705,11 +3759,11 @@ def build_ps2_dma_for_strip(
             skin_header = (0x6C << 24) | ((seg_count & 0xFF) << 16) | 0x807F
         else:
             skin_header = (0x6C << 24) | ((seg_count & 0xFF) << 16) | 0x8047
-        payload.extend(write_u32(skin_header))
+        append_u32_words(payload, skin_header)
         for v in verts:
-            payload.extend(_encode_skin_payload(v))
+            extend(_encode_skin_payload(v))
 
-    payload.extend(write_u32(VIF_MSCAL))
+    append_u32_words(payload, VIF_MSCAL)
 
     pad_bytes_to(payload, 16)
     validate_ps2_dma_vif_payload(payload, vif_profile=vif_profile)
@@ -3725,10 +3779,7 @@ def build_ps2_dma_for_strip(
 
     dma = bytearray()
     dma_tag = 0x60000000 | (qwc_total & 0xFFFF)
-    dma.extend(write_u32(dma_tag))
-    dma.extend(write_u32(0))
-    dma.extend(write_u32(0))
-    dma.extend(write_u32(0))
+    append_u32_words(dma, dma_tag, 0, 0, 0)
     dma.extend(payload)
 
     return dma, scale_pos
@@ -7137,6 +7188,7 @@ def _append_ps2_ped_frames_all_bones(
     armature_obj: Any,
     import_type_hint: Optional[int] = None,
     pending_frame_names: Optional[List[PendingFrameName]] = None,
+    out_meta: Optional[Dict[str, Any]] = None,
 ) -> Optional[int]:
     if armature_obj is None:
         return None
@@ -7174,6 +7226,7 @@ def _append_ps2_ped_frames_all_bones(
     base_name = base_raw
     if not canon_frame_name(base_name).endswith("base"):
         base_name = f"{base_name}_base"
+    base_helper_name = base_name
 
     bone_by_name: Dict[str, Any] = {str(b.name): b for b in bones}
     children_by_parent: Dict[str, List[str]] = {str(b.name): [] for b in bones}
@@ -7350,7 +7403,7 @@ def _append_ps2_ped_frames_all_bones(
         try:
             node_name_to_off: Dict[str, int] = {}
             for idx, n in enumerate(nodes):
-                canon_name = canon_frame_name(str(n.get("disk_name", "")))
+                canon_name = canon_frame_name(str(n.get("disk_name", n.get("name", ""))))
                 if canon_name:
                     node_name_to_off[canon_name] = int(node_offsets[idx])
             out_meta.clear()
@@ -7422,8 +7475,8 @@ def _ped_known_hanim_maps(import_type_hint: Optional[int]) -> Tuple[Dict[str, in
         )
     else:
         name_sequence = tuple(canon_frame_name(n) for n in commonBoneOrder)
-        bone_ids = tuple(int(v) if int(v) < 256 else 0xFF for v in kamBoneID)
-        bone_types = tuple(int(v) for v in kamBoneType)
+        bone_ids = _LCS_HANIM_BONE_IDS
+        bone_types = _LCS_HANIM_BONE_TYPES
 
     id_map: Dict[str, int] = {}
     type_map: Dict[str, int] = {}
@@ -7460,8 +7513,8 @@ def _ped_ps2_runtime_hierarchy_maps(import_type_hint: Optional[int]) -> Tuple[Di
         )
     else:
         name_sequence = tuple(canon_frame_name(n) for n in commonBoneOrder)
-        bone_ids = tuple(int(v) if int(v) < 256 else 0xFF for v in kamBoneID)
-        bone_types = tuple(int(v) for v in kamBoneType)
+        bone_ids = _LCS_HANIM_BONE_IDS
+        bone_types = _LCS_HANIM_BONE_TYPES
 
     id_map: Dict[str, int] = {}
     type_map: Dict[str, int] = {}
@@ -8004,8 +8057,8 @@ def _append_ps2_ped_hierarchy_block(
     if not entries:
         imp = int(ped_import_type_hint) if ped_import_type_hint is not None else 2
         if imp in (0, 1):
-            bone_ids = tuple(int(v) if int(v) < 256 else 0xFF for v in kamBoneID)
-            bone_types = tuple(int(v) for v in kamBoneType)
+            bone_ids = _LCS_HANIM_BONE_IDS
+            bone_types = _LCS_HANIM_BONE_TYPES
             entries = [(int(bid) & 0xFF, int(i) & 0xFF, int(bone_types[i]) & 0xFF) for i, bid in enumerate(bone_ids)]
         else:
             id_map, type_map = _ped_ps2_runtime_hierarchy_maps(ped_import_type_hint)
@@ -9440,6 +9493,7 @@ def write_simplemodel_ps2_ped_mdl(
             armature_obj=armature_obj,
             import_type_hint=import_type_hint,
             pending_frame_names=pending_frame_names,
+            out_meta=ped_frame_meta,
         )
     if not frames_offset:
         raise RuntimeError("PED export requires a valid frame tree. Failed to generate frames from the Blender armature.")
@@ -9746,6 +9800,59 @@ def write_simplemodel_ps2_ped_mdl(
 
     _write_mdl_export_log(filepath, mdl_kind="PED_PS2", export_context=export_context)
 
+_MH2_HEADER = struct.Struct("<4sIIIIIIIii")
+_MH2_ENTRY_INDEX = struct.Struct("<4I")
+_MH2_ENTRY = struct.Struct("<7I")
+_MH2_OBJECT_INFO = struct.Struct("<7I")
+_MH2_BONE_LINKS = struct.Struct("<6I")
+_MH2_MATRIX = struct.Struct("<16f")
+_MH2_SOURCE_TO_BLENDER = Matrix.Rotation(math.pi / 2.0, 4, "X")
+_MH2_BLENDER_TO_SOURCE = _MH2_SOURCE_TO_BLENDER.inverted()
+_MH2_SOURCE_TO_BLENDER_ARRAY = np.array(_MH2_SOURCE_TO_BLENDER, dtype=np.float64)
+_MH2_BLENDER_TO_SOURCE_ARRAY = np.array(_MH2_BLENDER_TO_SOURCE, dtype=np.float64)
+# Structured record dtypes keyed by (vertex element type, vertex stride).
+_MH2_VERTEX_RECORD_DTYPES = {}
+_MH2_MATERIAL = struct.Struct("<IB4B3x")
+_MH2_MATERIAL_ID_BOUNDS = struct.Struct("<6f")
+_MH2_MATERIAL_ID_RANGE = struct.Struct("<4H")
+_MH2_FACE = struct.Struct("<3H")
+_MH2_U32 = struct.Struct("<I")
+_MH2_VEC3 = struct.Struct("<3f")
+_MH2_UV = struct.Struct("<2f")
+_MH2_NORMAL = struct.Struct("<4h")
+_MH2_COLOR = struct.Struct("<4B")
+_MH2_WEIGHTS = struct.Struct("<4f")
+_MH2_BONE_INDICES = struct.Struct("<4B")
+_MH2_ZLIB_PROBE_OFFSETS = (0, 4, 8, 12, 16, 20, 24, 32)
+
+
+def read_pmlc_container(filepath):
+    import zlib
+
+    with open(filepath, "rb") as input_file:
+        raw_data = input_file.read()
+    if raw_data[:4] == b"PMLC":
+        return raw_data, False
+
+    raw_view = memoryview(raw_data)
+    for offset in _MH2_ZLIB_PROBE_OFFSETS:
+        if offset + 2 > len(raw_data):
+            continue
+        # Same header test zlib applies (deflate, window <= 32K, no preset
+        # dictionary, FCHECK), done on one u16 before paying for a decompress.
+        header = (raw_data[offset] << 8) | raw_data[offset + 1]
+        if (header & 0x8F20) != 0x0800 or header % 31:
+            continue
+        try:
+            decoded = zlib.decompress(raw_view[offset:])
+        except Exception:
+            continue
+        if decoded[:4] == b"PMLC":
+            return decoded, True
+
+    return raw_data, False
+
+
 class Manhunt2MdlReader:
     HEADER_SIZE = 0x28
     ENTRY_SIZE = 0x1C
@@ -9939,9 +10046,9 @@ class Manhunt2MdlReader:
                 if normalized_name and normalized_name not in self.preloaded_texture_lookup:
                     self.preloaded_texture_lookup[normalized_name] = image
 
-        self.file = None
         self.file_size = 0
         self.file_data = b""
+        self.file_view = memoryview(b"")
         self.file_was_compressed = False
         self.stem = os.path.splitext(os.path.basename(path))[0]
         self.collection = None
@@ -9951,12 +10058,13 @@ class Manhunt2MdlReader:
         self.object_infos = []
         self.imported_mesh_objects = []
         self.debug_log = []
-        self.source_to_blender = Matrix.Rotation(math.pi / 2.0, 4, "X")
-        self.blender_to_source = self.source_to_blender.inverted()
+        self.source_to_blender = _MH2_SOURCE_TO_BLENDER
+        self.blender_to_source = _MH2_BLENDER_TO_SOURCE
         self.entry_layout_name = ""
         self.asset_variant = "PC_RETAIL"
         self.bone_record_layout = dict(self.BONE_RECORD_LAYOUTS[0])
         self.object_header_layout_name = ""
+        self.entry_data_offset = 0
         self.root_bone_offset = 0
         self.bone_trans_idx_offs = 0
         self.first_objinfo_offs = 0
@@ -9964,13 +10072,12 @@ class Manhunt2MdlReader:
         self.header = None
         self.texture_file_index = None
         self.texture_image_cache = {}
+        self.material_table_cache = {}
 
     def run(self):
-        import io
-
         self.file_data, self.file_was_compressed = self.read_mdl_container(self.path)
         self.file_size = len(self.file_data)
-        self.file = io.BytesIO(self.file_data)
+        self.file_view = memoryview(self.file_data)
 
         self.read_header()
         self.read_entry()
@@ -9991,25 +10098,7 @@ class Manhunt2MdlReader:
         return imported_objects
 
     def read_mdl_container(self, filepath):
-        import zlib
-
-        with open(filepath, "rb") as input_file:
-            raw_data = input_file.read()
-        if raw_data[:4] == b"PMLC":
-            return raw_data, False
-
-        decompression_offsets = (0, 4, 8, 12, 16, 20, 24, 32)
-        for offset in decompression_offsets:
-            if offset >= len(raw_data):
-                continue
-            try:
-                decoded = zlib.decompress(raw_data[offset:])
-            except Exception:
-                continue
-            if decoded[:4] == b"PMLC":
-                return decoded, True
-
-        return raw_data, False
+        return read_pmlc_container(filepath)
 
     def is_valid_offset(self, value, minimum=0, size=1):
         try:
@@ -10034,14 +10123,16 @@ class Manhunt2MdlReader:
         except Exception:
             pass
 
-    def log(self, message):
-        text = str(message)
+    def log(self, message, *args):
+        # The buffered log is only printed or written out in debug mode, so skip formatting otherwise.
+        if not self.print_debug_log:
+            return
+        text = str(message).format(*args) if args else str(message)
         self.debug_log.append(text)
-        if self.print_debug_log:
-            try:
-                print(text)
-            except Exception:
-                pass
+        try:
+            print(text)
+        except Exception:
+            pass
 
     def ensure_text_block(self, name, text):
         try:
@@ -10063,20 +10154,18 @@ class Manhunt2MdlReader:
         try:
             with open(log_path, "w", encoding="utf-8") as output_file:
                 output_file.write(text)
-            self.log("MH2 import log written: {}".format(log_path))
+            self.log("MH2 import log written: {}", log_path)
             text = "\n".join(self.debug_log) + "\n"
         except Exception as exc:
-            self.log("MH2 import log write failed: {}".format(exc))
+            self.log("MH2 import log write failed: {}", exc)
             text = "\n".join(self.debug_log) + "\n"
         self.ensure_text_block("BLeeds_MH2_" + self.stem[:40], text)
 
     def read_header(self):
-        self.file.seek(0)
-        data = self.file.read(self.HEADER_SIZE)
-        if len(data) < self.HEADER_SIZE:
+        if self.file_size < self.HEADER_SIZE:
             raise ValueError("File is too small for a Manhunt 2 PMLC header")
 
-        header = struct.unpack("<4sIIIIIIIii", data)
+        header = _MH2_HEADER.unpack_from(self.file_view, 0)
         signature = header[0].decode("ascii", errors="replace")
         if signature != "PMLC":
             raise ValueError("Unsupported Manhunt 2 PMLC signature {!r}; expected PMLC".format(signature))
@@ -10087,36 +10176,31 @@ class Manhunt2MdlReader:
             raise ValueError("Manhunt 2 first entry index is outside the file")
 
         self.log("==== Manhunt 2 PMLC Import Log ====")
-        self.log("Source: {}".format(self.path))
-        self.log("Container compression: {}".format("zlib" if self.file_was_compressed else "none"))
-        self.log("Requested layout: {}".format(self.layout_mode))
-        self.log("Signature:           {}".format(signature))
-        self.log("Version:             0x{:08X}".format(header[1]))
-        self.log("File Size:           {} bytes".format(header[2]))
-        self.log("Decoded Size:        {} bytes".format(self.file_size))
-        self.log("Data Size:           {} bytes".format(header[3]))
-        self.log("Offset Table Start:  0x{:08X}".format(header[4]))
-        self.log("Num Table Entries:   {}".format(header[5]))
-        self.log("First Entry Offset:  0x{:08X}".format(first_entry_offset))
-        self.log("Last Entry Offset:   0x{:08X}".format(header[9] & 0xFFFFFFFF))
-
-        self.file.seek(first_entry_offset)
-        entry_index_data = self.file.read(16)
-        if len(entry_index_data) < 16:
-            raise ValueError("Manhunt 2 first entry index is truncated")
-
-        entry_index = struct.unpack("<4I", entry_index_data)
+        self.log("Source: {}", self.path)
+        self.log("Container compression: {}", "zlib" if self.file_was_compressed else "none")
+        self.log("Requested layout: {}", self.layout_mode)
+        self.log("Signature:           {}", signature)
+        self.log("Version:             0x{:08X}", header[1])
+        self.log("File Size:           {} bytes", header[2])
+        self.log("Decoded Size:        {} bytes", self.file_size)
+        self.log("Data Size:           {} bytes", header[3])
+        self.log("Offset Table Start:  0x{:08X}", header[4])
+        self.log("Num Table Entries:   {}", header[5])
+        self.log("First Entry Offset:  0x{:08X}", first_entry_offset)
+        self.log("Last Entry Offset:   0x{:08X}", header[9] & 0xFFFFFFFF)
+
+        entry_index = _MH2_ENTRY_INDEX.unpack_from(self.file_view, first_entry_offset)
         entry_data_offset = int(entry_index[2])
         if not self.is_valid_offset(entry_data_offset, 0x20, self.ENTRY_SIZE):
             raise ValueError("Manhunt 2 first entry data offset is outside the file")
 
         self.log("---- First Entry Index ----")
-        self.log("Next Entry Offset:   0x{:08X}".format(entry_index[0]))
-        self.log("Prev Entry Offset:   0x{:08X}".format(entry_index[1]))
-        self.log("Entry Data Offset:   0x{:08X}".format(entry_data_offset))
-        self.log("Zero Field:          {}".format(entry_index[3]))
+        self.log("Next Entry Offset:   0x{:08X}", entry_index[0])
+        self.log("Prev Entry Offset:   0x{:08X}", entry_index[1])
+        self.log("Entry Data Offset:   0x{:08X}", entry_data_offset)
+        self.log("Zero Field:          {}", entry_index[3])
 
-        self.file.seek(entry_data_offset)
+        self.entry_data_offset = entry_data_offset
 
     def create_import_collection(self):
         import bpy
@@ -10171,7 +10255,7 @@ class Manhunt2MdlReader:
             try:
                 setattr(root, property_name, property_value)
             except Exception as exc:
-                self.log("MH2 root property {!r} could not be written through RNA: {}".format(property_name, exc))
+                self.log("MH2 root property {!r} could not be written through RNA: {}", property_name, exc)
         root["bleeds_is_mdl_root"] = True
         root["bleeds_model_game"] = "MH2"
         root["bleeds_mdl_platform"] = platform
@@ -10211,50 +10295,40 @@ class Manhunt2MdlReader:
         if last_offset and not self.is_valid_offset(last_offset, 0x40, self.OBJECT_INFO_SIZE):
             return -500
 
-        current_position = self.file.tell()
         score = 0
         current_offset = int(first_offset)
         visited = set()
         count = 0
-        try:
-            while current_offset and current_offset not in visited and count < 64:
-                if not self.is_valid_offset(current_offset, 0x40, self.OBJECT_INFO_SIZE):
-                    score -= 10
-                    break
-                visited.add(current_offset)
-                self.file.seek(current_offset)
-                raw = self.file.read(self.OBJECT_INFO_SIZE)
-                if len(raw) < self.OBJECT_INFO_SIZE:
-                    score -= 10
-                    break
-                next_offset, previous_offset, parent_bone_offset, object_data_offset, flags, zero_field, object_type = struct.unpack("<7I", raw)
-                if self.is_valid_offset(object_data_offset, 0x40, self.OBJECT_HEADER_FIELD_END):
-                    score += 8
-                else:
-                    score -= 20
-                    break
-                if parent_bone_offset == 0 or self.is_valid_offset(parent_bone_offset, 0x40, 24):
-                    score += 2
-                if previous_offset == 0 or self.is_valid_offset(previous_offset, 0x20, 4):
-                    score += 1
-                count += 1
-                if current_offset == int(last_offset):
-                    score += 10
-                    break
-                if next_offset == 0 or next_offset == current_offset:
-                    break
-                current_offset = int(next_offset)
-            score += min(count, 16) * 2
-        finally:
-            self.file.seek(current_position)
+        while current_offset and current_offset not in visited and count < 64:
+            if not self.is_valid_offset(current_offset, 0x40, self.OBJECT_INFO_SIZE):
+                score -= 10
+                break
+            visited.add(current_offset)
+            next_offset, previous_offset, parent_bone_offset, object_data_offset, flags, zero_field, object_type = _MH2_OBJECT_INFO.unpack_from(self.file_view, current_offset)
+            if self.is_valid_offset(object_data_offset, 0x40, self.OBJECT_HEADER_FIELD_END):
+                score += 8
+            else:
+                score -= 20
+                break
+            if parent_bone_offset == 0 or self.is_valid_offset(parent_bone_offset, 0x40, 24):
+                score += 2
+            if previous_offset == 0 or self.is_valid_offset(previous_offset, 0x20, 4):
+                score += 1
+            count += 1
+            if current_offset == int(last_offset):
+                score += 10
+                break
+            if next_offset == 0 or next_offset == current_offset:
+                break
+            current_offset = int(next_offset)
+        score += min(count, 16) * 2
         return score
 
     def read_entry(self):
-        raw = self.file.read(self.ENTRY_SIZE)
-        if len(raw) < self.ENTRY_SIZE:
+        if not self.is_valid_offset(self.entry_data_offset, 0, self.ENTRY_SIZE):
             raise ValueError("Manhunt 2 entry header is truncated")
 
-        entry = struct.unpack("<7I", raw)
+        entry = _MH2_ENTRY.unpack_from(self.file_view, self.entry_data_offset)
         self.root_bone_offset = int(entry[0])
         self.bone_trans_idx_offs = int(entry[2])
 
@@ -10291,54 +10365,41 @@ class Manhunt2MdlReader:
         self.asset_variant = str(best_candidate["variant"])
 
         self.log("---- Entry ----")
-        self.log("Root Bone Offset:    0x{:08X}".format(self.root_bone_offset))
-        self.log("Bone Trans Idx Off:  0x{:08X}".format(self.bone_trans_idx_offs))
-        self.log("Object List Layout:  {} (score={})".format(self.entry_layout_name, best_score))
-        self.log("First ObjInfo Off:   0x{:08X}".format(self.first_objinfo_offs))
-        self.log("Last ObjInfo Off:    0x{:08X}".format(self.last_objinfo_offs))
+        self.log("Root Bone Offset:    0x{:08X}", self.root_bone_offset)
+        self.log("Bone Trans Idx Off:  0x{:08X}", self.bone_trans_idx_offs)
+        self.log("Object List Layout:  {} (score={})", self.entry_layout_name, best_score)
+        self.log("First ObjInfo Off:   0x{:08X}", self.first_objinfo_offs)
+        self.log("Last ObjInfo Off:    0x{:08X}", self.last_objinfo_offs)
 
     def decode_bone_matrix(self, block, matrix_offset):
         if matrix_offset + 64 > len(block):
-            return None, None
+            return None
         try:
-            raw = struct.unpack_from("<16f", block, matrix_offset)
+            raw = _MH2_MATRIX.unpack_from(block, matrix_offset)
         except Exception:
-            return None, None
+            return None
         if not all(math.isfinite(value) and abs(value) < 100000000.0 for value in raw):
-            return None, None
-        source_matrix = Matrix((
-            (raw[0], raw[4], raw[8], raw[12]),
-            (raw[1], raw[5], raw[9], raw[13]),
-            (raw[2], raw[6], raw[10], raw[14]),
-            (raw[3], raw[7], raw[11], raw[15]),
-        ))
-        return source_matrix, self.source_matrix_to_blender(source_matrix)
+            return None
+        return Matrix((raw[0:4], raw[4:8], raw[8:12], raw[12:16])).transposed()
 
     def score_bone_record_layout(self, layout):
-        if not self.is_valid_offset(self.root_bone_offset, 0x40, int(layout["record_size"])):
-            return -1000
-        current_position = self.file.tell()
-        try:
-            self.file.seek(self.root_bone_offset)
-            block = self.file.read(int(layout["record_size"]))
-        finally:
-            self.file.seek(current_position)
-        if len(block) < int(layout["record_size"]):
+        record_size = int(layout["record_size"])
+        if not self.is_valid_offset(self.root_bone_offset, 0x40, record_size):
             return -1000
+        block = self.file_view[self.root_bone_offset:self.root_bone_offset + record_size]
 
-        try:
-            pointers = struct.unpack_from("<6I", block, 0)
-        except Exception:
-            return -1000
-        name_start = int(layout["name_offset"])
-        name_end = name_start + int(layout["name_size"])
-        name_bytes = block[name_start:name_end].split(b"\x00", 1)[0]
+        pointers = _MH2_BONE_LINKS.unpack_from(block, 0)
+        name_bytes = self.read_fixed_string_bytes(
+            self.root_bone_offset + int(layout["name_offset"]),
+            int(layout["name_size"]),
+        )
         printable_count = sum(1 for value in name_bytes if 32 <= value < 127)
         score = printable_count * 2
         if name_bytes and printable_count == len(name_bytes):
             score += 20
 
-        source_matrix, blender_matrix = self.decode_bone_matrix(block, int(layout["matrix_offset"]))
+        # Layout scoring only inspects the source-space matrix, so no basis change is applied here.
+        source_matrix = self.decode_bone_matrix(block, int(layout["matrix_offset"]))
         if source_matrix is None:
             return -500
         try:
@@ -10383,62 +10444,98 @@ class Manhunt2MdlReader:
         if self.layout_mode == "DETECT" and best_layout["asset_variant"] == "PSP_BETA":
             self.asset_variant = "PSP_BETA"
         self.log(
-            "Bone Record Layout: {} size={} matrix=0x{:X} score={}".format(
-                best_layout["name"],
-                best_layout["record_size"],
-                best_layout["matrix_offset"],
-                best_score,
-            )
+            "Bone Record Layout: {} size={} matrix=0x{:X} score={}",
+            best_layout["name"],
+            best_layout["record_size"],
+            best_layout["matrix_offset"],
+            best_score,
         )
 
     def is_valid_bone_offset(self, value):
         record_size = int(self.bone_record_layout.get("record_size", 192))
         return self.is_valid_offset(value, 0x40, record_size)
 
-    def read_bones(self):
-        if self.is_valid_bone_offset(self.root_bone_offset):
-            self.read_bone_record(self.root_bone_offset, 0)
+    def scan_bone_links(self, invalid_offsets):
+        visited_offsets = set()
+        bone_links = []
+        pending_records = [(self.root_bone_offset, 0)]
+        while pending_records:
+            offset, depth = pending_records.pop()
+            if (
+                depth > 4096
+                or offset in visited_offsets
+                or offset in invalid_offsets
+                or not self.is_valid_bone_offset(offset)
+            ):
+                continue
+            visited_offsets.add(offset)
+            links = _MH2_BONE_LINKS.unpack_from(self.file_view, offset)
+            bone_links.append((int(offset), links))
+            sibling_offset = links[1]
+            child_offset = links[4]
+            # Siblings go on the stack first so each child subtree is read before them.
+            if self.is_valid_bone_offset(sibling_offset):
+                pending_records.append((sibling_offset, depth + 1))
+            if self.is_valid_bone_offset(child_offset):
+                pending_records.append((child_offset, depth + 1))
+        return bone_links
+
+    def gather_bone_matrices(self, bone_offsets):
+        matrix_offset = int(self.bone_record_layout["matrix_offset"])
+        if matrix_offset + 64 > int(self.bone_record_layout["record_size"]):
+            return np.zeros((len(bone_offsets), 16), dtype=np.float32), np.zeros(len(bone_offsets), dtype=bool)
+        file_bytes = np.frombuffer(self.file_view, dtype=np.uint8)
+        byte_positions = np.asarray(bone_offsets, dtype=np.int64)[:, None] + (matrix_offset + np.arange(64))
+        raw_matrices = file_bytes[byte_positions].view("<f4").reshape(len(bone_offsets), 16)
+        valid = np.all(np.isfinite(raw_matrices) & (np.abs(raw_matrices) < 100000000.0), axis=1)
+        return raw_matrices, valid
 
-    def read_bone_record(self, offset, depth):
-        if depth > 4096 or offset in self.bone_map or not self.is_valid_bone_offset(offset):
+    def read_bones(self):
+        # Phase one follows only the 24-byte link headers; phase two gathers every bone matrix at once.
+        bone_links = self.scan_bone_links(())
+        if not bone_links:
             return
+        raw_matrices, valid = self.gather_bone_matrices([offset for offset, links in bone_links])
+        if not np.all(valid):
+            # A record with a corrupt matrix is dropped along with anything only reachable through it.
+            invalid_offsets = {bone_links[index][0] for index in np.flatnonzero(~valid).tolist()}
+            row_by_offset = {offset: index for index, (offset, links) in enumerate(bone_links)}
+            bone_links = self.scan_bone_links(invalid_offsets)
+            raw_matrices = raw_matrices[[row_by_offset[offset] for offset, links in bone_links]]
 
         layout = self.bone_record_layout
-        self.file.seek(offset)
-        block = self.file.read(int(layout["record_size"]))
-        if len(block) < int(layout["record_size"]):
-            return
+        bone_infos = []
+        for offset, links in bone_links:
+            dispatch_or_hash, sibling_offset, parent_offset, root_offset, child_offset, anim_data_idx_offset = links
+            name = self.read_fixed_string_bytes(
+                offset + int(layout["name_offset"]),
+                int(layout["name_size"]),
+            ).decode("ascii", errors="replace").strip()
+            bone_info = {
+                "name": name,
+                "dispatch_or_hash": int(dispatch_or_hash),
+                "parent_offset": int(parent_offset),
+                "root_offset": int(root_offset),
+                "subbone_offset": int(child_offset),
+                "sibling_offset": int(sibling_offset),
+                "anim_data_idx_offset": int(anim_data_idx_offset),
+            }
+            self.bone_map[offset] = bone_info
+            bone_infos.append(bone_info)
+            if self.print_debug_log:
+                self.log(
+                    "MH2 Bone 0x{:08X}: name={!r} sibling=0x{:08X} parent=0x{:08X} child=0x{:08X}",
+                    offset, name, sibling_offset, parent_offset, child_offset,
+                )
+        self.convert_bone_matrices(bone_infos, raw_matrices)
 
-        dispatch_or_hash, sibling_offset, parent_offset, root_offset, child_offset, anim_data_idx_offset = struct.unpack_from("<6I", block, 0)
-        name_start = int(layout["name_offset"])
-        name_end = name_start + int(layout["name_size"])
-        name = block[name_start:name_end].split(b"\x00", 1)[0].decode("ascii", errors="replace").strip()
-        source_matrix, blender_matrix = self.decode_bone_matrix(block, int(layout["matrix_offset"]))
-        if source_matrix is None:
+    def convert_bone_matrices(self, bone_infos, raw_matrices):
+        if not bone_infos:
             return
-
-        self.bone_map[int(offset)] = {
-            "name": name,
-            "dispatch_or_hash": int(dispatch_or_hash),
-            "parent_offset": int(parent_offset),
-            "root_offset": int(root_offset),
-            "subbone_offset": int(child_offset),
-            "sibling_offset": int(sibling_offset),
-            "anim_data_idx_offset": int(anim_data_idx_offset),
-            "source_matrix": source_matrix,
-            "matrix": blender_matrix,
-        }
-
-        self.log(
-            "MH2 Bone 0x{:08X}: name={!r} sibling=0x{:08X} parent=0x{:08X} child=0x{:08X}".format(
-                offset, name, sibling_offset, parent_offset, child_offset
-            )
-        )
-
-        if self.is_valid_bone_offset(child_offset):
-            self.read_bone_record(child_offset, depth + 1)
-        if self.is_valid_bone_offset(sibling_offset):
-            self.read_bone_record(sibling_offset, depth + 1)
+        source_matrices = np.asarray(raw_matrices, dtype=np.float64).reshape(len(bone_infos), 4, 4).transpose(0, 2, 1)
+        blender_matrices = _MH2_SOURCE_TO_BLENDER_ARRAY @ source_matrices @ _MH2_BLENDER_TO_SOURCE_ARRAY
+        for bone_info, blender_matrix in zip(bone_infos, blender_matrices.tolist()):
+            bone_info["matrix"] = Matrix(blender_matrix)
 
     def build_armature(self):
         import bpy
@@ -10454,9 +10551,30 @@ class Manhunt2MdlReader:
             pass
         self.run_mode_set("EDIT")
 
+        # Heads, tails and roll axes for every bone come from one pass over the stacked matrices:
+        # the tail sits 0.05 along the bone's local Y axis, falling back to world Z when Y is degenerate.
+        bone_matrices = np.array(
+            [bone_info["matrix"] for bone_info in self.bone_map.values()],
+            dtype=np.float64,
+        ).reshape(-1, 4, 4)
+        heads = bone_matrices[:, :3, 3]
+        y_axes = bone_matrices[:, :3, 1].copy()
+        y_lengths = np.sqrt(np.sum(y_axes * y_axes, axis=1))
+        degenerate = y_lengths < 0.000001
+        y_axes[degenerate] = (0.0, 0.0, 1.0)
+        y_lengths[degenerate] = 1.0
+        tails = heads + y_axes / y_lengths[:, None] * 0.05
+        z_axes = bone_matrices[:, :3, 2]
+
         edit_bones_by_offset = {}
+        pending_parents = []
         used_names = set()
-        for offset, bone_info in self.bone_map.items():
+        for (offset, bone_info), head, tail, z_axis in zip(
+            self.bone_map.items(),
+            heads.tolist(),
+            tails.tolist(),
+            z_axes.tolist(),
+        ):
             bone_name = bone_info["name"] or "Bone_{:08X}".format(offset)
             original_name = bone_name
             suffix_index = 1
@@ -10467,26 +10585,19 @@ class Manhunt2MdlReader:
             bone_info["name"] = bone_name
 
             edit_bone = armature.edit_bones.new(bone_name)
-            head = bone_info["matrix"].to_translation()
-            y_axis = bone_info["matrix"].to_3x3() @ Vector((0.0, 1.0, 0.0))
-            if y_axis.length < 0.000001:
-                y_axis = Vector((0.0, 0.0, 1.0))
-            tail = head + y_axis.normalized() * 0.05
-            if (tail - head).length < 0.000001:
-                tail = head + Vector((0.0, 0.0, 0.05))
             edit_bone.head = head
             edit_bone.tail = tail
             try:
-                z_axis = bone_info["matrix"].to_3x3() @ Vector((0.0, 0.0, 1.0))
                 edit_bone.align_roll(z_axis)
             except Exception:
                 pass
             edit_bones_by_offset[offset] = edit_bone
+            pending_parents.append((edit_bone, bone_info["parent_offset"]))
 
-        for offset, bone_info in self.bone_map.items():
-            parent_offset = bone_info["parent_offset"]
-            if parent_offset in edit_bones_by_offset:
-                edit_bones_by_offset[offset].parent = edit_bones_by_offset[parent_offset]
+        for edit_bone, parent_offset in pending_parents:
+            parent_bone = edit_bones_by_offset.get(parent_offset)
+            if parent_bone is not None:
+                edit_bone.parent = parent_bone
 
         self.run_mode_set("OBJECT")
 
@@ -10517,16 +10628,12 @@ class Manhunt2MdlReader:
 
         while current_offset and current_offset not in visited:
             if not self.is_valid_offset(current_offset, 0x40, self.OBJECT_INFO_SIZE):
-                self.log("Object-info traversal stopped at invalid offset 0x{:08X}".format(current_offset))
+                self.log("Object-info traversal stopped at invalid offset 0x{:08X}", current_offset)
                 break
             visited.add(current_offset)
-            self.file.seek(current_offset)
-            raw = self.file.read(self.OBJECT_INFO_SIZE)
-            if len(raw) < self.OBJECT_INFO_SIZE:
-                break
-            next_offset, previous_offset, parent_bone_offset, object_data_offset, flags, zero_field, object_type = struct.unpack("<7I", raw)
+            next_offset, previous_offset, parent_bone_offset, object_data_offset, flags, zero_field, object_type = _MH2_OBJECT_INFO.unpack_from(self.file_view, current_offset)
             if not self.is_valid_offset(object_data_offset, 0x40, self.OBJECT_HEADER_FIELD_END):
-                self.log("Object-info traversal stopped: object data 0x{:08X} is invalid".format(object_data_offset))
+                self.log("Object-info traversal stopped: object data 0x{:08X} is invalid", object_data_offset)
                 break
 
             object_info = {
@@ -10539,15 +10646,15 @@ class Manhunt2MdlReader:
                 "object_type": int(object_type),
             }
             object_infos.append(object_info)
-            self.log(
-                "MH2 ObjInfo[{:02d}] info=0x{:08X} object=0x{:08X} parent_bone=0x{:08X} next=0x{:08X}".format(
+            if self.print_debug_log:
+                self.log(
+                    "MH2 ObjInfo[{:02d}] info=0x{:08X} object=0x{:08X} parent_bone=0x{:08X} next=0x{:08X}",
                     len(object_infos) - 1,
                     current_offset,
                     object_data_offset,
                     parent_bone_offset,
                     next_offset,
                 )
-            )
 
             if current_offset == last_offset:
                 break
@@ -10575,7 +10682,7 @@ class Manhunt2MdlReader:
             field_offset = int(layout[field_name])
             if field_offset < 0 or field_offset + 4 > len(header):
                 return None
-            values[field_name] = struct.unpack_from("<I", header, field_offset)[0]
+            values[field_name] = _MH2_U32.unpack_from(header, field_offset)[0]
 
         if values["vertex_stride"] <= 0:
             values["vertex_stride"] = int(
@@ -10639,8 +10746,7 @@ class Manhunt2MdlReader:
         return score
 
     def detect_object_header_layout(self, object_offset):
-        self.file.seek(object_offset)
-        header = self.file.read(max(self.OBJECT_HEADER_SIZE_CANDIDATES) + 16)
+        header = self.file_view[object_offset:object_offset + max(self.OBJECT_HEADER_SIZE_CANDIDATES) + 16]
         if len(header) < self.OBJECT_HEADER_FIELD_END:
             return None, None, None
 
@@ -10690,7 +10796,7 @@ class Manhunt2MdlReader:
         if offset < 0 or offset + 12 > len(data):
             return -1000
         try:
-            values = struct.unpack_from("<3f", data, offset)
+            values = _MH2_VEC3.unpack_from(data, offset)
         except Exception:
             return -1000
         if not all(math.isfinite(value) and abs(value) < 100000.0 for value in values):
@@ -10709,7 +10815,7 @@ class Manhunt2MdlReader:
 
     def detect_vertex_position_offset(self, data):
         candidates = (0, 4, 8)
-        first_word = struct.unpack_from("<I", data, 0)[0] if len(data) >= 4 else 0
+        first_word = _MH2_U32.unpack_from(data, 0)[0] if len(data) >= 4 else 0
         best_offset = 0
         best_score = -100000
         for offset in candidates:
@@ -10746,81 +10852,71 @@ class Manhunt2MdlReader:
         if vertex_end > self.file_size:
             return -100000
 
-        current_position = self.file.tell()
+        file_view = self.file_view
         score = 0
-        try:
-            if num_material_ids > 0:
-                material_record_start = int(object_offset) + int(header_size)
-                self.file.seek(material_record_start)
-                valid_material_records = 0
-                covered_face_indices = 0
-                material_record_sample_count = min(num_material_ids, 64)
-                for material_record_index in range(material_record_sample_count):
-                    material_record = self.file.read(int(material_id_size))
-                    if len(material_record) < min(32, int(material_id_size)):
-                        break
-                    try:
-                        bounds = struct.unpack_from("<6f", material_record, 0)
-                        record_face_indices, material_index, start_face_index, unknown = struct.unpack_from("<4H", material_record, 24)
-                    except Exception:
-                        continue
-                    bounds_valid = all(math.isfinite(value) and abs(value) < 1000000.0 for value in bounds)
-                    range_valid = (
-                        int(record_face_indices) % 3 == 0
-                        and int(record_face_indices) <= num_face_indices
-                        and int(start_face_index) <= num_face_indices
-                        and int(start_face_index) + int(record_face_indices) <= num_face_indices
-                    )
-                    if bounds_valid and range_valid:
-                        valid_material_records += 1
-                        covered_face_indices += int(record_face_indices)
-                score += valid_material_records * 6
-                score -= max(0, material_record_sample_count - valid_material_records) * 4
-                if covered_face_indices == num_face_indices:
-                    score += 24
-                elif 0 < covered_face_indices <= num_face_indices:
-                    score += 4
-                else:
-                    score -= 16
-
-            self.file.seek(face_start)
-            face_sample_count = min(triangle_count, 48)
-            valid_faces = 0
-            nondegenerate_faces = 0
-            for face_index in range(face_sample_count):
-                raw_face = self.file.read(6)
-                if len(raw_face) < 6:
-                    break
-                a, b, c = struct.unpack("<3H", raw_face)
-                if a < num_vertices and b < num_vertices and c < num_vertices:
-                    valid_faces += 1
-                    if a != b and b != c and a != c:
-                        nondegenerate_faces += 1
-            degenerate_faces = valid_faces - nondegenerate_faces
-            score += valid_faces * 3
-            score += nondegenerate_faces * 6
-            score -= degenerate_faces * 4
-            score -= max(0, face_sample_count - valid_faces) * 3
-
-            vertex_sample_count = min(num_vertices, 48)
-            valid_vertices = 0
-            packed_rows = 0
-            self.file.seek(vertex_start)
-            for vertex_index in range(vertex_sample_count):
-                row = self.file.read(vertex_stride)
-                if len(row) < vertex_stride:
+        if num_material_ids > 0:
+            material_record_start = int(object_offset) + int(header_size)
+            valid_material_records = 0
+            covered_face_indices = 0
+            material_record_sample_count = min(num_material_ids, 64)
+            for material_record_index in range(material_record_sample_count):
+                material_record_offset = material_record_start + material_record_index * int(material_id_size)
+                if material_record_offset + min(32, int(material_id_size)) > self.file_size:
                     break
-                position_offset = self.detect_vertex_position_offset(row)
-                if self.score_position_at_offset(row, position_offset) > 0:
-                    valid_vertices += 1
-                if position_offset == 4:
-                    packed_rows += 1
-            score += valid_vertices * 5
-            score -= max(0, vertex_sample_count - valid_vertices) * 5
-            if packed_rows:
-                score += min(packed_rows, 8)
-        finally:
-            self.file.seek(current_position)
+                try:
+                    bounds = _MH2_MATERIAL_ID_BOUNDS.unpack_from(file_view, material_record_offset)
+                    record_face_indices, material_index, start_face_index, unknown = _MH2_MATERIAL_ID_RANGE.unpack_from(file_view, material_record_offset + 24)
+                except Exception:
+                    continue
+                bounds_valid = all(math.isfinite(value) and abs(value) < 1000000.0 for value in bounds)
+                range_valid = (
+                    int(record_face_indices) % 3 == 0
+                    and int(record_face_indices) <= num_face_indices
+                    and int(start_face_index) <= num_face_indices
+                    and int(start_face_index) + int(record_face_indices) <= num_face_indices
+                )
+                if bounds_valid and range_valid:
+                    valid_material_records += 1
+                    covered_face_indices += int(record_face_indices)
+            score += valid_material_records * 6
+            score -= max(0, material_record_sample_count - valid_material_records) * 4
+            if covered_face_indices == num_face_indices:
+                score += 24
+            elif 0 < covered_face_indices <= num_face_indices:
+                score += 4
+            else:
+                score -= 16
+
+        face_sample_count = min(triangle_count, 48)
+        valid_faces = 0
+        nondegenerate_faces = 0
+        for face_index in range(face_sample_count):
+            a, b, c = _MH2_FACE.unpack_from(file_view, face_start + face_index * 6)
+            if a < num_vertices and b < num_vertices and c < num_vertices:
+                valid_faces += 1
+                if a != b and b != c and a != c:
+                    nondegenerate_faces += 1
+        degenerate_faces = valid_faces - nondegenerate_faces
+        score += valid_faces * 3
+        score += nondegenerate_faces * 6
+        score -= degenerate_faces * 4
+        score -= max(0, face_sample_count - valid_faces) * 3
+
+        vertex_sample_count = min(num_vertices, 48)
+        valid_vertices = 0
+        packed_rows = 0
+        for vertex_index in range(vertex_sample_count):
+            row_start = vertex_start + vertex_index * vertex_stride
+            row = file_view[row_start:row_start + vertex_stride]
+            position_offset = self.detect_vertex_position_offset(row)
+            if self.score_position_at_offset(row, position_offset) > 0:
+                valid_vertices += 1
+            if position_offset == 4:
+                packed_rows += 1
+        score += valid_vertices * 5
+        score -= max(0, vertex_sample_count - valid_vertices) * 5
+        if packed_rows:
+            score += min(packed_rows, 8)
 
         is_retail_geometry = header_size == 180 and material_id_size == 44
         if is_retail_geometry:
@@ -10866,31 +10962,27 @@ class Manhunt2MdlReader:
         records = []
         if count <= 0:
             return records
-        current_position = self.file.tell()
-        try:
-            self.file.seek(int(object_offset) + int(header_size))
-            for material_index in range(int(count)):
-                row = self.file.read(int(record_size))
-                if len(row) < min(32, int(record_size)):
-                    break
-                try:
-                    bounds = struct.unpack_from("<6f", row, 0)
-                    num_face_indices, material_id, start_face_index, unknown = struct.unpack_from("<4H", row, 24)
-                except Exception:
-                    continue
-                records.append({
-                    "index": material_index,
-                    "bounds_min": tuple(bounds[:3]),
-                    "bounds_max": tuple(bounds[3:6]),
-                    "num_face_indices": int(num_face_indices),
-                    "num_faces": int(num_face_indices) // 3,
-                    "material_id": int(material_id),
-                    "start_face_index": int(start_face_index),
-                    "start_face": int(start_face_index) // 3,
-                    "unknown": int(unknown),
-                })
-        finally:
-            self.file.seek(current_position)
+        record_start = int(object_offset) + int(header_size)
+        for material_index in range(int(count)):
+            row_offset = record_start + material_index * int(record_size)
+            if row_offset + min(32, int(record_size)) > self.file_size:
+                break
+            try:
+                bounds = _MH2_MATERIAL_ID_BOUNDS.unpack_from(self.file_view, row_offset)
+                num_face_indices, material_id, start_face_index, unknown = _MH2_MATERIAL_ID_RANGE.unpack_from(self.file_view, row_offset + 24)
+            except Exception:
+                continue
+            records.append({
+                "index": material_index,
+                "bounds_min": tuple(bounds[:3]),
+                "bounds_max": tuple(bounds[3:6]),
+                "num_face_indices": int(num_face_indices),
+                "num_faces": int(num_face_indices) // 3,
+                "material_id": int(material_id),
+                "start_face_index": int(start_face_index),
+                "start_face": int(start_face_index) // 3,
+                "unknown": int(unknown),
+            })
         return records
 
     def uv_base_candidates(self, vertex_element_type, vertex_stride):
@@ -10912,25 +11004,18 @@ class Manhunt2MdlReader:
         candidates = self.uv_base_candidates(vertex_element_type, vertex_stride)
         if not candidates:
             return None
-        current_position = self.file.tell()
         best_offset = None
         best_score = -100000
-        try:
-            for base_offset in candidates:
-                valid = 0
-                varied = 0
-                previous = None
-                self.file.seek(vertex_start)
+        for base_offset in candidates:
+            valid = 0
+            varied = 0
+            previous = None
+            if int(base_offset) + 8 <= int(vertex_stride):
                 for vertex_index in range(min(int(count), 64)):
-                    row = self.file.read(vertex_stride)
-                    if len(row) < vertex_stride:
+                    row_start = int(vertex_start) + vertex_index * int(vertex_stride)
+                    if row_start + int(vertex_stride) > self.file_size:
                         break
-                    if int(base_offset) + 8 > len(row):
-                        continue
-                    try:
-                        uv = struct.unpack_from("<2f", row, int(base_offset))
-                    except Exception:
-                        continue
+                    uv = _MH2_UV.unpack_from(self.file_view, row_start + int(base_offset))
                     if not all(math.isfinite(value) and abs(value) < 10000.0 for value in uv):
                         continue
                     valid += 1
@@ -10940,19 +11025,19 @@ class Manhunt2MdlReader:
                     ):
                         varied += 1
                     previous = uv
-                score = valid * 3 + varied
-                if score > best_score:
-                    best_score = score
-                    best_offset = int(base_offset)
-        finally:
-            self.file.seek(current_position)
+            score = valid * 3 + varied
+            if score > best_score:
+                best_score = score
+                best_offset = int(base_offset)
         return best_offset
 
-    def convert_vertex_position(self, position, parent_matrix):
-        local_blender = self.source_vector_to_blender(position)
+    def vertex_position_matrix(self, parent_matrix):
         if parent_matrix is not None:
-            return parent_matrix @ local_blender
-        return local_blender
+            return parent_matrix @ self.source_to_blender
+        return self.source_to_blender
+
+    def convert_vertex_position(self, position, position_matrix):
+        return position_matrix @ Vector(position)
 
     def convert_vertex_normal(self, normal, parent_matrix):
         local_blender = self.source_vector_to_blender(normal)
@@ -10962,75 +11047,140 @@ class Manhunt2MdlReader:
             local_blender.normalize()
         return local_blender
 
-    def decode_exact_vertex_row(self, row, vertex_layout, parent_matrix):
-        position_offset = int(vertex_layout.get("position_offset", 0))
-        normal_offset = vertex_layout.get("normal_offset")
-        color_offset = vertex_layout.get("color_offset")
-        weight_offset = vertex_layout.get("weight_offset")
-        bone_index_offset = vertex_layout.get("bone_index_offset")
-        uv_offsets = tuple(int(offset) for offset in vertex_layout.get("uv_offsets", ()))
-
-        position = struct.unpack_from("<3f", row, position_offset)
-        if not all(math.isfinite(value) and abs(value) < 100000.0 for value in position):
-            raise ValueError("invalid vertex position")
-        output_position = self.convert_vertex_position(position, parent_matrix)
-
-        output_normal = None
-        if normal_offset is not None and int(normal_offset) + 8 <= len(row):
-            nx, ny, nz, normal_padding = struct.unpack_from("<4h", row, int(normal_offset))
-            output_normal = self.convert_vertex_normal(
-                (float(nx) / 32768.0, float(ny) / 32768.0, float(nz) / 32768.0),
-                parent_matrix,
-            )
-
-        output_color = None
-        if color_offset is not None and int(color_offset) + 4 <= len(row):
-            blue, green, red, alpha = struct.unpack_from("<4B", row, int(color_offset))
-            output_color = (
-                float(red) / 255.0,
-                float(green) / 255.0,
-                float(blue) / 255.0,
-                float(alpha) / 255.0,
+    def vertex_record_dtype(self, vertex_element_type, vertex_layout, vertex_stride):
+        dtype_key = (int(vertex_element_type), int(vertex_stride))
+        cached = _MH2_VERTEX_RECORD_DTYPES.get(dtype_key)
+        if cached is not None:
+            return cached
+
+        names = ["position"]
+        formats = [("<f4", (3,))]
+        offsets = [int(vertex_layout.get("position_offset", 0))]
+        if vertex_layout.get("normal_offset") is not None:
+            names.append("normal")
+            formats.append(("<i2", (4,)))
+            offsets.append(int(vertex_layout["normal_offset"]))
+        if vertex_layout.get("color_offset") is not None:
+            names.append("color")
+            formats.append(("u1", (4,)))
+            offsets.append(int(vertex_layout["color_offset"]))
+        for uv_layer_index, uv_offset in enumerate(vertex_layout.get("uv_offsets", ())):
+            names.append("uv{}".format(uv_layer_index))
+            formats.append(("<f4", (2,)))
+            offsets.append(int(uv_offset))
+        if vertex_layout.get("weight_offset") is not None and vertex_layout.get("bone_index_offset") is not None:
+            names.extend(("weights", "bone_indices"))
+            formats.extend((("<f4", (4,)), ("u1", (4,))))
+            offsets.extend((int(vertex_layout["weight_offset"]), int(vertex_layout["bone_index_offset"])))
+        record_dtype = np.dtype({
+            "names": names,
+            "formats": formats,
+            "offsets": offsets,
+            "itemsize": int(vertex_stride),
+        })
+        _MH2_VERTEX_RECORD_DTYPES[dtype_key] = record_dtype
+        return record_dtype
+
+    def read_exact_vertex_buffer(self, vertex_start, vertex_element_type, vertex_layout, vertex_stride, count, parent_matrix, uv_base_offset):
+        vertex_count = max(0, int(count))
+        available_count = min(vertex_count, max(0, self.file_size - int(vertex_start)) // int(vertex_stride))
+        uv_layer_count = len(tuple(vertex_layout.get("uv_offsets", ())))
+        records = np.frombuffer(
+            self.file_view,
+            dtype=self.vertex_record_dtype(vertex_element_type, vertex_layout, vertex_stride),
+            count=available_count,
+            offset=int(vertex_start),
+        )
+        field_names = records.dtype.names
+
+        positions = np.zeros((vertex_count, 3), dtype=np.float32)
+        normals = np.zeros((vertex_count, 3), dtype=np.float32)
+        normals[:, 2] = 1.0
+        colors = np.ones((vertex_count, 4), dtype=np.float32)
+        uv_layers = [np.zeros((vertex_count, 2), dtype=np.float32) for uv_layer_index in range(uv_layer_count)]
+        bone_indices = np.zeros((vertex_count, 4), dtype=np.uint8)
+        bone_weights = np.zeros((vertex_count, 4), dtype=np.float32)
+
+        source_positions = records["position"].astype(np.float64)
+        valid = np.all(np.isfinite(source_positions) & (np.abs(source_positions) < 100000.0), axis=1)
+        decoded = np.zeros(vertex_count, dtype=bool)
+        decoded[:available_count] = valid
+
+        basis = _MH2_SOURCE_TO_BLENDER_ARRAY[:3, :3]
+        translation = np.zeros(3, dtype=np.float64)
+        if parent_matrix is not None:
+            parent = np.array(parent_matrix, dtype=np.float64)
+            translation = parent[:3, 3]
+            basis = parent[:3, :3] @ basis
+        converted_positions = source_positions[valid] @ basis.T + translation
+        positions[decoded] = converted_positions
+
+        if "normal" in field_names:
+            source_normals = records["normal"][valid, :3].astype(np.float64) / 32768.0
+            converted = source_normals @ basis.T
+            lengths = np.sqrt(np.sum(converted * converted, axis=1))
+            normalize = lengths > 0.000001
+            converted[normalize] /= lengths[normalize, None]
+            normals[decoded] = converted
+        if "color" in field_names:
+            colors[decoded] = records["color"][valid][:, (2, 1, 0, 3)].astype(np.float64) / 255.0
+        for uv_layer_index, uv_layer in enumerate(uv_layers):
+            source_uvs = records["uv{}".format(uv_layer_index)][valid].astype(np.float64)
+            uv_valid = np.all(np.isfinite(source_uvs) & (np.abs(source_uvs) < 10000.0), axis=1)
+            output_uvs = np.zeros_like(source_uvs)
+            output_uvs[uv_valid, 0] = source_uvs[uv_valid, 0]
+            output_uvs[uv_valid, 1] = 1.0 - source_uvs[uv_valid, 1]
+            uv_layer[decoded] = output_uvs
+        if "weights" in field_names:
+            source_weights = records["weights"][valid].astype(np.float64)
+            bone_weights[decoded] = np.where(np.isfinite(source_weights) & (source_weights > 0.0), source_weights, 0.0)
+            bone_indices[decoded] = records["bone_indices"][valid]
+
+        invalid_vertex_indices = set(np.flatnonzero(~decoded).tolist())
+        active_weights = bone_weights.astype(np.float64)
+        active_weight_sums = np.where(active_weights > 0.000001, active_weights, 0.0).sum(axis=1)
+        weighted = active_weight_sums > 0.000001
+        has_skin_weights = bool(np.any(weighted))
+        if len(converted_positions):
+            min_value = converted_positions.min(axis=0)
+            max_value = converted_positions.max(axis=0)
+            bounds_text = "min=({:.6f},{:.6f},{:.6f}) max=({:.6f},{:.6f},{:.6f})".format(
+                min_value[0],
+                min_value[1],
+                min_value[2],
+                max_value[0],
+                max_value[1],
+                max_value[2],
             )
+        else:
+            bounds_text = "empty"
 
-        output_uvs = []
-        for uv_offset in uv_offsets:
-            if uv_offset + 8 > len(row):
-                output_uvs.append((0.0, 0.0))
-                continue
-            u_value, v_value = struct.unpack_from("<2f", row, uv_offset)
-            if not all(math.isfinite(value) and abs(value) < 10000.0 for value in (u_value, v_value)):
-                output_uvs.append((0.0, 0.0))
-                continue
-            output_uvs.append((float(u_value), 1.0 - float(v_value)))
-
-        output_bone_indices = None
-        output_bone_weights = None
-        if (
-            weight_offset is not None
-            and bone_index_offset is not None
-            and int(weight_offset) + 16 <= len(row)
-            and int(bone_index_offset) + 4 <= len(row)
-        ):
-            raw_weights = struct.unpack_from("<4f", row, int(weight_offset))
-            raw_indices = struct.unpack_from("<4B", row, int(bone_index_offset))
-            output_bone_indices = tuple(int(value) for value in raw_indices)
-            output_bone_weights = tuple(
-                float(value) if math.isfinite(value) and value > 0.0 else 0.0
-                for value in raw_weights
-            )
+        position_offset_counts = {}
+        if available_count:
+            position_offset_counts[int(vertex_layout.get("position_offset", 0))] = int(available_count)
 
         return (
-            output_position,
-            output_normal,
-            output_color,
-            output_uvs,
-            output_bone_indices,
-            output_bone_weights,
+            positions,
+            normals,
+            colors,
+            uv_layers,
+            bone_indices,
+            bone_weights,
+            {
+                "invalid_vertex_indices": invalid_vertex_indices,
+                "invalid_vertex_count": len(invalid_vertex_indices),
+                "position_offset_counts": position_offset_counts,
+                "uv_base_offset": uv_base_offset,
+                "uv_layer_count": len(uv_layers),
+                "has_skin_weights": has_skin_weights,
+                "weight_sum_min": float(active_weight_sums[weighted].min()) if has_skin_weights else 0.0,
+                "weight_sum_max": float(active_weight_sums[weighted].max()) if has_skin_weights else 0.0,
+                "vertex_layout_name": str(vertex_layout.get("name", "heuristic")),
+                "bounds_text": bounds_text,
+            },
         )
 
     def read_vertex_buffer(self, vertex_start, vertex_element_type, vertex_stride, count, parent_bone_info):
-        self.file.seek(vertex_start)
         parent_matrix = parent_bone_info.get("matrix") if parent_bone_info is not None else None
         vertex_layout = self.VERTEX_LAYOUT_BY_TYPE.get(int(vertex_element_type))
         use_exact_layout = (
@@ -11043,15 +11193,27 @@ class Manhunt2MdlReader:
             vertex_stride,
             count,
         )
-        self.file.seek(vertex_start)
-
-        vertices = []
-        normals = []
-        colors = []
-        uv_layer_count = len(tuple(vertex_layout.get("uv_offsets", ()))) if use_exact_layout else (1 if uv_base_offset is not None else 0)
-        uv_layers = [[] for uv_layer_index in range(uv_layer_count)]
-        bone_indices = []
-        bone_weights = []
+        if use_exact_layout:
+            return self.read_exact_vertex_buffer(
+                vertex_start,
+                vertex_element_type,
+                vertex_layout,
+                vertex_stride,
+                count,
+                parent_matrix,
+                uv_base_offset,
+            )
+        file_view = self.file_view
+        position_matrix = self.vertex_position_matrix(parent_matrix)
+
+        vertex_count = max(0, int(count))
+        vertices = [None] * vertex_count
+        normals = [None] * vertex_count
+        colors = [None] * vertex_count
+        uv_layer_count = 1 if uv_base_offset is not None else 0
+        uv_layers = [[(0.0, 0.0)] * vertex_count for uv_layer_index in range(uv_layer_count)]
+        bone_indices = [(0, 0, 0, 0)] * vertex_count
+        bone_weights = [(0.0, 0.0, 0.0, 0.0)] * vertex_count
         invalid_vertex_indices = set()
         position_offset_counts = {}
         min_value = Vector((999999.0, 999999.0, 999999.0))
@@ -11060,79 +11222,56 @@ class Manhunt2MdlReader:
         weight_sum_min = 999999.0
         weight_sum_max = -999999.0
 
-        for vertex_index in range(int(count)):
-            row = self.file.read(int(vertex_stride))
+        for vertex_index in range(vertex_count):
+            row_start = int(vertex_start) + vertex_index * int(vertex_stride)
+            row = file_view[row_start:row_start + int(vertex_stride)]
             if len(row) < int(vertex_stride):
-                invalid_vertex_indices.update(range(vertex_index, int(count)))
-                while len(vertices) < int(count):
-                    vertices.append(Vector((0.0, 0.0, 0.0)))
-                    normals.append(Vector((0.0, 0.0, 1.0)))
-                    colors.append((1.0, 1.0, 1.0, 1.0))
-                    for uv_layer in uv_layers:
-                        uv_layer.append((0.0, 0.0))
-                    bone_indices.append((0, 0, 0, 0))
-                    bone_weights.append((0.0, 0.0, 0.0, 0.0))
+                invalid_vertex_indices.update(range(vertex_index, vertex_count))
+                for missing_index in range(vertex_index, vertex_count):
+                    vertices[missing_index] = Vector((0.0, 0.0, 0.0))
+                    normals[missing_index] = Vector((0.0, 0.0, 1.0))
+                    colors[missing_index] = (1.0, 1.0, 1.0, 1.0)
                 break
 
-            if use_exact_layout:
-                position_offset = int(vertex_layout.get("position_offset", 0))
-                try:
-                    (
-                        output_position,
-                        output_normal,
-                        output_color,
-                        output_uvs,
-                        output_bone_indices,
-                        output_bone_weights,
-                    ) = self.decode_exact_vertex_row(row, vertex_layout, parent_matrix)
-                except Exception:
-                    output_position = Vector((0.0, 0.0, 0.0))
-                    output_normal = Vector((0.0, 0.0, 1.0))
-                    output_color = (1.0, 1.0, 1.0, 1.0)
-                    output_uvs = [(0.0, 0.0) for uv_layer_index in range(uv_layer_count)]
-                    output_bone_indices = (0, 0, 0, 0)
-                    output_bone_weights = (0.0, 0.0, 0.0, 0.0)
-                    invalid_vertex_indices.add(vertex_index)
-            else:
-                position_offset = self.detect_vertex_position_offset(row)
-                try:
-                    position = struct.unpack_from("<3f", row, position_offset)
-                except Exception:
-                    position = (0.0, 0.0, 0.0)
-                    invalid_vertex_indices.add(vertex_index)
-                if not all(math.isfinite(value) and abs(value) < 100000.0 for value in position):
-                    position = (0.0, 0.0, 0.0)
-                    invalid_vertex_indices.add(vertex_index)
-                output_position = self.convert_vertex_position(position, parent_matrix)
-                output_normal = Vector((0.0, 0.0, 1.0))
-                output_color = (1.0, 1.0, 1.0, 1.0)
-                output_uvs = []
-                if uv_base_offset is not None:
-                    uv_value = (0.0, 0.0)
-                    if int(uv_base_offset) + 8 <= len(row):
-                        try:
-                            decoded_uv = struct.unpack_from("<2f", row, int(uv_base_offset))
-                            if all(math.isfinite(value) and abs(value) < 10000.0 for value in decoded_uv):
-                                uv_value = (float(decoded_uv[0]), 1.0 - float(decoded_uv[1]))
-                        except Exception:
-                            pass
-                    output_uvs.append(uv_value)
-                output_bone_indices = (0, 0, 0, 0)
-                output_bone_weights = (0.0, 0.0, 0.0, 0.0)
+            position_offset = self.detect_vertex_position_offset(row)
+            try:
+                position = _MH2_VEC3.unpack_from(row, position_offset)
+            except Exception:
+                position = (0.0, 0.0, 0.0)
+                invalid_vertex_indices.add(vertex_index)
+            if not all(math.isfinite(value) and abs(value) < 100000.0 for value in position):
+                position = (0.0, 0.0, 0.0)
+                invalid_vertex_indices.add(vertex_index)
+            output_position = self.convert_vertex_position(position, position_matrix)
+            output_normal = Vector((0.0, 0.0, 1.0))
+            output_color = (1.0, 1.0, 1.0, 1.0)
+            output_uvs = []
+            if uv_base_offset is not None:
+                uv_value = (0.0, 0.0)
+                if int(uv_base_offset) + 8 <= len(row):
+                    try:
+                        decoded_uv = _MH2_UV.unpack_from(row, int(uv_base_offset))
+                        if all(math.isfinite(value) and abs(value) < 10000.0 for value in decoded_uv):
+                            uv_value = (float(decoded_uv[0]), 1.0 - float(decoded_uv[1]))
+                    except Exception:
+                        pass
+                output_uvs.append(uv_value)
+            output_bone_indices = (0, 0, 0, 0)
+            output_bone_weights = (0.0, 0.0, 0.0, 0.0)
 
             position_offset_counts[position_offset] = position_offset_counts.get(position_offset, 0) + 1
-            vertices.append(output_position)
-            normals.append(output_normal if output_normal is not None else Vector((0.0, 0.0, 1.0)))
-            colors.append(output_color if output_color is not None else (1.0, 1.0, 1.0, 1.0))
-            for uv_layer_index, uv_layer in enumerate(uv_layers):
-                uv_layer.append(output_uvs[uv_layer_index] if uv_layer_index < len(output_uvs) else (0.0, 0.0))
+            vertices[vertex_index] = output_position
+            normals[vertex_index] = output_normal if output_normal is not None else Vector((0.0, 0.0, 1.0))
+            colors[vertex_index] = output_color if output_color is not None else (1.0, 1.0, 1.0, 1.0)
+            for uv_layer_index in range(min(uv_layer_count, len(output_uvs))):
+                uv_layers[uv_layer_index][vertex_index] = output_uvs[uv_layer_index]
 
             if output_bone_indices is None:
                 output_bone_indices = (0, 0, 0, 0)
             if output_bone_weights is None:
                 output_bone_weights = (0.0, 0.0, 0.0, 0.0)
-            bone_indices.append(tuple(output_bone_indices))
-            bone_weights.append(tuple(output_bone_weights))
+            bone_indices[vertex_index] = tuple(output_bone_indices)
+            bone_weights[vertex_index] = tuple(output_bone_weights)
 
             active_weight_sum = sum(
                 float(weight)
@@ -11165,18 +11304,26 @@ class Manhunt2MdlReader:
         else:
             bounds_text = "empty"
 
-        return vertices, normals, colors, uv_layers, bone_indices, bone_weights, {
-            "invalid_vertex_indices": invalid_vertex_indices,
-            "invalid_vertex_count": len(invalid_vertex_indices),
-            "position_offset_counts": position_offset_counts,
-            "uv_base_offset": uv_base_offset,
-            "uv_layer_count": len(uv_layers),
-            "has_skin_weights": bool(has_skin_weights),
-            "weight_sum_min": 0.0 if weight_sum_min == 999999.0 else float(weight_sum_min),
-            "weight_sum_max": 0.0 if weight_sum_max == -999999.0 else float(weight_sum_max),
-            "vertex_layout_name": str(vertex_layout.get("name", "heuristic")) if use_exact_layout else "heuristic",
-            "bounds_text": bounds_text,
-        }
+        return (
+            np.array(vertices, dtype=np.float32).reshape(vertex_count, 3),
+            np.array(normals, dtype=np.float32).reshape(vertex_count, 3),
+            np.array(colors, dtype=np.float32).reshape(vertex_count, 4),
+            [np.array(uv_layer, dtype=np.float32).reshape(vertex_count, 2) for uv_layer in uv_layers],
+            np.array(bone_indices, dtype=np.uint8).reshape(vertex_count, 4),
+            np.array(bone_weights, dtype=np.float32).reshape(vertex_count, 4),
+            {
+                "invalid_vertex_indices": invalid_vertex_indices,
+                "invalid_vertex_count": len(invalid_vertex_indices),
+                "position_offset_counts": position_offset_counts,
+                "uv_base_offset": uv_base_offset,
+                "uv_layer_count": len(uv_layers),
+                "has_skin_weights": bool(has_skin_weights),
+                "weight_sum_min": 0.0 if weight_sum_min == 999999.0 else float(weight_sum_min),
+                "weight_sum_max": 0.0 if weight_sum_max == -999999.0 else float(weight_sum_max),
+                "vertex_layout_name": "heuristic",
+                "bounds_text": bounds_text,
+            },
+        )
 
     def read_materials(self, material_offset, num_materials):
         materials = []
@@ -11190,35 +11337,34 @@ class Manhunt2MdlReader:
         ):
             return materials
 
-        current_position = self.file.tell()
-        try:
-            self.file.seek(material_offset)
-            for material_index in range(int(num_materials)):
-                row = self.file.read(int(self.MATERIAL_RECORD_SIZE))
-                if len(row) < int(self.MATERIAL_RECORD_SIZE):
-                    break
-                texture_offset, loaded, red, green, blue, alpha = struct.unpack("<IB4B3x", row)
-                texture_name = self.read_c_string(texture_offset) if self.is_valid_offset(texture_offset, 0x40, 1) else ""
-                materials.append({
-                    "index": int(material_index),
-                    "tex_name": texture_name,
-                    "color": (int(red), int(green), int(blue), int(alpha)),
-                    "loaded": int(loaded),
-                    "record_offset": int(material_offset) + int(material_index) * int(self.MATERIAL_RECORD_SIZE),
-                })
-        finally:
-            self.file.seek(current_position)
-        return materials
+        # Object headers usually share one model-wide material table; decode it only once.
+        table_key = (int(material_offset), int(num_materials))
+        cached_materials = self.material_table_cache.get(table_key)
+        if cached_materials is not None:
+            return list(cached_materials)
+
+        for material_index in range(int(num_materials)):
+            record_offset = int(material_offset) + int(material_index) * int(self.MATERIAL_RECORD_SIZE)
+            texture_offset, loaded, red, green, blue, alpha = _MH2_MATERIAL.unpack_from(self.file_view, record_offset)
+            texture_name = self.read_c_string(texture_offset) if self.is_valid_offset(texture_offset, 0x40, 1) else ""
+            materials.append({
+                "index": int(material_index),
+                "tex_name": texture_name,
+                "color": (int(red), int(green), int(blue), int(alpha)),
+                "loaded": int(loaded),
+                "record_offset": record_offset,
+            })
+        self.material_table_cache[table_key] = materials
+        return list(materials)
 
     def read_object(self, object_index, object_info):
         object_offset = int(object_info["object_data_offset"])
         header_values, object_header_layout, geometry_layout = self.detect_object_header_layout(object_offset)
         if header_values is None or object_header_layout is None or geometry_layout is None:
             self.log(
-                "MH2 Mesh[{:02d}] object header layout was not recognized at 0x{:08X}".format(
-                    object_index,
-                    object_offset,
-                )
+                "MH2 Mesh[{:02d}] object header layout was not recognized at 0x{:08X}",
+                object_index,
+                object_offset,
             )
             return None
 
@@ -11246,13 +11392,11 @@ class Manhunt2MdlReader:
             material_id_size,
         )
 
-        self.file.seek(face_start)
         source_faces = []
         for face_index in range(triangle_count):
-            raw_face = self.file.read(6)
-            if len(raw_face) < 6:
+            if face_start + face_index * 6 + 6 > self.file_size:
                 break
-            a, b, c = struct.unpack("<3H", raw_face)
+            a, b, c = _MH2_FACE.unpack_from(self.file_view, face_start + face_index * 6)
             if a < num_vertices and b < num_vertices and c < num_vertices:
                 source_faces.append((int(face_index), (a, b, c)))
 
@@ -11344,11 +11488,12 @@ class Manhunt2MdlReader:
         parent_status = "armature_child" if (
             mesh_object is not None and getattr(mesh_object, "parent", None) == self.armature_obj
         ) else "unparented"
-        self.log(
-            "MH2 Mesh[{:02d}] {!r} object=0x{:08X} parent=0x{:08X} {!r} "
-            "verts={}/{} invalid={} faces={}/{} stride={} vet=0x{:X} "
-            "header_layout={} header={} matid_size={} face_start=0x{:08X} vertex_start=0x{:08X} "
-            "position_offsets={} uv_base={} uv_layers={} skin={} weight_sum=({:.6f},{:.6f}) layout={} space={} parent_state={} bounds={}".format(
+        if self.print_debug_log:
+            self.log(
+                "MH2 Mesh[{:02d}] {!r} object=0x{:08X} parent=0x{:08X} {!r} "
+                "verts={}/{} invalid={} faces={}/{} stride={} vet=0x{:X} "
+                "header_layout={} header={} matid_size={} face_start=0x{:08X} vertex_start=0x{:08X} "
+                "position_offsets={} uv_base={} uv_layers={} skin={} weight_sum=({:.6f},{:.6f}) layout={} space={} parent_state={} bounds={}",
                 object_index,
                 mesh_name,
                 object_offset,
@@ -11377,10 +11522,9 @@ class Manhunt2MdlReader:
                 parent_status,
                 vertex_statistics["bounds_text"],
             )
-        )
-        for record in material_id_records:
-            self.log(
-                "    MaterialID[{:02d}] faces={} material={} start_face={} raw_indices={} raw_start={} unknown=0x{:04X}".format(
+            for record in material_id_records:
+                self.log(
+                    "    MaterialID[{:02d}] faces={} material={} start_face={} raw_indices={} raw_start={} unknown=0x{:04X}",
                     record.get("index", 0),
                     record.get("num_faces", 0),
                     record.get("material_id", 0),
@@ -11389,22 +11533,22 @@ class Manhunt2MdlReader:
                     record.get("start_face_index", 0),
                     record.get("unknown", 0),
                 )
-            )
         return mesh_object
 
+    def read_fixed_string_bytes(self, offset, size):
+        start = int(offset)
+        end = min(start + int(size), self.file_size)
+        terminator = self.file_data.find(b"\x00", start, end)
+        return self.file_data[start:terminator if terminator >= 0 else end]
+
     def read_c_string(self, offset):
-        current_position = self.file.tell()
         if not self.is_valid_offset(offset, 0, 1):
             return ""
-        self.file.seek(offset)
-        text = bytearray()
-        while len(text) < 4096:
-            value = self.file.read(1)
-            if not value or value == b"\x00":
-                break
-            text += value
-        self.file.seek(current_position)
-        return text.decode("ascii", errors="replace")
+        limit = min(int(offset) + 4096, self.file_size)
+        end = self.file_data.find(b"\x00", int(offset), limit)
+        if end < 0:
+            end = limit
+        return self.file_data[int(offset):end].decode("ascii", errors="replace")
 
     def parent_mesh_to_armature(self, mesh_object, create_rigid_parent_group=True):
         if mesh_object is None or self.armature_obj is None:
@@ -11413,7 +11557,7 @@ class Manhunt2MdlReader:
             mesh_object.parent = self.armature_obj
             mesh_object.matrix_parent_inverse = self.armature_obj.matrix_world.inverted()
         except Exception as exc:
-            self.log("MH2 armature parenting failed for {!r}: {}".format(mesh_object.name, exc))
+            self.log("MH2 armature parenting failed for {!r}: {}", mesh_object.name, exc)
             return False
 
         parent_bone_name = str(mesh_object.get("bleeds_mh2_parent_bone_name", "") or "")
@@ -11427,7 +11571,7 @@ class Manhunt2MdlReader:
                     vertex_group.add(vertex_indices, 1.0, "REPLACE")
                 mesh_object["bleeds_mh2_rigid_parent_bone"] = parent_bone_name
             except Exception as exc:
-                self.log("MH2 parent-bone vertex group failed for {!r}: {}".format(mesh_object.name, exc))
+                self.log("MH2 parent-bone vertex group failed for {!r}: {}", mesh_object.name, exc)
 
         try:
             modifier = None
@@ -11441,7 +11585,7 @@ class Manhunt2MdlReader:
             modifier.show_in_editmode = True
             modifier.show_on_cage = True
         except Exception as exc:
-            self.log("MH2 armature modifier creation failed for {!r}: {}".format(mesh_object.name, exc))
+            self.log("MH2 armature modifier creation failed for {!r}: {}", mesh_object.name, exc)
 
         mesh_object["bleeds_mh2_child_of_armature"] = True
         mesh_object["bleeds_mh2_armature_name"] = self.armature_obj.name
@@ -11552,7 +11696,7 @@ class Manhunt2MdlReader:
         try:
             image = bpy.data.images.load(texture_path, check_existing=True)
         except Exception as exc:
-            self.log("MH2 texture load failed for {!r}: {}".format(texture_path, exc))
+            self.log("MH2 texture load failed for {!r}: {}", texture_path, exc)
             image = None
         self.texture_image_cache[normalized_name] = image
         return image
@@ -11672,17 +11816,17 @@ class Manhunt2MdlReader:
 
         image = self.load_texture_image(texture_name)
         if image is not None:
-            self.log(
-                "    MH2 material {:02d} {!r} -> TEX descriptor {!r} at 0x{:08X}, DDS at 0x{:08X}".format(
+            if self.print_debug_log:
+                self.log(
+                    "    MH2 material {:02d} {!r} -> TEX descriptor {!r} at 0x{:08X}, DDS at 0x{:08X}",
                     material_index,
                     texture_name,
                     str(image.get("bleeds_texture_name", image.name)),
                     int(image.get("bleeds_mh2_tex_descriptor_offset", 0)),
                     int(image.get("bleeds_mh2_tex_data_offset", 0)),
                 )
-            )
-        elif self.import_textures:
-            self.log("    MH2 material {:02d} {!r} -> no exact TEX name match".format(material_index, texture_name))
+        elif self.import_textures and self.print_debug_log:
+            self.log("    MH2 material {:02d} {!r} -> no exact TEX name match", material_index, texture_name)
         self.configure_material_nodes(material, material_info, image)
         material["bleeds_model_game"] = "MH2"
         material["bleeds_mh2_material_index"] = material_index
@@ -11708,7 +11852,7 @@ class Manhunt2MdlReader:
         return names
 
     def apply_skin_weights(self, mesh_object, bone_indices, bone_weights):
-        if mesh_object is None or not bone_indices or not bone_weights:
+        if mesh_object is None or len(bone_indices) == 0 or len(bone_weights) == 0:
             return 0
         palette_names = self.get_skin_palette_names()
         if not palette_names:
@@ -11719,59 +11863,69 @@ class Manhunt2MdlReader:
             vertex_groups.remove(vertex_groups[0])
         groups = [vertex_groups.new(name=name) for name in palette_names]
 
-        assigned_influence_count = 0
-        weighted_vertex_count = 0
         maximum_vertex_count = min(len(mesh_object.data.vertices), len(bone_indices), len(bone_weights))
-        for vertex_index in range(maximum_vertex_count):
-            merged_weights = {}
-            for bone_index, weight in zip(bone_indices[vertex_index], bone_weights[vertex_index]):
-                try:
-                    bone_index = int(bone_index)
-                    weight = float(weight)
-                except Exception:
-                    continue
-                if not math.isfinite(weight) or weight <= 0.000001:
-                    continue
-                if bone_index < 0 or bone_index >= len(groups):
-                    continue
-                merged_weights[bone_index] = merged_weights.get(bone_index, 0.0) + weight
+        source_indices = np.asarray(bone_indices[:maximum_vertex_count], dtype=np.int64)
+        source_weights = np.asarray(bone_weights[:maximum_vertex_count], dtype=np.float64)
+        usable = (
+            np.isfinite(source_weights)
+            & (source_weights > 0.000001)
+            & (source_indices >= 0)
+            & (source_indices < len(groups))
+        )
+
+        # Influences that repeat a bone within one vertex are merged before normalizing.
+        merged_weights = np.zeros((maximum_vertex_count, len(groups)), dtype=np.float64)
+        vertex_rows = np.broadcast_to(np.arange(maximum_vertex_count)[:, None], source_indices.shape)
+        np.add.at(merged_weights, (vertex_rows[usable], source_indices[usable]), source_weights[usable])
+        total_weights = merged_weights.sum(axis=1)
+        weighted_vertices = np.flatnonzero(total_weights > 0.000001)
+        normalized_weights = merged_weights[weighted_vertices] / total_weights[weighted_vertices, None]
 
-            total_weight = sum(merged_weights.values())
-            if total_weight <= 0.000001:
+        # VertexGroup.add takes one weight per call, so vertices sharing a weight are added together.
+        assigned_influence_count = 0
+        for bone_index, group in enumerate(groups):
+            column = normalized_weights[:, bone_index]
+            influenced = np.flatnonzero(column > 0.0)
+            if not len(influenced):
                 continue
-            weighted_vertex_count += 1
-            for bone_index, weight in merged_weights.items():
-                groups[bone_index].add([vertex_index], float(weight) / float(total_weight), "REPLACE")
-                assigned_influence_count += 1
+            assigned_influence_count += len(influenced)
+            unique_weights, weight_slots = np.unique(column[influenced], return_inverse=True)
+            order = np.argsort(weight_slots, kind="stable")
+            sorted_slots = weight_slots[order]
+            boundaries = np.flatnonzero(np.diff(sorted_slots)) + 1
+            runs = np.split(weighted_vertices[influenced[order]], boundaries)
+            run_weights = unique_weights[sorted_slots[np.r_[0, boundaries]]].tolist()
+            for weight, run in zip(run_weights, runs):
+                group.add(run.tolist(), weight, "REPLACE")
+        weighted_vertex_count = len(weighted_vertices)
 
         mesh_object["bleeds_mh2_skin_palette_size"] = len(palette_names)
         mesh_object["bleeds_mh2_weighted_vertex_count"] = int(weighted_vertex_count)
         mesh_object["bleeds_mh2_assigned_influence_count"] = int(assigned_influence_count)
         return assigned_influence_count
 
-    def apply_vertex_colors(self, mesh, colors):
-        if not colors or len(colors) < len(mesh.vertices):
+    def apply_vertex_colors(self, mesh, colors, loop_vertex_indices):
+        if colors is None or len(colors) == 0 or len(colors) < len(mesh.vertices):
             return None
+        loop_colors = colors[loop_vertex_indices].ravel()
         try:
             if hasattr(mesh, "color_attributes"):
                 color_layer = mesh.color_attributes.get("Color")
                 if color_layer is None:
                     color_layer = mesh.color_attributes.new(name="Color", type="BYTE_COLOR", domain="CORNER")
-                for loop in mesh.loops:
-                    color_layer.data[loop.index].color = tuple(colors[loop.vertex_index])
+                color_layer.data.foreach_set("color", loop_colors)
                 return color_layer
         except Exception:
             pass
         try:
             color_layer = mesh.vertex_colors.get("Color") or mesh.vertex_colors.new(name="Color")
-            for loop in mesh.loops:
-                color_layer.data[loop.index].color = tuple(colors[loop.vertex_index])
+            color_layer.data.foreach_set("color", loop_colors)
             return color_layer
         except Exception:
             return None
 
     def apply_custom_normals(self, mesh, normals):
-        if not normals or len(normals) < len(mesh.vertices):
+        if normals is None or len(normals) == 0 or len(normals) < len(mesh.vertices):
             return False
         try:
             if hasattr(mesh, "use_auto_smooth"):
@@ -11779,7 +11933,7 @@ class Manhunt2MdlReader:
         except Exception:
             pass
         try:
-            mesh.normals_split_custom_set_from_vertices([tuple(normal) for normal in normals])
+            mesh.normals_split_custom_set_from_vertices(normals.tolist())
             return True
         except Exception:
             return False
@@ -11800,11 +11954,11 @@ class Manhunt2MdlReader:
     ):
         import bpy
 
-        if not vertices:
+        if vertices is None or len(vertices) == 0:
             return None
 
         mesh = bpy.data.meshes.new(name)
-        mesh.from_pydata([tuple(vertex) for vertex in vertices], [], faces)
+        mesh.from_pydata(vertices.tolist(), [], faces)
         for polygon in mesh.polygons:
             polygon.use_smooth = True
         try:
@@ -11814,19 +11968,19 @@ class Manhunt2MdlReader:
             pass
         mesh.update()
 
+        # Per-vertex attribute arrays are expanded to face corners with one gather.
+        loop_vertex_indices = np.zeros(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+
         for uv_layer_index, source_uvs in enumerate(uv_layers or []):
             if source_uvs is None or len(source_uvs) < len(vertices):
                 continue
             layer_name = "UVMap" if uv_layer_index == 0 else "UVMap.{}".format(uv_layer_index + 1)
             uv_layer = mesh.uv_layers.new(name=layer_name)
-            for polygon in mesh.polygons:
-                for loop_index in polygon.loop_indices:
-                    vertex_index = mesh.loops[loop_index].vertex_index
-                    if vertex_index < len(source_uvs):
-                        uv_layer.data[loop_index].uv = tuple(source_uvs[vertex_index])
+            uv_layer.data.foreach_set("uv", source_uvs[loop_vertex_indices].ravel())
 
-        self.apply_vertex_colors(mesh, colors or [])
-        self.apply_custom_normals(mesh, normals or [])
+        self.apply_vertex_colors(mesh, colors, loop_vertex_indices)
+        self.apply_custom_normals(mesh, normals)
 
         for material_info in materials:
             mesh.materials.append(self.get_or_create_material(material_info))
@@ -11853,31 +12007,17 @@ class Manhunt2MdlReader:
         mesh_object["bleeds_mh2_bone_record_layout"] = self.bone_record_layout.get("name", "")
         mesh_object["bleeds_mh2_object_header_layout"] = self.object_header_layout_name
         mesh_object["bleeds_mdl_filepath"] = self.path
-        if bone_indices and bone_weights:
+        if bone_indices is not None and bone_weights is not None:
             self.apply_skin_weights(mesh_object, bone_indices, bone_weights)
         return mesh_object
 
 
 def is_manhunt2_pmlc_mdl(filepath):
-    import zlib
-
     try:
-        with open(filepath, "rb") as input_file:
-            raw_data = input_file.read()
+        data, was_compressed = read_pmlc_container(filepath)
     except Exception:
         return False
-    if raw_data[:4] == b"PMLC":
-        return True
-    for offset in (0, 4, 8, 12, 16, 20, 24, 32):
-        if offset >= len(raw_data):
-            continue
-        try:
-            decoded = zlib.decompress(raw_data[offset:])
-        except Exception:
-            continue
-        if decoded[:4] == b"PMLC":
-            return True
-    return False
+    return data[:4] == b"PMLC"
 
 
 # Backwards-compatible name used by older add-on builds.
@@ -24,6 +24,7 @@ import numpy as np
 
 import bpy
 from .. import set_mesh_auto_smooth
+from .worldblock import read_chinatown
 from mathutils import Matrix
 
 from pathlib import Path
@@ -362,56 +363,59 @@ class MDLParser:
                 s.uvs = [(u * s.u_scale, v * s.v_scale) for (u, v) in s.uvs]
             acc_len += batch_len
 
-    def triangulate_strip_indices(self, local_count: int) -> List[Tuple[int, int, int]]:
+    def triangulate_strip_indices(self, local_count: int) -> np.ndarray:
 
-        tris: List[Tuple[int, int, int]] = []
-        for i in range(local_count - 2):
-            if i & 1:
-                tris.append((i + 1, i, i + 2))
-            else:
-                tris.append((i, i + 1, i + 2))
+        # Odd triangles swap their first two corners to keep the winding.
+        i = np.arange(max(local_count - 2, 0), dtype=np.int32)
+        odd = (i & 1).astype(bool)
+        tris = np.empty((len(i), 3), dtype=np.int32)
+        tris[:, 0] = np.where(odd, i + 1, i)
+        tris[:, 1] = np.where(odd, i, i + 1)
+        tris[:, 2] = i + 2
         return tris
 
     def build_mesh_from_groups(self, res_index: int, groups: List[MDLStripGroup]) -> Tuple[Optional[bpy.types.Object], List[Tuple[int, int, int]]]:
 
         if not groups:
             return None, []
-        vertices: List[Tuple[float, float, float]] = []
-        uvs_list: List[Tuple[float, float]] = []
-        faces: List[Tuple[int, int, int]] = []
-        face_ranges: List[Tuple[int, int, int]] = []
+        strips: List[Tuple[TriStrip, int]] = []
         for g in groups:
             for s in g.strips:
                 k = min(len(s.verts), len(s.uvs), s.count)
-                if k < 3:
-                    continue
-                base = len(vertices)
-                vertices.extend(s.verts[:k])
-                uvs_list.extend(s.uvs[:k])
-                tri_list = self.triangulate_strip_indices(k)
-                poly_start = len(faces)
-                for a, b, c in tri_list:
-                    faces.append((base + a, base + b, base + c))
-                poly_count = len(tri_list)
-                face_ranges.append((poly_start, poly_count, s.material_res_index))
-        if not faces or not vertices:
+                if k >= 3:
+                    strips.append((s, k))
+        if not strips:
             return None, []
+
+        # Every strip goes straight into preallocated arrays so the mesh can be
+        # filled with foreach_set instead of per-loop / per-polygon assignment.
+        vert_total = sum(k for _, k in strips)
+        face_total = sum(k - 2 for _, k in strips)
+        vertices = np.empty((vert_total, 3), dtype=np.float32)
+        uvs = np.empty((vert_total, 2), dtype=np.float32)
+        faces = np.empty((face_total, 3), dtype=np.int32)
+        face_ranges: List[Tuple[int, int, int]] = []
+        base = 0
+        poly_start = 0
+        for s, k in strips:
+            vertices[base:base + k] = s.verts[:k]
+            uvs[base:base + k] = s.uvs[:k]
+            faces[poly_start:poly_start + k - 2] = self.triangulate_strip_indices(k) + base
+            face_ranges.append((poly_start, k - 2, s.material_res_index))
+            base += k
+            poly_start += k - 2
+
         mesh_name = f"{self.stem}_mdl{res_index}"
         me = bpy.data.meshes.new(mesh_name)
-        me.from_pydata(vertices, [], faces)
+        read_chinatown.fill_tri_mesh(me, vertices, faces)
         set_mesh_auto_smooth(me, True)
         me.validate(clean_customdata=False)
         me.update()
 
-        if uvs_list:
-            uv_layer = me.uv_layers.new(name="UVMap")
-            uv_data = uv_layer.data
-            for poly in me.polygons:
-                li = poly.loop_start
-                for j, vi in enumerate(poly.vertices):
-                    if vi < len(uvs_list):
-                        u, v = uvs_list[vi]
-                        uv_data[li + j].uv = (u, v)
+        loop_vertex_indices = np.zeros(len(me.loops), dtype=np.int32)
+        me.loops.foreach_get("vertex_index", loop_vertex_indices)
+        uv_layer = me.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", uvs[loop_vertex_indices].ravel())
         obj = bpy.data.objects.new(mesh_name, me)
 
         resid_to_slot: Dict[int, int] = {}
@@ -423,14 +427,13 @@ class MDLParser:
                     obj.data.materials.append(mat)
                     resid_to_slot[mat_resid] = len(obj.data.materials) - 1
 
-        if face_ranges:
-            polys = obj.data.polygons
-            for (pstart, pcount, mat_resid) in face_ranges:
-                slot = resid_to_slot.get(mat_resid)
-                if slot is not None:
-                    for pi in range(pstart, pstart + pcount):
-                        if 0 <= pi < len(polys):
-                            polys[pi].material_index = slot
+        polys = obj.data.polygons
+        material_indices = np.zeros(len(polys), dtype=np.int32)
+        for (pstart, pcount, mat_resid) in face_ranges:
+            slot = resid_to_slot.get(mat_resid)
+            if slot is not None:
+                material_indices[pstart:pstart + pcount] = slot
+        polys.foreach_set("material_index", material_indices)
         return obj, face_ranges
 
     def count_vif_commands(self) -> Tuple[int, int]:
@@ -447,17 +450,35 @@ class MDLParser:
                 mscal_count += 1
         return unpack_count, mscal_count
 
+_U16 = struct.Struct("<H")
+_I16 = struct.Struct("<h")
+_U32 = struct.Struct("<I")
+_F32 = struct.Struct("<f")
+
 def read_u16(data: bytes, offset: int) -> int:
-    return struct.unpack_from("<H", data, offset)[0]
+    return _U16.unpack_from(data, offset)[0]
 
 def read_i16(data: bytes, offset: int) -> int:
-    return struct.unpack_from("<h", data, offset)[0]
+    return _I16.unpack_from(data, offset)[0]
 
 def read_u32(data: bytes, offset: int) -> int:
-    return struct.unpack_from("<I", data, offset)[0]
+    return _U32.unpack_from(data, offset)[0]
 
 def read_f32(data: bytes, offset: int) -> float:
-    return struct.unpack_from("<f", data, offset)[0]
+    return _F32.unpack_from(data, offset)[0]
+
+# 0x00 WRLD preface: magic, type, size, global0, global1, global count,
+# continuation, reserved.  0x20 extension: resource table address, resource
+# count, unknown count, eight sky offsets.
+_WRLD_HEADER = struct.Struct("<4s7I")
+_WRLD_EXTENDED_HEADER = struct.Struct("<IHH8I")
+
+WRLD_TYPE_LABELS = ("slave", "master")
+
+def wrld_type_label(wrld_type: int) -> str:
+    if 0 <= wrld_type < len(WRLD_TYPE_LABELS):
+        return WRLD_TYPE_LABELS[wrld_type]
+    return "unknown"
 
 def half_to_float(h: int) -> float:
     return float(np.frombuffer(struct.pack("<H", h & 0xFFFF), dtype=np.float16)[0])
@@ -632,23 +653,11 @@ class ResourceEntry:
     mdl_info = None
 
 def parse_world_header(data: bytes) -> WorldHeader:
-    return WorldHeader(
-        magic=data[0:4],
-        wrld_type=read_u32(data, 4),
-        total_size=read_u32(data, 8),
-        global0=read_u32(data, 12),
-        global1=read_u32(data, 16),
-        global_count=read_u32(data, 20),
-        continuation=read_u32(data, 24),
-        reserved=read_u32(data, 28),
-    )
+    return WorldHeader(*_WRLD_HEADER.unpack_from(data, 0))
 
 def parse_extended_header(data: bytes) -> ExtendedHeader:
-    res_table_addr = read_u32(data, 0x20)
-    res_count = read_u16(data, 0x24)
-    unknown_count = read_u16(data, 0x26)
-    sky_offsets = [read_u32(data, 0x28 + i * 4) for i in range(8)]
-    return ExtendedHeader(res_table_addr, res_count, unknown_count, sky_offsets)
+    fields = _WRLD_EXTENDED_HEADER.unpack_from(data, 0x20)
+    return ExtendedHeader(fields[0], fields[1], fields[2], list(fields[3:]))
 
 def parse_resource_table(data: bytes, header: WorldHeader, ext: ExtendedHeader) -> list:
 
@@ -787,7 +796,7 @@ def log_and_import(path: str, decode_textures: bool = True, write_log: bool = Tr
     lines = []
     lines.append(f"[wrld] loading '{path}' ({len(data)} bytes)")
     lines.append(
-        f"[wrld] magic={header.magic} type={header.wrld_type} size={header.total_size} "
+        f"[wrld] magic={header.magic} type={header.wrld_type} ({wrld_type_label(header.wrld_type)}) size={header.total_size} "
         f"g0=0x{header.global0:08X} g1=0x{header.global1:08X} gcnt={header.global_count} "
         f"cont=0x{header.continuation:08X} resv=0x{header.reserved:08X}"
     )
@@ -16,11 +16,16 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import mmap
 import struct
-import datetime
-import traceback
 
 import bpy
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Optional
@@ -39,6 +44,88 @@ from typing import List, Tuple, Dict, Optional
 
 #######################################################
 
+# Precompiled little-endian scalars so the per-field reads below don't
+# re-parse a format string on every call.
+_I8 = struct.Struct("<b")
+_U8 = struct.Struct("<B")
+_I16 = struct.Struct("<h")
+_U16 = struct.Struct("<H")
+_I32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_F16 = struct.Struct("<e")
+_F32 = struct.Struct("<f")
+_VEC3_I32 = struct.Struct("<3i")
+# Right/Top/At as fixed-point int16 triples, int16 padding, then an int32
+# position triple: 0x20 bytes.
+_CW_TRANSFORM = struct.Struct("<10h3i")
+# WBL sector records, streamed with iter_unpack over each record array.
+_CW_SECTOR = struct.Struct("<BB5h")
+_CW_LEVEL = struct.Struct("<iiihh")
+_CW_INSTANCE = struct.Struct("<hbbIII")
+_CW_MESH_PART = struct.Struct("<HHBBBBi")
+# 48-byte MDL header: ident, unknown, numMaterials, numVertices, two
+# floats, int4096 bound min/max, UV offset and scale factor.
+_CW_MDL_HEADER = struct.Struct("<4sbbh2f3i3i2f")
+# The instance array as a numpy record view, for pulling whole columns
+# (mesh offsets) out of a sector without a per-record loop.
+CW_INSTANCE_DTYPE = np.dtype([
+    ("ID", "<i2"),
+    ("RenderListID", "i1"),
+    ("BuildingSwap", "i1"),
+    ("ResourceID", "<u4"),
+    ("MeshOffset", "<u4"),
+    ("Pointer", "<u4"),
+])
+# Sector shadow and light tables, decoded a whole table at a time and
+# dequantised column-wise.
+CW_SHADOW_DTYPE = np.dtype([
+    ("CenterX", "<i4"),
+    ("CenterY", "<i4"),
+    ("CenterZ", "<f2"),
+    ("SizeX", "<i2"),
+    ("SizeY", "<i2"),
+    ("SizeZ", "<i2"),
+    ("Unknown3", "<i2"),
+    ("Id", "u1"),
+    ("Pad", "u1"),
+])
+CW_LIGHT_DTYPE = np.dtype([
+    ("pos", "<u4", (3,)),
+    ("Size", "<u2"),
+    ("Id", "u1"),
+    ("_pad0", "u1"),
+    ("rgb", "u1", (3,)),
+    ("_pad1", "u1"),
+])
+# One 16-byte MDL vertex: int16 position, normal and UV.
+CW_VERTEX_DTYPE = np.dtype([
+    ("pos", "<i2", (3,)),
+    ("normal", "<i2", (3,)),
+    ("uv", "<i2", (2,)),
+])
+
+# Fixed-point scales, applied as multiplications.
+INV_4096 = 1.0 / 4096.0
+INV_2048 = 1.0 / 2048.0
+INV_255 = 1.0 / 255.0
+
+# Optional accelerator: with numba installed the vertex decode runs as one
+# compiled loop over the int16 words instead of a chain of numpy passes.
+# fastmath stays off so the results match the numpy path bit for bit.
+if numba is not None:
+    @numba.njit(cache=True)
+    def _decode_vertices_jit(words, scale, ox, oy, oz, uv_offset, positions, uvs):
+        n = words.shape[0]
+        uv_shift = uv_offset * 2
+        for i in range(n):
+            positions[i, 0] = words[i, 0] / scale + ox
+            positions[i, 1] = words[i, 1] / scale + oy
+            positions[i, 2] = words[i, 2] / scale + oz
+            uvs[i, 0] = words[i, 6] * INV_2048 + uv_shift
+            uvs[i, 1] = words[i, 7] * -INV_2048 + 1.0
+else:
+    _decode_vertices_jit = None
+
 class read_chinatown:
 
     DEBUG_MODE: bool = True
@@ -51,6 +138,28 @@ class read_chinatown:
         pos: Tuple[float, float, float]
         padding: int
 
+    class DebugLog:
+        # Debug output is collected in memory and reaches the file as one
+        # joined write on flush/close, not one write call per logged line.
+        def __init__(self, path: str):
+            self._fh = open(path, "w", encoding="utf-8")
+            self._parts: List[str] = []
+
+        def write(self, text: str) -> None:
+            self._parts.append(text)
+
+        def flush(self) -> None:
+            if self._parts:
+                self._fh.write("".join(self._parts))
+                self._parts.clear()
+            self._fh.flush()
+
+        def close(self) -> None:
+            try:
+                self.flush()
+            finally:
+                self._fh.close()
+
     @classmethod
     def get_debug_logfile(cls, import_path: str) -> str:
         basename = os.path.basename(import_path)
@@ -61,85 +170,121 @@ class read_chinatown:
 
     @classmethod
     def dprint(cls, s: str, logf=None, do_print: bool = True) -> None:
-        if cls.DEBUG_MODE and do_print:
-            print(s)
-            if logf is not None:
-                try:
-                    logf.write(s + "\n")
-                    logf.flush()
-                except Exception as e:
-                    print(f"Failed to write to log file: {e}")
+        if not (cls.DEBUG_MODE and do_print):
+            return
+        print(s)
+        if logf is not None:
+            # logf is normally a DebugLog, which is only flushed when an
+            # import fails and when it is closed.
+            try:
+                logf.write(s)
+                logf.write("\n")
+            except Exception as e:
+                print(f"Failed to write to log file: {e}")
+
+    @staticmethod
+    def open_mapped(path: str):
+        # Read-only mapping: the sector walk and mesh decoders only touch the
+        # records they reference, so only those pages are ever read in.
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Sectors are walked front to back, so let the kernel read ahead
+        # aggressively. Windows has neither madvise nor the MADV_* flags.
+        if hasattr(mm, "madvise"):
+            for flag in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                if hasattr(mmap, flag):
+                    mm.madvise(getattr(mmap, flag))
+        return mm
+
+    @staticmethod
+    def close_mapped(data) -> None:
+        # A view still held by a propagating traceback keeps the map
+        # exported; that one is left for the garbage collector to unmap.
+        if isinstance(data, mmap.mmap):
+            try:
+                data.close()
+            except BufferError:
+                pass
+
+    @staticmethod
+    def get_or_create_collection(context, name: str):
+        coll = bpy.data.collections.get(name)
+        if not coll:
+            coll = bpy.data.collections.new(name)
+            if coll.name not in {c.name for c in context.scene.collection.children}:
+                context.scene.collection.children.link(coll)
+        return coll
 
     @classmethod
     def print_bytes(cls, data: bytes, start: int = 0,
                     end: Optional[int] = None, logf=None) -> None:
-        b = data[start:end]
-        hexstr = " ".join(f"{x:02X}" for x in b)
+        if not cls.DEBUG_MODE:
+            return
+        # Hex straight off a view; slicing data would copy the range first.
+        with memoryview(data) as view:
+            hexstr = view[start:end].hex(" ").upper()
         cls.dprint(f"[0x{start:02X}] {hexstr}", logf)
 
     @staticmethod
     def padhex(n: int, w: int = 8) -> str:
+        if w == 8:
+            return f"0x{n:08X}"
         return f"0x{n:0{w}X}"
 
     @staticmethod
     def read_u8(data: bytes, offset: int) -> int:
-        return struct.unpack_from("<B", data, offset)[0]
+        return _U8.unpack_from(data, offset)[0]
 
     @staticmethod
     def read_i8(data: bytes, offset: int) -> int:
-        return struct.unpack_from("<b", data, offset)[0]
+        return _I8.unpack_from(data, offset)[0]
 
     @staticmethod
     def read_i16(data: bytes, offset: int) -> int:
-        return struct.unpack_from("<h", data, offset)[0]
+        return _I16.unpack_from(data, offset)[0]
 
     @staticmethod
     def read_u16(data: bytes, offset: int) -> int:
-        return struct.unpack_from("<H", data, offset)[0]
+        return _U16.unpack_from(data, offset)[0]
 
     @staticmethod
     def read_vec3_int4096(data: bytes, offset: int) -> Tuple[float, float, float]:
-        x = struct.unpack_from("<i", data, offset + 0)[0] / 4096.0
-        y = struct.unpack_from("<i", data, offset + 4)[0] / 4096.0
-        z = struct.unpack_from("<i", data, offset + 8)[0] / 4096.0
-        return (x, y, z)
+        x, y, z = _VEC3_I32.unpack_from(data, offset)
+        return (x * INV_4096, y * INV_4096, z * INV_4096)
 
     @classmethod
     def read_leeds_cw_transform(cls, data: bytes, offset: int,
                                 logf=None) -> "read_chinatown.CWTransform":
 
-        RightX = struct.unpack_from("<h", data, offset + 0x00)[0] / 4096.0
-        RightY = struct.unpack_from("<h", data, offset + 0x02)[0] / 4096.0
-        RightZ = struct.unpack_from("<h", data, offset + 0x04)[0] / 4096.0
-
-        TopX = struct.unpack_from("<h", data, offset + 0x06)[0] / 4096.0
-        TopY = struct.unpack_from("<h", data, offset + 0x08)[0] / 4096.0
-        TopZ = struct.unpack_from("<h", data, offset + 0x0A)[0] / 4096.0
-
-        AtX = struct.unpack_from("<h", data, offset + 0x0C)[0] / 4096.0
-        AtY = struct.unpack_from("<h", data, offset + 0x0E)[0] / 4096.0
-        AtZ = struct.unpack_from("<h", data, offset + 0x10)[0] / 4096.0
-
-        Padding = struct.unpack_from("<h", data, offset + 0x12)[0]
-
-        PosnX = struct.unpack_from("<i", data, offset + 0x14)[0] / 4096.0
-        PosnY = struct.unpack_from("<i", data, offset + 0x18)[0] / 4096.0
-        PosnZ = struct.unpack_from("<i", data, offset + 0x1C)[0] / 4096.0
-
-        cls.dprint("    -Transform", logf)
-        cls.dprint(f"      RightX {RightX:.6f}", logf)
-        cls.dprint(f"      RightY {RightY:.6f}", logf)
-        cls.dprint(f"      RightZ {RightZ:.6f}", logf)
-        cls.dprint(f"      TopX   {TopX:.6f}", logf)
-        cls.dprint(f"      TopY   {TopY:.6f}", logf)
-        cls.dprint(f"      TopZ   {TopZ:.6f}", logf)
-        cls.dprint(f"      AtX    {AtX:.6f}", logf)
-        cls.dprint(f"      AtY    {AtY:.6f}", logf)
-        cls.dprint(f"      AtZ    {AtZ:.6f}", logf)
-        cls.dprint(f"      Padding {Padding}", logf)
-        cls.dprint(f"      PosnX  {PosnX:.6f}", logf)
-        cls.dprint(f"      PosnY  {PosnY:.6f}", logf)
-        cls.dprint(f"      PosnZ  {PosnZ:.6f}", logf)
+        (
+            RightX, RightY, RightZ,
+            TopX, TopY, TopZ,
+            AtX, AtY, AtZ,
+            Padding,
+            PosnX, PosnY, PosnZ,
+        ) = _CW_TRANSFORM.unpack_from(data, offset)
+        RightX, RightY, RightZ = RightX * INV_4096, RightY * INV_4096, RightZ * INV_4096
+        TopX, TopY, TopZ = TopX * INV_4096, TopY * INV_4096, TopZ * INV_4096
+        AtX, AtY, AtZ = AtX * INV_4096, AtY * INV_4096, AtZ * INV_4096
+        PosnX, PosnY, PosnZ = PosnX * INV_4096, PosnY * INV_4096, PosnZ * INV_4096
+
+        if cls.DEBUG_MODE:
+            cls.dprint("    -Transform", logf)
+            cls.dprint(f"      RightX {RightX:.6f}", logf)
+            cls.dprint(f"      RightY {RightY:.6f}", logf)
+            cls.dprint(f"      RightZ {RightZ:.6f}", logf)
+            cls.dprint(f"      TopX   {TopX:.6f}", logf)
+            cls.dprint(f"      TopY   {TopY:.6f}", logf)
+            cls.dprint(f"      TopZ   {TopZ:.6f}", logf)
+            cls.dprint(f"      AtX    {AtX:.6f}", logf)
+            cls.dprint(f"      AtY    {AtY:.6f}", logf)
+            cls.dprint(f"      AtZ    {AtZ:.6f}", logf)
+            cls.dprint(f"      Padding {Padding}", logf)
+            cls.dprint(f"      PosnX  {PosnX:.6f}", logf)
+            cls.dprint(f"      PosnY  {PosnY:.6f}", logf)
+            cls.dprint(f"      PosnZ  {PosnZ:.6f}", logf)
 
         return cls.CWTransform(
             right=(RightX, RightY, RightZ),
@@ -151,31 +296,46 @@ class read_chinatown:
 
     class MaterialBank:
 
-        def __init__(self, current_dir: str, logf=None):
+        def __init__(self, current_dir: str, logf=None,
+                     built: Optional[Dict[Tuple[str, int], bpy.types.Material]] = None):
             self.current_dir: str = current_dir
             self.logf = logf
             self.material_slots: List[Tuple[str, bpy.types.Material]] = []
             self.material_index_by_texid: Dict[int, int] = {}
+            # Materials already built by this import, keyed on texture
+            # directory and ID. Banks of one multi-file import share it, so
+            # a texture recurring across WBLs gets its node tree and image
+            # lookup once.
+            self.built = built if built is not None else {}
 
         def get_slot(self, tex_id: int) -> int:
             if tex_id in self.material_index_by_texid:
                 return self.material_index_by_texid[tex_id]
 
             mat_name = f"texture{tex_id}"
+            built_key = (self.current_dir, tex_id)
+            mat = self.built.get(built_key)
+            if mat is not None:
+                return self._add_slot(tex_id, mat_name, mat)
+
             logf = self.logf
+            debug = read_chinatown.DEBUG_MODE
 
-            if mat_name in bpy.data.materials:
-                mat = bpy.data.materials[mat_name]
-                read_chinatown.dprint(
-                    f"    Material '{mat_name}' exists, rebuilding node tree.",
-                    logf,
-                )
+            materials = bpy.data.materials
+            mat = materials.get(mat_name)
+            if mat is not None:
+                if debug:
+                    read_chinatown.dprint(
+                        f"    Material '{mat_name}' exists, rebuilding node tree.",
+                        logf,
+                    )
             else:
-                mat = bpy.data.materials.new(name=mat_name)
-                read_chinatown.dprint(
-                    f"    Created new material '{mat_name}' and will build node tree.",
-                    logf,
-                )
+                mat = materials.new(name=mat_name)
+                if debug:
+                    read_chinatown.dprint(
+                        f"    Created new material '{mat_name}' and will build node tree.",
+                        logf,
+                    )
 
             mat.use_nodes = True
             nodes = mat.node_tree.nodes
@@ -196,26 +356,32 @@ class read_chinatown:
             output_node.is_active_output = True
 
             image_path = os.path.join(self.current_dir, f"{mat_name}.png")
-            read_chinatown.dprint(f"      Checking for image: {image_path}", logf)
+            if debug:
+                read_chinatown.dprint(f"      Checking for image: {image_path}", logf)
             if os.path.exists(image_path):
                 try:
                     img = bpy.data.images.load(image_path, check_existing=True)
                     tex_image_node.image = img
                     tex_image_node.interpolation = "Smart"
-                    read_chinatown.dprint(
-                        f"      Loaded texture image: {image_path}", logf
-                    )
+                    if debug:
+                        read_chinatown.dprint(
+                            f"      Loaded texture image: {image_path}", logf
+                        )
                 except Exception as e:
-                    read_chinatown.dprint(
-                        f"      Failed loading image {image_path}: {e}", logf
-                    )
-            else:
+                    if debug:
+                        read_chinatown.dprint(
+                            f"      Failed loading image {image_path}: {e}", logf
+                        )
+            elif debug:
                 read_chinatown.dprint(
                     f"      Texture image not found: {image_path}", logf
                 )
 
             mat["CW_TexID"] = tex_id
+            self.built[built_key] = mat
+            return self._add_slot(tex_id, mat_name, mat)
 
+        def _add_slot(self, tex_id: int, mat_name: str, mat: bpy.types.Material) -> int:
             slot_index = len(self.material_slots)
             self.material_slots.append((mat_name, mat))
             self.material_index_by_texid[tex_id] = slot_index
@@ -226,212 +392,287 @@ class read_chinatown:
                 mesh.materials.append(mat)
 
     @staticmethod
-    def tri_strip_to_tris(vertex_count: int) -> List[Tuple[int, int, int]]:
-        faces: List[Tuple[int, int, int]] = []
+    def tri_strip_to_tris(vertex_count: int) -> np.ndarray:
         if vertex_count < 3:
-            return faces
-
-        flip = False
-        for i in range(vertex_count - 2):
-            i0, i1, i2 = i, i + 1, i + 2
-            if flip:
-                tri = (i0, i2, i1)
-            else:
-                tri = (i0, i1, i2)
+            return np.empty((0, 3), dtype=np.int32)
 
-            if len({i0, i1, i2}) == 3:
-                faces.append(tri)
+        # Odd triangles swap their last two corners to keep the strip winding.
+        i = np.arange(vertex_count - 2, dtype=np.int32)
+        flip = i & 1
+        return np.stack((i, i + 1 + flip, i + 2 - flip), axis=1)
 
-            flip = not flip
+    @staticmethod
+    def decode_vertices(data, offset: int, count: int, scale: float, origin,
+                        uv_offset: float, out=None) -> Tuple[np.ndarray, np.ndarray]:
+        # out: optional (positions, uvs) float64 arrays of count rows to
+        # decode into, so a caller merging many meshes can hand out slices
+        # of one buffer instead of allocating per mesh.
+        count = max(0, count)
+        if out is None:
+            out = (
+                np.empty((count, 3), dtype=np.float64),
+                np.empty((count, 2), dtype=np.float64),
+            )
+        positions, uvs = out
+        if _decode_vertices_jit is not None:
+            words = np.frombuffer(
+                data, dtype="<i2", count=count * 8, offset=offset
+            ).reshape(-1, 8)
+            _decode_vertices_jit(
+                words, float(scale), float(origin[0]), float(origin[1]),
+                float(origin[2]), float(uv_offset), positions, uvs,
+            )
+            return positions, uvs
+        # Whole vertex block as one record view; each field is dequantised
+        # with a single array operation, and the origin (a float64 vector,
+        # built once per file by the callers) is broadcast in place.
+        vertices = np.frombuffer(
+            data, dtype=CW_VERTEX_DTYPE, count=count, offset=offset
+        )
+        np.divide(vertices["pos"], scale, out=positions)
+        positions += origin
+        uv = vertices["uv"]
+        np.multiply(uv[:, 0], INV_2048, out=uvs[:, 0])
+        uvs[:, 0] += uv_offset * 2
+        np.multiply(uv[:, 1], -INV_2048, out=uvs[:, 1])
+        uvs[:, 1] += 1.0
+        return positions, uvs
 
-        return faces
+    @staticmethod
+    def fill_tri_mesh(mesh: bpy.types.Mesh, vertices, faces) -> None:
+        # Bulk-load triangle geometry with foreach_set; from_pydata converts
+        # every vertex and face tuple through Python one at a time.
+        co = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1)
+        loop_verts = np.ascontiguousarray(faces, dtype=np.int32).reshape(-1)
+        face_count = len(loop_verts) // 3
+
+        mesh.vertices.add(len(co) // 3)
+        mesh.vertices.foreach_set("co", co)
+        mesh.loops.add(len(loop_verts))
+        mesh.loops.foreach_set("vertex_index", loop_verts)
+        mesh.polygons.add(face_count)
+        mesh.polygons.foreach_set(
+            "loop_start", np.arange(0, len(loop_verts), 3, dtype=np.int32)
+        )
+        # loop_total is derived from loop_start (and read-only) from 4.0 on.
+        if bpy.app.version < (4, 0, 0):
+            mesh.polygons.foreach_set(
+                "loop_total", np.full(face_count, 3, dtype=np.int32)
+            )
+        mesh.update(calc_edges=True)
 
     @classmethod
-    def import_wbl(cls, filepath: str, context) -> None:
+    def import_wbl(cls, filepath: str, context,
+                   material_cache: Optional[Dict[Tuple[str, int], bpy.types.Material]] = None) -> None:
 
         logf = None
+        # dprint checks the flag itself, but its f-string arguments are built
+        # before the call; hot loops test this first so nothing is formatted.
+        debug = cls.DEBUG_MODE
 
-        world_verts: List[Tuple[float, float, float]] = []
-        world_uvs: List[Tuple[float, float]] = []
-        world_faces: List[Tuple[int, int, int]] = []
+        world_face_chunks: List[np.ndarray] = []
         world_face_material_indices: List[int] = []
+        world_vert_count = 0
+        file_bytes = b""
+        file_view = None
 
         try:
             if cls.DEBUG_MODE:
                 logpath = cls.get_debug_logfile(filepath)
-                logf = open(logpath, "w", encoding="utf-8")
+                logf = cls.DebugLog(logpath)
+                import datetime
                 now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 cls.dprint(f"==== DEBUG LOG STARTED {now} ====", logf)
 
-            with open(filepath, "rb") as f:
-                file_bytes = f.read()
+            file_bytes = cls.open_mapped(filepath)
+            # Sector headers and record arrays are sliced from this view, so
+            # handing them to the Struct decoders doesn't copy anything.
+            file_view = memoryview(file_bytes)
 
             cls.dprint("==== .WBL TRANSFORM HEADER (0x00 - 0x27) ====", logf)
             header_transform = cls.read_leeds_cw_transform(file_bytes, 0x00, logf)
             PosnX, PosnY, PosnZ = header_transform.pos
 
+            wbl_basename = os.path.basename(filepath)
+            wbl_stem, _ = os.path.splitext(wbl_basename)
+
+            new_light = bpy.data.lights.new
+            new_object = bpy.data.objects.new
+
             sector_ofs = 0x28
             mesh_offsets_found = set()
 
             for sector_idx in range(4):
-                sec = file_bytes[sector_ofs:sector_ofs + 12]
-                cls.dprint(
-                    f"\n==== SECTOR {sector_idx} (0x{sector_ofs:02X} - 0x{sector_ofs + 11:02X}) ====",
-                    logf,
-                )
-                cls.dprint(
-                    f"[0x{sector_ofs:02X}] Sector raw bytes: "
-                    f"{' '.join(f'{b:02X}' for b in sec)}",
-                    logf,
-                )
-
-                Bool1 = bool(sec[0])
-                Bool2 = bool(sec[1])
-                NumInstances = struct.unpack_from("<h", sec, 2)[0]
-                NumShadows = struct.unpack_from("<h", sec, 4)[0]
-                NumLevels = struct.unpack_from("<h", sec, 6)[0]
-                NumLights = struct.unpack_from("<h", sec, 8)[0]
-                NumTextures = struct.unpack_from("<h", sec, 10)[0]
-
-                cls.dprint(
-                    f"[0x{sector_ofs:02X}] Bool1: {Bool1} (byte value: {sec[0]:02X})",
-                    logf,
-                )
-                cls.dprint(
-                    f"[0x{sector_ofs + 1:02X}] Bool2: {Bool2} (byte value: {sec[1]:02X})",
-                    logf,
-                )
-                cls.dprint(
-                    f"[0x{sector_ofs + 2:02X}] NumInstances (int16): {NumInstances}",
-                    logf,
-                )
-                cls.dprint(
-                    f"[0x{sector_ofs + 4:02X}] NumShadows   (int16): {NumShadows}",
-                    logf,
-                )
-                cls.dprint(
-                    f"[0x{sector_ofs + 6:02X}] NumLevels    (int16): {NumLevels}",
-                    logf,
-                )
-                cls.dprint(
-                    f"[0x{sector_ofs + 8:02X}] NumLights    (int16): {NumLights}",
-                    logf,
-                )
-                cls.dprint(
-                    f"[0x{sector_ofs + 10:02X}] NumTextures  (int16): {NumTextures}",
-                    logf,
-                )
-
-                level_ofs = sector_ofs + 12
-
-                cls.dprint("Levels:", logf)
-                for level_idx in range(NumLevels):
-                    X_raw = struct.unpack_from("<i", file_bytes, level_ofs + 0)[0]
-                    Y_raw = struct.unpack_from("<i", file_bytes, level_ofs + 4)[0]
-                    Z_raw = struct.unpack_from("<i", file_bytes, level_ofs + 8)[0]
-                    NumInstances_lvl = struct.unpack_from(
-                        "<h", file_bytes, level_ofs + 12
-                    )[0]
-                    Flags_lvl = struct.unpack_from("<h", file_bytes, level_ofs + 14)[0]
-
-                    X = X_raw / 4096.0
-                    Y = Y_raw / 4096.0
-                    Z = Z_raw / 4096.0
-
-                    cls.dprint(f"    Level {level_idx}:", logf)
-                    cls.dprint(
-                        f"      [0x{level_ofs:02X}] X (int32/4096): {X}",
-                        logf,
-                    )
+                sec = file_view[sector_ofs:sector_ofs + 12]
+                if debug:
                     cls.dprint(
-                        f"      [0x{level_ofs + 4:02X}] Y (int32/4096): {Y}",
+                        f"\n==== SECTOR {sector_idx} (0x{sector_ofs:02X} - 0x{sector_ofs + 11:02X}) ====",
                         logf,
                     )
                     cls.dprint(
-                        f"      [0x{level_ofs + 8:02X}] Z (int32/4096): {Z}",
-                        logf,
-                    )
-                    cls.dprint(
-                        f"      [0x{level_ofs + 12:02X}] NumInstances (int16): {NumInstances_lvl}",
+                        f"[0x{sector_ofs:02X}] Sector raw bytes: "
+                        f"{sec.hex(' ').upper()}",
                         logf,
                     )
+
+                (
+                    Bool1,
+                    Bool2,
+                    NumInstances,
+                    NumShadows,
+                    NumLevels,
+                    NumLights,
+                    NumTextures,
+                ) = _CW_SECTOR.unpack(sec)
+                Bool1 = bool(Bool1)
+                Bool2 = bool(Bool2)
+
+                # Every record array in a sector follows the previous one, so
+                # all section bounds are known as soon as the header is read.
+                level_base = sector_ofs + 12
+                instance_base = level_base + 16 * max(0, NumLevels)
+                shadow_base = instance_base + 16 * max(0, NumInstances)
+                light_base = shadow_base + 20 * max(0, NumShadows)
+                texture_base = light_base + 20 * max(0, NumLights)
+                next_sector_ofs = texture_base + 2 * max(0, NumTextures)
+
+                if debug:
                     cls.dprint(
-                        f"      [0x{level_ofs + 14:02X}] Flags (int16): {Flags_lvl}",
+                        f"[0x{sector_ofs:02X}] Bool1: {Bool1} (byte value: {sec[0]:02X})",
                         logf,
                     )
-
-                    level_ofs += 16
-
-                cls.dprint("Instances:", logf)
-                for instance_idx in range(NumInstances):
-                    inst_base = level_ofs + instance_idx * 16
-                    ID = struct.unpack_from("<h", file_bytes, inst_base + 0)[0]
-                    RenderListID = struct.unpack_from("<b", file_bytes, inst_base + 2)[0]
-                    BuildingSwap = struct.unpack_from("<b", file_bytes, inst_base + 3)[0]
-                    ResourceID = struct.unpack_from("<I", file_bytes, inst_base + 4)[0]
-                    MeshOffset = struct.unpack_from("<I", file_bytes, inst_base + 8)[0]
-                    Pointer = struct.unpack_from("<I", file_bytes, inst_base + 12)[0]
-
-                    cls.dprint(f"  Instance {instance_idx}:", logf)
                     cls.dprint(
-                        f"    [0x{inst_base:02X}] ModelID (int16): {ID}",
+                        f"[0x{sector_ofs + 1:02X}] Bool2: {Bool2} (byte value: {sec[1]:02X})",
                         logf,
                     )
                     cls.dprint(
-                        f"    [0x{inst_base + 2:02X}] RenderListID (int8): {RenderListID}",
+                        f"[0x{sector_ofs + 2:02X}] NumInstances (int16): {NumInstances}",
                         logf,
                     )
                     cls.dprint(
-                        f"    [0x{inst_base + 3:02X}] BuildingSwap (int8): {BuildingSwap}",
+                        f"[0x{sector_ofs + 4:02X}] NumShadows   (int16): {NumShadows}",
                         logf,
                     )
                     cls.dprint(
-                        f"    [0x{inst_base + 4:02X}] ResourceID (uint32): "
-                        f"0x{ResourceID:08X} ({ResourceID})",
+                        f"[0x{sector_ofs + 6:02X}] NumLevels    (int16): {NumLevels}",
                         logf,
                     )
                     cls.dprint(
-                        f"    [0x{inst_base + 8:02X}] MeshOffset (uint32): "
-                        f"0x{MeshOffset:08X} ({MeshOffset})",
+                        f"[0x{sector_ofs + 8:02X}] NumLights    (int16): {NumLights}",
                         logf,
                     )
                     cls.dprint(
-                        f"    [0x{inst_base + 12:02X}] Pointer (uint32): "
-                        f"0x{Pointer:08X} ({Pointer})",
+                        f"[0x{sector_ofs + 10:02X}] NumTextures  (int16): {NumTextures}",
                         logf,
                     )
 
-                    if MeshOffset != 0:
-                        mesh_offsets_found.add(MeshOffset)
+                    cls.dprint("Levels:", logf)
+                    level_records = _CW_LEVEL.iter_unpack(file_view[level_base:instance_base])
+                    for level_idx, (X_raw, Y_raw, Z_raw, NumInstances_lvl, Flags_lvl) in enumerate(level_records):
+                        level_ofs = level_base + level_idx * 16
+
+                        X = X_raw * INV_4096
+                        Y = Y_raw * INV_4096
+                        Z = Z_raw * INV_4096
+
+                        cls.dprint(f"    Level {level_idx}:", logf)
+                        cls.dprint(
+                            f"      [0x{level_ofs:02X}] X (int32/4096): {X}",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"      [0x{level_ofs + 4:02X}] Y (int32/4096): {Y}",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"      [0x{level_ofs + 8:02X}] Z (int32/4096): {Z}",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"      [0x{level_ofs + 12:02X}] NumInstances (int16): {NumInstances_lvl}",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"      [0x{level_ofs + 14:02X}] Flags (int16): {Flags_lvl}",
+                            logf,
+                        )
+
+                instance_mesh_offsets = np.frombuffer(
+                    file_view[instance_base:shadow_base], dtype=CW_INSTANCE_DTYPE
+                )["MeshOffset"]
+                mesh_offsets_found.update(
+                    np.unique(instance_mesh_offsets[instance_mesh_offsets != 0]).tolist()
+                )
+
+                if debug:
+                    cls.dprint("Instances:", logf)
+                    instance_records = _CW_INSTANCE.iter_unpack(file_view[instance_base:shadow_base])
+                    for instance_idx, (ID, RenderListID, BuildingSwap, ResourceID, MeshOffset, Pointer) in enumerate(instance_records):
+                        inst_base = instance_base + instance_idx * 16
 
-                level_ofs += 16 * NumInstances
+                        cls.dprint(f"  Instance {instance_idx}:", logf)
+                        cls.dprint(
+                            f"    [0x{inst_base:02X}] ModelID (int16): {ID}",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"    [0x{inst_base + 2:02X}] RenderListID (int8): {RenderListID}",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"    [0x{inst_base + 3:02X}] BuildingSwap (int8): {BuildingSwap}",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"    [0x{inst_base + 4:02X}] ResourceID (uint32): "
+                            f"0x{ResourceID:08X} ({ResourceID})",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"    [0x{inst_base + 8:02X}] MeshOffset (uint32): "
+                            f"0x{MeshOffset:08X} ({MeshOffset})",
+                            logf,
+                        )
+                        cls.dprint(
+                            f"    [0x{inst_base + 12:02X}] Pointer (uint32): "
+                            f"0x{Pointer:08X} ({Pointer})",
+                            logf,
+                        )
 
-                shadow_base = level_ofs
-                if NumShadows > 0:
+                # Shadow and texture tables are only ever dumped to the log.
+                if debug and NumShadows > 0:
                     shadow_stride = 20
                     cls.dprint(
                         f"Shadows ({NumShadows} entries @0x{shadow_base:06X}):",
                         logf,
                     )
-                    for shadow_idx in range(NumShadows):
+                    shadows = np.frombuffer(
+                        file_view[shadow_base:light_base], dtype=CW_SHADOW_DTYPE
+                    )
+                    # tolist() hands back Python scalars, so the log reads
+                    # exactly as it did with per-record struct unpacking.
+                    shadow_rows = zip(
+                        (shadows["CenterX"] * INV_4096).tolist(),
+                        (shadows["CenterY"] * INV_4096).tolist(),
+                        shadows["CenterZ"].astype(np.float64).tolist(),
+                        (shadows["SizeX"] * INV_4096).tolist(),
+                        (shadows["SizeY"] * INV_4096).tolist(),
+                        (shadows["SizeZ"] * INV_4096).tolist(),
+                        shadows["Unknown3"].tolist(),
+                        shadows["Id"].tolist(),
+                        shadows["Pad"].tolist(),
+                    )
+                    for shadow_idx, shadow in enumerate(shadow_rows):
                         s_off = shadow_base + shadow_idx * shadow_stride
                         cls.dprint(
                             f"    Shadow {shadow_idx}: [0x{s_off:06X}] "
-                            + file_bytes[s_off : s_off + shadow_stride]
+                            + file_view[s_off : s_off + shadow_stride]
                             .hex(" ")
                             .upper(),
                             logf,
                         )
 
-                        CenterX = struct.unpack_from("<i", file_bytes, s_off + 0)[0] / 4096.0
-                        CenterY = struct.unpack_from("<i", file_bytes, s_off + 4)[0] / 4096.0
-                        CenterZ = struct.unpack_from("<e", file_bytes, s_off + 8)[0]
-                        SizeX = struct.unpack_from("<h", file_bytes, s_off + 10)[0] / 4096.0
-                        SizeY = struct.unpack_from("<h", file_bytes, s_off + 12)[0] / 4096.0
-                        SizeZ = struct.unpack_from("<h", file_bytes, s_off + 14)[0] / 4096.0
-                        Unknown3 = struct.unpack_from("<h", file_bytes, s_off + 16)[0]
-                        Id = struct.unpack_from("B", file_bytes, s_off + 18)[0]
-                        Pad = struct.unpack_from("B", file_bytes, s_off + 19)[0]
+                        CenterX, CenterY, CenterZ, SizeX, SizeY, SizeZ, Unknown3, Id, Pad = shadow
 
                         cls.dprint(f"      CenterX:   {CenterX}", logf)
                         cls.dprint(f"      CenterY:   {CenterY}", logf)
@@ -443,270 +684,245 @@ class read_chinatown:
                         cls.dprint(f"      Id:        {Id}", logf)
                         cls.dprint(f"      Padding:   {Pad}", logf)
 
-                    level_ofs += NumShadows * shadow_stride
-
-                light_base = level_ofs
                 if NumLights > 0:
                     light_stride = 20
-                    cls.dprint(
-                        f"Lights ({NumLights} entries @0x{light_base:06X}):",
-                        logf,
+                    lights = np.frombuffer(
+                        file_view[light_base:texture_base], dtype=CW_LIGHT_DTYPE
                     )
-                    for light_idx in range(NumLights):
-                        l_off = light_base + light_idx * light_stride
+                    light_positions = (lights["pos"] * INV_4096).tolist()
+                    light_sizes = (lights["Size"] * INV_4096).tolist()
+                    light_ids = lights["Id"].tolist()
+                    if debug:
+                        # Logged in a pass of its own so the build loop
+                        # below carries no per-light debug branch.
                         cls.dprint(
-                            f"    Light {light_idx}: [0x{l_off:06X}] "
-                            + file_bytes[l_off : l_off + light_stride]
-                            .hex(" ")
-                            .upper(),
+                            f"Lights ({NumLights} entries @0x{light_base:06X}):",
                             logf,
                         )
-
-                        X_raw = struct.unpack_from("<I", file_bytes, l_off + 0)[0]
-                        Y_raw = struct.unpack_from("<I", file_bytes, l_off + 4)[0]
-                        Z_raw = struct.unpack_from("<I", file_bytes, l_off + 8)[0]
-                        Size_raw = struct.unpack_from("<H", file_bytes, l_off + 12)[0]
-                        Id = struct.unpack_from("<B", file_bytes, l_off + 14)[0]
-                        R = struct.unpack_from("<B", file_bytes, l_off + 16)[0]
-                        G = struct.unpack_from("<B", file_bytes, l_off + 17)[0]
-                        B = struct.unpack_from("<B", file_bytes, l_off + 18)[0]
-
-                        X = X_raw / 4096.0
-                        Y = Y_raw / 4096.0
-                        Z = Z_raw / 4096.0
-                        Size = Size_raw / 4096.0
-
-                        cls.dprint(f"      X: {X}", logf)
-                        cls.dprint(f"      Y: {Y}", logf)
-                        cls.dprint(f"      Z: {Z}", logf)
-                        cls.dprint(f"      Id: {Id}", logf)
-                        cls.dprint(f"      Color: {R} {G} {B}", logf)
-                        cls.dprint(f"      Size: {Size}", logf)
-
-                        light_data = bpy.data.lights.new(
-                            name=f"CW_Light_{light_idx}", type="POINT"
-                        )
-                        light_object = bpy.data.objects.new(
-                            name=f"CW_Light_{light_idx}", object_data=light_data
+                        light_rows = zip(
+                            light_positions, light_sizes, light_ids, lights["rgb"].tolist()
                         )
-                        context.collection.objects.link(light_object)
-                        light_object.location = (X, Y, Z)
-                        light_data.color = (R / 255.0, G / 255.0, B / 255.0)
+                        for light_idx, ((X, Y, Z), Size, Id, (R, G, B)) in enumerate(light_rows):
+                            l_off = light_base + light_idx * light_stride
+                            cls.dprint(
+                                f"    Light {light_idx}: [0x{l_off:06X}] "
+                                + file_view[l_off : l_off + light_stride]
+                                .hex(" ")
+                                .upper(),
+                                logf,
+                            )
+                            cls.dprint(f"      X: {X}", logf)
+                            cls.dprint(f"      Y: {Y}", logf)
+                            cls.dprint(f"      Z: {Z}", logf)
+                            cls.dprint(f"      Id: {Id}", logf)
+                            cls.dprint(f"      Color: {R} {G} {B}", logf)
+                            cls.dprint(f"      Size: {Size}", logf)
+
+                    light_colors = (lights["rgb"] * INV_255).tolist()
+                    # Lights go straight into the WBL's collection: one link
+                    # per light, nothing parked in the active collection.
+                    link_light = cls.get_or_create_collection(context, wbl_basename).objects.link
+                    light_rows = zip(light_positions, light_sizes, light_ids, light_colors)
+                    for light_idx, (location, Size, Id, color) in enumerate(light_rows):
+                        light_name = f"CW_Light_{light_idx}"
+                        light_data = new_light(name=light_name, type="POINT")
+                        light_data.color = color
                         light_data.energy = max(1.0, Size * 1000.0)
                         light_data.shadow_soft_size = Size
+                        light_object = new_object(name=light_name, object_data=light_data)
+                        light_object.location = location
                         light_object["CW_LightID"] = Id
+                        link_light(light_object)
 
-                    level_ofs += NumLights * light_stride
-
-                if NumTextures > 0:
+                if debug and NumTextures > 0:
                     cls.dprint(f"Textures ({NumTextures} IDs):", logf)
-                    for tex_idx in range(NumTextures):
-                        tex_offset = level_ofs + tex_idx * 2
-                        tex_id = struct.unpack_from("<H", file_bytes, tex_offset)[0]
+                    texture_ids = _U16.iter_unpack(file_view[texture_base:next_sector_ofs])
+                    for tex_idx, (tex_id,) in enumerate(texture_ids):
+                        tex_offset = texture_base + tex_idx * 2
                         cls.dprint(
                             f"  [0x{tex_offset:02X}] Texture ID {tex_idx}: {tex_id}",
                             logf,
                         )
-                    level_ofs += NumTextures * 2
-
-                sector_size = (
-                    12
-                    + (NumLevels * 16)
-                    + (NumInstances * 16)
-                    + (NumShadows * 20)
-                    + (NumLights * 20)
-                    + (NumTextures * 2)
-                )
-                sector_ofs += sector_size
+
+                sector_ofs = next_sector_ofs
 
             cls.dprint("\n==== MESH HEADERS FROM ALL INSTANCES ====", logf)
 
             current_dir = os.path.dirname(filepath)
-            wbl_basename = os.path.basename(filepath)
-            wbl_stem, _ = os.path.splitext(wbl_basename)
-
-            material_bank = cls.MaterialBank(current_dir, logf)
 
-            for MeshOffset in sorted(mesh_offsets_found):
+            material_bank = cls.MaterialBank(current_dir, logf, material_cache)
+            origin = np.array((PosnX, PosnY, PosnZ), dtype=np.float64)
+
+            mesh_offsets = sorted(mesh_offsets_found)
+            # One pass over the headers sizes the merged vertex buffers, so
+            # each mesh decodes straight into its slice; a mesh whose parts
+            # stop short of numVertices leaves a tail the next one overwrites.
+            vertex_capacity = sum(
+                max(0, _I16.unpack_from(file_bytes, mo + 6)[0])
+                for mo in mesh_offsets
+                if 0 <= mo <= len(file_bytes) - 48
+            )
+            world_positions = np.empty((vertex_capacity, 3), dtype=np.float64)
+            world_uv_rows = np.empty((vertex_capacity, 2), dtype=np.float64)
+
+            for MeshOffset in mesh_offsets:
                 if MeshOffset < 0 or MeshOffset > len(file_bytes) - 48:
-                    cls.dprint(
-                        f"  [0x{MeshOffset:02X}] MeshOffset out of file bounds",
-                        logf,
-                    )
+                    if debug:
+                        cls.dprint(
+                            f"  [0x{MeshOffset:02X}] MeshOffset out of file bounds",
+                            logf,
+                        )
                     continue
 
-                mdl_ident = file_bytes[MeshOffset : MeshOffset + 4]
-                ident_str = " ".join(f"{b:02X}" for b in mdl_ident)
-                try:
-                    mdl_ascii = mdl_ident.decode("ascii", errors="replace")
-                except Exception:
-                    mdl_ascii = "??"
-
-                unknown = struct.unpack_from("<b", file_bytes, MeshOffset + 4)[0]
-                numMaterials = struct.unpack_from("<b", file_bytes, MeshOffset + 5)[0]
-                numVertices = struct.unpack_from("<h", file_bytes, MeshOffset + 6)[0]
-                field8 = struct.unpack_from("<f", file_bytes, MeshOffset + 8)[0]
-                fieldC = struct.unpack_from("<f", file_bytes, MeshOffset + 12)[0]
-                boundmin = cls.read_vec3_int4096(file_bytes, MeshOffset + 16)
-                boundmax = cls.read_vec3_int4096(file_bytes, MeshOffset + 28)
-                translationFactor = struct.unpack_from(
-                    "<f", file_bytes, MeshOffset + 40
-                )[0]
-                scaleFactor = struct.unpack_from("<f", file_bytes, MeshOffset + 44)[0]
+                (
+                    mdl_ident,
+                    unknown,
+                    numMaterials,
+                    numVertices,
+                    field8,
+                    fieldC,
+                    bminx, bminy, bminz,
+                    bmaxx, bmaxy, bmaxz,
+                    translationFactor,
+                    scaleFactor,
+                ) = _CW_MDL_HEADER.unpack_from(file_bytes, MeshOffset)
+
+                if debug:
+                    boundmin = (bminx * INV_4096, bminy * INV_4096, bminz * INV_4096)
+                    boundmax = (bmaxx * INV_4096, bmaxy * INV_4096, bmaxz * INV_4096)
+
+                    ident_str = mdl_ident.hex(" ").upper()
+                    try:
+                        mdl_ascii = mdl_ident.decode("ascii", errors="replace")
+                    except Exception:
+                        mdl_ascii = "??"
 
-                cls.dprint(
-                    f"  [0x{MeshOffset:02X}] MDL Identifier: {ident_str} ('{mdl_ascii}')",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 4:02X}] Unknown (int8): {unknown}",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 5:02X}] numMaterials (int8): {numMaterials}",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 6:02X}] numVertices (int16): {numVertices}",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 8:02X}] Field 8 (float): {field8} ({field8})",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 12:02X}] Field C (float): {fieldC} ({fieldC})",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 16:02X}] BoundMin (3 floats): "
-                    f"({boundmin[0]}, {boundmin[1]}, {boundmin[2]})",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 28:02X}] BoundMax (3 floats): "
-                    f"({boundmax[0]}, {boundmax[1]}, {boundmax[2]})",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 40:02X}] uv Offset: {translationFactor}",
-                    logf,
-                )
-                cls.dprint(
-                    f"    [0x{MeshOffset + 44:02X}] Scale Factor: {scaleFactor}",
-                    logf,
-                )
+                    cls.dprint(
+                        f"  [0x{MeshOffset:02X}] MDL Identifier: {ident_str} ('{mdl_ascii}')",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 4:02X}] Unknown (int8): {unknown}",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 5:02X}] numMaterials (int8): {numMaterials}",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 6:02X}] numVertices (int16): {numVertices}",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 8:02X}] Field 8 (float): {field8} ({field8})",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 12:02X}] Field C (float): {fieldC} ({fieldC})",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 16:02X}] BoundMin (3 floats): "
+                        f"({boundmin[0]}, {boundmin[1]}, {boundmin[2]})",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 28:02X}] BoundMax (3 floats): "
+                        f"({boundmax[0]}, {boundmax[1]}, {boundmax[2]})",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 40:02X}] uv Offset: {translationFactor}",
+                        logf,
+                    )
+                    cls.dprint(
+                        f"    [0x{MeshOffset + 44:02X}] Scale Factor: {scaleFactor}",
+                        logf,
+                    )
 
                 stride = 16
                 vertex_base = MeshOffset + 48
 
-                all_verts: List[Tuple[float, float, float]] = []
-                all_normals: List[Tuple[float, float, float]] = []
-                all_uvs: List[Tuple[float, float]] = []
-
-                for vi in range(numVertices):
-                    v_off = vertex_base + vi * stride
-
-                    x_raw = struct.unpack_from("<h", file_bytes, v_off + 0)[0]
-                    y_raw = struct.unpack_from("<h", file_bytes, v_off + 2)[0]
-                    z_raw = struct.unpack_from("<h", file_bytes, v_off + 4)[0]
-                    x = x_raw / scaleFactor + PosnX
-                    y = y_raw / scaleFactor + PosnY
-                    z = z_raw / scaleFactor + PosnZ
-
-                    nx_raw = struct.unpack_from("<h", file_bytes, v_off + 6)[0]
-                    ny_raw = struct.unpack_from("<h", file_bytes, v_off + 8)[0]
-                    nz_raw = struct.unpack_from("<h", file_bytes, v_off + 10)[0]
-                    nx = nx_raw / 32768.0
-                    ny = ny_raw / 32768.0
-                    nz = nz_raw / 32768.0
-
-                    u_raw = struct.unpack_from("<h", file_bytes, v_off + 12)[0]
-                    v_raw = struct.unpack_from("<h", file_bytes, v_off + 14)[0]
-                    u = (u_raw / 2048.0) + translationFactor * 2
-                    v = 1.0 - (v_raw / 2048.0)
-
-                    all_verts.append((x, y, z))
-                    all_normals.append((nx, ny, nz))
-                    all_uvs.append((u, v))
+                mesh_end = world_vert_count + max(0, numVertices)
+                positions, uvs = cls.decode_vertices(
+                    file_bytes,
+                    vertex_base,
+                    numVertices,
+                    scaleFactor,
+                    origin,
+                    translationFactor,
+                    out=(
+                        world_positions[world_vert_count:mesh_end],
+                        world_uv_rows[world_vert_count:mesh_end],
+                    ),
+                )
 
                 vert_offset = 0
                 material_table_offset = vertex_base + (numVertices * stride)
 
-                for mi in range(numMaterials):
-                    m_off = material_table_offset + mi * 12
-                    tex_id = struct.unpack_from("<H", file_bytes, m_off + 0)[0]
-                    vertex_count = struct.unpack_from("<H", file_bytes, m_off + 2)[0]
-                    render_flags = struct.unpack_from("<B", file_bytes, m_off + 4)[0]
-                    node = struct.unpack_from("<B", file_bytes, m_off + 5)[0]
-                    field6 = struct.unpack_from("<B", file_bytes, m_off + 6)[0]
-                    field7 = struct.unpack_from("<B", file_bytes, m_off + 7)[0]
-                    variance_flags = struct.unpack_from("<i", file_bytes, m_off + 8)[0]
+                mesh_parts = _CW_MESH_PART.iter_unpack(
+                    file_view[material_table_offset:material_table_offset + numMaterials * 12]
+                )
+                for mi, (tex_id, vertex_count, render_flags, node, field6, field7, variance_flags) in enumerate(mesh_parts):
 
                     uv_mul = 3.0 if render_flags == 4 else 2.0
 
-                    cls.dprint(f"---- Mesh Part {mi}: ----", logf)
-                    cls.dprint(f"  Texture ID: {tex_id}", logf)
-                    cls.dprint(f"  Vertex Count: {vertex_count}", logf)
-                    cls.dprint(f"  Rendering Flags: {render_flags}", logf)
-                    cls.dprint(f"  Node: {node}", logf)
-                    cls.dprint(f"  Field6: {field6}", logf)
-                    cls.dprint(f"  Field7: {field7}", logf)
-                    cls.dprint(f"  VarianceFlags: {variance_flags}", logf)
-
-                    global_base_index = len(world_verts)
-
-                    for i in range(vertex_count):
-                        idx = vert_offset + i
-                        world_verts.append(all_verts[idx])
-
-                        u_norm, v_norm = all_uvs[idx]
-                        u_final = u_norm + translationFactor * uv_mul
-                        world_uvs.append((u_final, v_norm))
+                    if debug:
+                        cls.dprint(f"---- Mesh Part {mi}: ----", logf)
+                        cls.dprint(f"  Texture ID: {tex_id}", logf)
+                        cls.dprint(f"  Vertex Count: {vertex_count}", logf)
+                        cls.dprint(f"  Rendering Flags: {render_flags}", logf)
+                        cls.dprint(f"  Node: {node}", logf)
+                        cls.dprint(f"  Field6: {field6}", logf)
+                        cls.dprint(f"  Field7: {field7}", logf)
+                        cls.dprint(f"  VarianceFlags: {variance_flags}", logf)
+
+                    part_end = vert_offset + vertex_count
+                    # Parts share the mesh's slice of the merged buffer; one
+                    # running past numVertices would index the next mesh.
+                    if part_end > numVertices:
+                        raise ValueError(
+                            f"MDL at 0x{MeshOffset:X}: part {mi} needs vertices "
+                            f"{vert_offset}-{part_end - 1}, mesh has {numVertices}"
+                        )
+                    part_uvs = uvs[vert_offset:part_end]
+                    part_uvs[:, 0] += translationFactor * uv_mul
 
-                    local_faces = cls.tri_strip_to_tris(vertex_count)
+                    local_faces = cls.tri_strip_to_tris(len(part_uvs))
 
                     mat_index = material_bank.get_slot(tex_id)
-                    for (a, b, c) in local_faces:
-                        world_faces.append(
-                            (
-                                global_base_index + a,
-                                global_base_index + b,
-                                global_base_index + c,
-                            )
-                        )
-                        world_face_material_indices.append(mat_index)
+                    world_face_chunks.append(local_faces + world_vert_count)
+                    world_face_material_indices.extend([mat_index] * len(local_faces))
 
-                    vert_offset += vertex_count
+                    world_vert_count += len(part_uvs)
+                    vert_offset = part_end
+
+            world_faces = (
+                np.concatenate(world_face_chunks)
+                if world_face_chunks
+                else np.empty((0, 3), dtype=np.int32)
+            )
+            if len(world_faces) and world_vert_count:
+                world_uvs = world_uv_rows[:world_vert_count].astype(np.float32)
 
-            if world_faces and world_verts:
                 mesh_name = f"CW_{wbl_stem}"
                 mesh = bpy.data.meshes.new(mesh_name)
-                mesh.from_pydata(world_verts, [], world_faces)
-                mesh.update()
+                cls.fill_tri_mesh(mesh, world_positions[:world_vert_count], world_faces)
 
+                # Loops follow face order, so the strip indices double as the
+                # per-loop vertex lookup.
                 uv_layer = mesh.uv_layers.new(name="UVMap")
-                for poly_idx, poly in enumerate(mesh.polygons):
-                    poly.material_index = world_face_material_indices[poly_idx]
-                    for loop_index in poly.loop_indices:
-                        v_idx = mesh.loops[loop_index].vertex_index
-                        uv_layer.data[loop_index].uv = world_uvs[v_idx]
+                uv_layer.data.foreach_set("uv", world_uvs[world_faces.ravel()].ravel())
+                mesh.polygons.foreach_set(
+                    "material_index",
+                    np.asarray(world_face_material_indices, dtype=np.int32),
+                )
 
                 material_bank.append_all_to_mesh(mesh)
 
                 obj = bpy.data.objects.new(mesh.name, mesh)
 
-                coll_name = f"{wbl_basename}"
-                coll = bpy.data.collections.get(coll_name)
-                if not coll:
-                    coll = bpy.data.collections.new(coll_name)
-                    if coll.name not in {c.name for c in context.scene.collection.children}:
-                        context.scene.collection.children.link(coll)
-
-                coll.objects.link(obj)
-
-                if obj.name in context.collection.objects:
-                    context.collection.objects.unlink(obj)
+                cls.get_or_create_collection(context, wbl_basename).objects.link(obj)
             else:
                 cls.dprint(
                     "No vertices/faces accumulated for worldblock; nothing to create.",
@@ -714,6 +930,7 @@ class read_chinatown:
                 )
 
         except Exception as e:
+            import traceback
             tb_str = traceback.format_exc()
             if logf:
                 logf.write("IMPORT ERROR\n")
@@ -722,6 +939,14 @@ class read_chinatown:
 
             raise RuntimeError(f"Import error while reading '{filepath}': {e}") from e
         finally:
+            # The chained traceback keeps this frame alive; unmap here so the
+            # .wbl isn't left open (and locked on Windows) until it is freed.
+            if file_view is not None:
+                try:
+                    file_view.release()
+                except BufferError:
+                    pass
+            cls.close_mapped(file_bytes)
             if logf:
                 cls.dprint("==== END OF DEBUG LOG ====", logf)
                 logf.close()
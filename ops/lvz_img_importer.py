@@ -7,6 +7,7 @@
 # the Free Software Foundation, either version 3 of the License, or
 # (at your option) any later version.
 
+import os
 import re
 import struct
 import time
@@ -382,6 +383,8 @@ def finish_active_import_progress(context=None, succeeded=True, message=None):
                 context.window.cursor_set("DEFAULT")
             except Exception:
                 pass
+    if LVZ.DEBUG is not None:
+        LVZ.DEBUG.flush_console()
     restore_active_import_undo_state()
 
 
@@ -771,6 +774,16 @@ def read_img_next_to_lvz(lvz_path: str) -> Tuple[Optional[bytes], Optional[str]]
         seen.add(key)
         candidates.append(candidate)
 
+    def load_candidate(candidate: Path) -> Tuple[Optional[bytes], Optional[str]]:
+        if not candidate.exists():
+            return None, None
+        try:
+            if candidate.name.lower().endswith(".zip"):
+                return read_img_from_zip(candidate)
+            return LVZ.map_img_file(str(candidate)), candidate.name
+        except Exception:
+            return None, None
+
     for stem in (exact_stem, base_stem):
         if not stem:
             continue
@@ -779,46 +792,45 @@ def read_img_next_to_lvz(lvz_path: str) -> Tuple[Optional[bytes], Optional[str]]
         add_candidate(folder / f"{stem}.img.zip")
         add_candidate(folder / f"{stem}.IMG.zip")
 
-    if folder.exists():
-        for child in folder.iterdir():
-            if not child.is_file():
-                continue
-
-            lower_name = child.name.lower()
-            child_stem = None
-            if lower_name.endswith(".img"):
-                child_stem = child.stem
-            elif lower_name.endswith(".img.zip"):
-                child_stem = Path(child.stem).stem
-
-            if child_stem is None:
-                continue
+    # Exact names win, so only list the folder when none of them loads.
+    for candidate in candidates:
+        img_bytes, img_name = load_candidate(candidate)
+        if img_bytes is not None:
+            return img_bytes, img_name
 
-            if normalized_copy_stem(child_stem).lower() == base_stem.lower():
-                add_candidate(child)
+    # One scandir pass; names are filtered before any per-entry stat.
+    exact_count = len(candidates)
+    rar_name = None
+    if folder.exists():
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                lower_name = entry.name.lower()
+                if lower_name.endswith(".img"):
+                    child_stem = entry.name[:-4]
+                elif lower_name.endswith(".img.zip"):
+                    child_stem = entry.name[:-8]
+                elif lower_name.endswith(".rar"):
+                    child_stem = entry.name[:-4]
+                else:
+                    continue
 
-    for candidate in candidates:
-        if not candidate.exists():
-            continue
+                if normalized_copy_stem(child_stem).lower() != base_stem.lower():
+                    continue
+                if not entry.is_file():
+                    continue
+                if lower_name.endswith(".rar"):
+                    if rar_name is None:
+                        rar_name = entry.name
+                    continue
+                add_candidate(folder / entry.name)
 
-        try:
-            if candidate.name.lower().endswith(".zip"):
-                img_bytes, img_name = read_img_from_zip(candidate)
-                if img_bytes is not None:
-                    return img_bytes, img_name
-            else:
-                return candidate.read_bytes(), candidate.name
-        except Exception:
-            continue
+    for candidate in candidates[exact_count:]:
+        img_bytes, img_name = load_candidate(candidate)
+        if img_bytes is not None:
+            return img_bytes, img_name
 
-    if folder.exists():
-        for child in folder.iterdir():
-            if not child.is_file():
-                continue
-            if child.suffix.lower() != ".rar":
-                continue
-            if normalized_copy_stem(child.stem).lower() == base_stem.lower():
-                return None, f"RAR archive found beside LVZ: {child.name}. Extract the .img beside the .lvz; BLeeds does not read RAR files directly."
+    if rar_name is not None:
+        return None, f"RAR archive found beside LVZ: {rar_name}. Extract the .img beside the .lvz; BLeeds does not read RAR files directly."
 
     return None, None
 
@@ -8445,7 +8457,21 @@ def blds_create_placed_model_2dfx_helpers(collection, placed_obj, import_stem: s
             )
     return made
 
-def iter_import_lvz_img_archive(operator, context, lvz_path: str, apply_img_transforms: bool = True, debug_print: bool = False, write_debug_log: bool = True, game_dtz_path: str = "", import_game_dtz_2dfx: bool = True):
+def iter_import_lvz_img_archive(operator, context, lvz_path: str, apply_img_transforms: bool = True, debug_print: bool = False, write_debug_log: bool = True, game_dtz_path: str = "", import_game_dtz_2dfx: bool = True, cache_decompressed_lvz: bool = False):
+    # The companion IMG is memory-mapped. Unmap it however the import ends:
+    # finished, failed, or closed by the operator on cancel.
+    opened_imgs = []
+    try:
+        return (yield from _iter_import_lvz_img_archive(
+            operator, context, lvz_path, apply_img_transforms, debug_print,
+            write_debug_log, game_dtz_path, import_game_dtz_2dfx,
+            cache_decompressed_lvz, opened_imgs,
+        ))
+    finally:
+        for img_bytes in opened_imgs:
+            LVZ.close_img_file(img_bytes)
+
+def _iter_import_lvz_img_archive(operator, context, lvz_path: str, apply_img_transforms: bool, debug_print: bool, write_debug_log: bool, game_dtz_path: str, import_game_dtz_2dfx: bool, cache_decompressed_lvz: bool, opened_imgs: list):
     if not lvz_path:
         operator.report({'ERROR'}, "No LVZ selected.")
         return {'CANCELLED'}
@@ -8499,8 +8525,16 @@ def iter_import_lvz_img_archive(operator, context, lvz_path: str, apply_img_tran
 
     t0 = time.time()
     create_game_dtz_2dfx_helpers = bool(CREATE_GAME_DTZ_2DFX_HELPERS and import_game_dtz_2dfx)
-    lvz_bytes_in = Path(lvz_path).read_bytes()
-    decomp, was_cmp = LVZ.safe_decompress(lvz_bytes_in)
+    # Only the decompressed image is parsed; the zlib stream is not kept alive
+    # for the rest of the import.
+    decomp, was_cmp, lvz_input_size = LVZ.read_lvz_file(lvz_path, use_cache=cache_decompressed_lvz)
+    if not was_cmp and decomp[:4] != b"DLRW":
+        # Neither a zlib stream nor a bare WRLD; don't build anything from it.
+        progress.finish(succeeded=False, message="Not a Leeds LVZ")
+        operator.report({'ERROR'}, "Not a Leeds LVZ: no zlib stream or DLRW signature at the start of the file.")
+        if LVZ.DEBUG is not None:
+            LVZ.DEBUG.flush()
+        return {'CANCELLED'}
     progress.update(4, "Decoding LVZ container")
     yield None
 
@@ -8533,7 +8567,7 @@ def iter_import_lvz_img_archive(operator, context, lvz_path: str, apply_img_tran
         _ACTIVE_IMPORT_UNDO_STATE = None
 
     LVZ.dbg(f"LVZ: {lvz_path}")
-    LVZ.dbg(f"[io] LVZ bytes in: {len(lvz_bytes_in)}  decomp: {len(decomp)} ({'compressed' if was_cmp else 'raw'})")
+    LVZ.dbg(f"[io] LVZ bytes in: {lvz_input_size}  decomp: {len(decomp)} ({'compressed' if was_cmp else 'raw'})")
     LVZ.dbg("Retail LVZ+IMG import: no .DIR used. IMG resources are reconstructed from LVZ chunk headers and exact WRLD/AERA resource tables.")
     # Converter IDE/IPL sidecars are not part of the LVZ/IMG placement path.
     # Keep compatibility maps empty; authoritative GAME_MODEL identity is read
@@ -8572,6 +8606,7 @@ def iter_import_lvz_img_archive(operator, context, lvz_path: str, apply_img_tran
     img_bytes, img_name = None, None
     try:
         img_bytes, img_name = read_img_next_to_lvz(lvz_path)
+        opened_imgs.append(img_bytes)
         if img_bytes:
             LVZ.dbg(f"— IMG Read — source: {img_name} bytes={len(img_bytes)}")
         elif img_name:
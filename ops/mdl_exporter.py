@@ -22,6 +22,7 @@ import bpy
 import bmesh
 import math
 import struct
+import numpy as np
 from mathutils import Vector, Matrix
 
 from ..leedsLib import mdl as mdl_lib
@@ -4454,14 +4455,18 @@ def build_strip_vertices_world(
 
         key_to_vertex: dict = {}
 
+        loop_uvs = None
+        if uv_layer is not None:
+            uv_flat = np.empty(len(uv_layer) * 2, dtype=np.float32)
+            uv_layer.foreach_get("uv", uv_flat)
+            loop_uvs = uv_flat.reshape(-1, 2).tolist()
+
         def get_corner_key(loop_index: int, vert_index: int) -> tuple:
             v = mesh_eval.vertices[vert_index]
             wp = world_mtx @ v.co
 
-            if uv_layer is not None:
-                uv = uv_layer[loop_index].uv
-                u = float(uv.x)
-                vv = float(uv.y)
+            if loop_uvs is not None:
+                u, vv = loop_uvs[loop_index]
             else:
                 u, vv = 0.0, 0.0
 
@@ -4531,13 +4536,19 @@ def build_strip_vertices_world(
                 )
             return key
 
+        tri_count = len(mesh_eval.loop_triangles)
+        tri_loops = np.empty(tri_count * 3, dtype=np.int32)
+        tri_verts = np.empty(tri_count * 3, dtype=np.int32)
+        mesh_eval.loop_triangles.foreach_get("loops", tri_loops)
+        mesh_eval.loop_triangles.foreach_get("vertices", tri_verts)
+        corner_loops = tri_loops.tolist()
+        corner_verts = tri_verts.tolist()
+
         tris_keys: List[tuple] = []
-        for tri in mesh_eval.loop_triangles:
-            loops = tri.loops
-            verts = tri.vertices
-            k0 = get_corner_key(int(loops[0]), int(verts[0]))
-            k1 = get_corner_key(int(loops[1]), int(verts[1]))
-            k2 = get_corner_key(int(loops[2]), int(verts[2]))
+        for c in range(0, tri_count * 3, 3):
+            k0 = get_corner_key(corner_loops[c], corner_verts[c])
+            k1 = get_corner_key(corner_loops[c + 1], corner_verts[c + 1])
+            k2 = get_corner_key(corner_loops[c + 2], corner_verts[c + 2])
             tris_keys.append((k0, k1, k2))
 
         if not tris_keys:
@@ -5102,16 +5113,19 @@ def export_stories_mdl_ps2(
             return 32767
         return iv
 
-    def encode_bbox_i16_from_vertices(vertices, sp):
+    def gather_vertex_bounds(vertices):
+        # One pass over the Vectors, then both reductions in numpy; the bbox
+        # and bounding sphere of a part share the result.
         if not vertices:
+            return None
+        coords = np.array([(v.x, v.y, v.z) for v in vertices], dtype=np.float64)
+        return coords, coords.min(axis=0).tolist(), coords.max(axis=0).tolist()
+
+    def encode_bbox_i16_from_bounds(bounds, sp):
+        if bounds is None:
             return [0, 0, 0, 0, 0, 0]
 
-        min_x = min(v.x for v in vertices)
-        min_y = min(v.y for v in vertices)
-        min_z = min(v.z for v in vertices)
-        max_x = max(v.x for v in vertices)
-        max_y = max(v.y for v in vertices)
-        max_z = max(v.z for v in vertices)
+        _coords, (min_x, min_y, min_z), (max_x, max_y, max_z) = bounds
 
         GLOBAL_SCALE = 100.0 * 0.00000030518203134641490805874367518203
 
@@ -5131,29 +5145,20 @@ def export_stories_mdl_ps2(
             clamp_i16((max_z - tz) / (sz * GLOBAL_SCALE)),
         ]
 
-    def compute_sphere_from_vertices(vertices):
-        if not vertices:
+    def compute_sphere_from_bounds(bounds):
+        if bounds is None:
             return (0.0, 0.0, 0.0, 0.0)
 
-        min_x = min(v.x for v in vertices)
-        min_y = min(v.y for v in vertices)
-        min_z = min(v.z for v in vertices)
-        max_x = max(v.x for v in vertices)
-        max_y = max(v.y for v in vertices)
-        max_z = max(v.z for v in vertices)
+        coords, (min_x, min_y, min_z), (max_x, max_y, max_z) = bounds
 
         cx = (min_x + max_x) * 0.5
         cy = (min_y + max_y) * 0.5
         cz = (min_z + max_z) * 0.5
 
-        radius = 0.0
-        for v in vertices:
-            dx = v.x - cx
-            dy = v.y - cy
-            dz = v.z - cz
-            dist = math.sqrt(dx * dx + dy * dy + dz * dz)
-            if dist > radius:
-                radius = dist
+        dx = coords[:, 0] - cx
+        dy = coords[:, 1] - cy
+        dz = coords[:, 2] - cz
+        radius = math.sqrt(float((dx * dx + dy * dy + dz * dz).max()))
 
         return (float(cx), float(cy), float(cz), float(radius))
 
@@ -5174,10 +5179,7 @@ def export_stories_mdl_ps2(
 
         qwc_total = len(merged_body) // 16
         merged = bytearray()
-        merged.extend(mdl_lib.write_u32(0x60000000 | (qwc_total & 0xFFFF)))
-        merged.extend(mdl_lib.write_u32(0))
-        merged.extend(mdl_lib.write_u32(0))
-        merged.extend(mdl_lib.write_u32(0))
+        mdl_lib.append_u32_words(merged, 0x60000000 | (qwc_total & 0xFFFF), 0, 0, 0)
         merged.extend(merged_body)
         return merged
 
@@ -5616,10 +5618,7 @@ def export_stories_mdl_ps2(
 
             qwc_total = len(part_vif) // 16
             dma_tag = 0x60000000 | (qwc_total & 0xFFFF)
-            mesh_dma.extend(mdl_lib.write_u32(dma_tag))
-            mesh_dma.extend(mdl_lib.write_u32(0))
-            mesh_dma.extend(mdl_lib.write_u32(0))
-            mesh_dma.extend(mdl_lib.write_u32(0))
+            mdl_lib.append_u32_words(mesh_dma, dma_tag, 0, 0, 0)
             mesh_dma.extend(part_vif)
             mdl_lib.validate_dma_ref_packet(
                 bytes(mesh_dma),
@@ -5650,11 +5649,12 @@ def export_stories_mdl_ps2(
 
             skin_export_stats = buildMdlPedSkinExportStats(mesh_obj, strip, sub_strips, root_obj=root) if mdl_type_u_for_split == "PED" else {}
 
+            strip_bounds = gather_vertex_bounds(strip)
             header_entry = {
                 "part_index": int(logical_part_index),
                 "source_had_part_index": bool(source_had_part_index),
                 "skin_export_stats": skin_export_stats,
-                "sphere": compute_sphere_from_vertices(strip),
+                "sphere": compute_sphere_from_bounds(strip_bounds),
                 "uv_scale_u": 1.0,
                 "uv_scale_v": 1.0,
                 "flags": 0x10,
@@ -5665,7 +5665,7 @@ def export_stories_mdl_ps2(
                 "emitted_setup_vertex_count": int(0),
                 "vertex_stream_attribute_mode": "POINT_IMPORTED_SOURCE_AUTHORITY" if source_stream_used else "FACE_TOPOLOGY_INDEPENDENT_STRIPS",
                 "tex_id": (len(part_material_names) - 1),
-                "bbox_i16": encode_bbox_i16_from_vertices(strip, scale_pos),
+                "bbox_i16": encode_bbox_i16_from_bounds(strip_bounds, scale_pos),
             }
 
             part_leeds_headers.append(header_entry)
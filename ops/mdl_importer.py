@@ -26,6 +26,12 @@ from mathutils import Matrix, Vector
 
 from ..leedsLib import mdl as stories_mdl
 from ..leedsLib import lvz_img as embedded_mdl
+from ..data.bone_data import (
+    commonBoneIndexLCS,
+    commonBoneParentIdxLCS,
+    commonBoneIndexVCS,
+    commonBoneParentIdxVCS,
+)
 from .. import ensure_mesh_attribute, get_mesh_attribute, remove_mesh_attribute, get_or_create_corner_color_layer, set_active_object, set_object_selected, set_mesh_auto_smooth, set_mesh_gouraud_shading, stamp_bleeds_entity_type
 
 #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #   #
@@ -352,12 +358,19 @@ def get_bone_name_list(import_type: int) -> List[str]:
 
     return names
 
-def get_bone_parent_map(import_type: int) -> Dict[str, str]:
+def get_bone_index_map(import_type: int) -> Dict[str, int]:
+    if import_type in (0, 1):
+        return commonBoneIndexLCS
+    if import_type in (2, 3):
+        return commonBoneIndexVCS
+    return {name: index for index, name in enumerate(get_bone_name_list(import_type))}
+
+def get_bone_parent_indices(import_type: int) -> Tuple[int, ...]:
     if import_type in (0, 1):
-        return dict(stories_mdl.commonBoneParentsLCS)
+        return commonBoneParentIdxLCS
     if import_type in (2, 3):
-        return dict(stories_mdl.commonBoneParentsVCS)
-    return {}
+        return commonBoneParentIdxVCS
+    return ()
 
 def create_armature_from_context(
     context: bpy.types.Context,
@@ -383,7 +396,8 @@ def create_armature_from_context(
     view_layer.objects.active = arm_obj
     bpy.ops.object.mode_set(mode="EDIT")
 
-    bone_parent_map = get_bone_parent_map(stories_ctx.import_type)
+    bone_names = get_bone_name_list(stories_ctx.import_type)
+    bone_index_map = get_bone_index_map(stories_ctx.import_type)
     name_to_edit_bone: Dict[str, bpy.types.EditBone] = {}
     ptr_to_edit_bone: Dict[int, bpy.types.EditBone] = {}
     mdl_type_u = str(getattr(stories_ctx, "mdl_type", "") or "").upper().strip()
@@ -410,16 +424,18 @@ def create_armature_from_context(
         if parent_ptr and parent_ptr in ptr_to_edit_bone and parent_ptr != ptr:
             edit_bone.parent = ptr_to_edit_bone[parent_ptr]
 
-    for name, edit_bone in name_to_edit_bone.items():
-        if edit_bone.parent is not None:
+    for bone_index, parent_index in enumerate(get_bone_parent_indices(stories_ctx.import_type)):
+        edit_bone = name_to_edit_bone.get(bone_names[bone_index])
+        if edit_bone is None or edit_bone.parent is not None or parent_index < 0:
             continue
-        parent_name = bone_parent_map.get(name)
-        if parent_name and parent_name in name_to_edit_bone:
-            edit_bone.parent = name_to_edit_bone[parent_name]
+        parent_bone = name_to_edit_bone.get(bone_names[parent_index])
+        if parent_bone is not None:
+            edit_bone.parent = parent_bone
 
     bpy.ops.object.mode_set(mode="OBJECT")
 
     try:
+        id_map, type_map = stories_mdl._ped_known_hanim_maps(stories_ctx.import_type)
         for ptr, name in arm_info.frame_names.items():
             bone = arm_data.bones.get(name)
             if bone is None:
@@ -428,20 +444,17 @@ def create_armature_from_context(
             writeBlenderRestMatrixAttributes(bone, arm_data, str(name))
             try:
                 canon_name = stories_mdl.canon_frame_name(str(name))
-                id_map, type_map = stories_mdl._ped_known_hanim_maps(stories_ctx.import_type)
                 if canon_name in id_map:
                     anim_bone_id = int(id_map[canon_name])
                     bone["BoneID"] = anim_bone_id
                     bone["bleeds_hanim_bone_id"] = anim_bone_id
                     bone["bleeds_anim_bone_id"] = anim_bone_id
                     bone["bleeds_mdl_anim_bone_id"] = anim_bone_id
-                else:
-                    bone_names = get_bone_name_list(stories_ctx.import_type)
-                    if str(name) in bone_names:
-                        anim_bone_id = int(bone_names.index(str(name)))
-                        bone["BoneID"] = anim_bone_id
-                        bone["bleeds_anim_bone_id"] = anim_bone_id
-                        bone["bleeds_mdl_anim_bone_id"] = anim_bone_id
+                elif str(name) in bone_index_map:
+                    anim_bone_id = int(bone_index_map[str(name)])
+                    bone["BoneID"] = anim_bone_id
+                    bone["bleeds_anim_bone_id"] = anim_bone_id
+                    bone["bleeds_mdl_anim_bone_id"] = anim_bone_id
                 if canon_name in type_map:
                     bone["BoneType"] = int(type_map[canon_name])
                     bone["bleeds_hanim_bone_type"] = int(type_map[canon_name])
@@ -3919,7 +3932,7 @@ def import_stories_mdl(
         root_obj["bleeds_mdl_source_filepath"] = str(filepath)
 
         try:
-            source_template = mdl_lib._load_ped_source_template_blocks({
+            source_template = stories_mdl._load_ped_source_template_blocks({
                 "source_filepath": str(filepath),
                 "frame_ptr": int(getattr(atomic, "frame_ptr", 0) or 0),
                 "geom_ptr": int(getattr(atomic, "geom_ptr", 0) or 0),
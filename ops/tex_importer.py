@@ -666,6 +666,28 @@ def decode_mh2_tex_to_blender_images(
     return images
 
 
+def is_plausible_psp(h: Optional[PspTexHeader]) -> bool:
+    if not h:
+        return False
+
+    if h.bpp not in (4, 8, 32):
+        return False
+    if h.width < 4 or h.height < 4:
+        return False
+    return True
+
+
+def is_plausible_ps2(h: Optional[Ps2TexHeader]) -> bool:
+    if not h:
+        return False
+
+    if h.bpp not in (4, 8, 16, 32):
+        return False
+    if h.width < 4 or h.height < 4:
+        return False
+    return True
+
+
 def decode_chk_to_blender_images(
     input_path: str,
     platform: str = 'auto',
@@ -729,27 +751,6 @@ def decode_chk_to_blender_images(
             elif platform == 'ps2':
                 header_obj = hdr_ps2
             else:
-
-                def is_plausible_psp(h: Optional[PspTexHeader]) -> bool:
-                    if not h:
-                        return False
-
-                    if h.bpp not in (4, 8, 32):
-                        return False
-                    if h.width < 4 or h.height < 4:
-                        return False
-                    return True
-
-                def is_plausible_ps2(h: Optional[Ps2TexHeader]) -> bool:
-                    if not h:
-                        return False
-
-                    if h.bpp not in (4, 8, 16, 32):
-                        return False
-                    if h.width < 4 or h.height < 4:
-                        return False
-                    return True
-
                 has_psp = is_plausible_psp(hdr_psp)
                 has_ps2 = is_plausible_ps2(hdr_ps2)
                 if has_psp and not has_ps2:
@@ -475,17 +475,19 @@ def _build_bsp_mesh_object(
     collection: bpy.types.Collection,
     txd_path: Optional[Path],
 ):
-    faces, face_materials = bsp.triangle_strip_faces(block)
-    if not faces:
+    faces, face_material_array = bsp.triangle_strip_faces(block)
+    if not len(faces):
         return None, 0
 
-    from collections import Counter
-
-    material_face_counts = Counter(
-        int(index) for index in face_materials
-        if 0 <= int(index) < len(materials)
+    valid_faces = (face_material_array >= 0) & (face_material_array < len(materials))
+    used_sources, first_seen, face_counts = np.unique(
+        face_material_array[valid_faces], return_index=True, return_counts=True
     )
-    dominant_material_index = material_face_counts.most_common(1)[0][0] if material_face_counts else 0
+    dominant_material_index = 0
+    if len(used_sources):
+        # Ties go to the material seen first, as Counter.most_common did.
+        busiest = np.flatnonzero(face_counts == face_counts.max())
+        dominant_material_index = int(used_sources[busiest[np.argmin(first_seen[busiest])]])
     dominant_material_name = "Untextured"
     if 0 <= dominant_material_index < len(materials):
         try:
@@ -500,23 +502,23 @@ def _build_bsp_mesh_object(
     dominant_material_name = dominant_material_name or "Untextured"
     object_name = f"{stem} Part {block_index + 1:03d} - {dominant_material_name}"
     mesh = bpy.data.meshes.new(object_name)
-    mesh.from_pydata([vertex.position for vertex in block.vertices], [], faces)
+    mesh.from_pydata([vertex.position for vertex in block.vertices], [], faces.tolist())
     mesh.update()
 
-    used_material_indices = sorted(material_face_counts)
+    used_material_indices = used_sources.tolist()
     if not used_material_indices and materials:
         used_material_indices = [0]
-    local_material_indices = {}
     for source_index in used_material_indices:
-        local_material_indices[int(source_index)] = len(mesh.materials)
         mesh.materials.append(materials[int(source_index)])
-    for polygon_index, polygon in enumerate(mesh.polygons):
-        source_index = face_materials[polygon_index] if polygon_index < len(face_materials) else 0
-        polygon.material_index = int(local_material_indices.get(int(source_index), 0))
-        try:
-            polygon.use_smooth = True
-        except Exception:
-            pass
+    # used_sources is sorted, so each face's slot is its rank within it;
+    # faces with an out-of-range material fall back to slot 0.
+    polygon_slots = np.zeros(len(mesh.polygons), dtype=np.int32)
+    polygon_slots[valid_faces] = np.searchsorted(used_sources, face_material_array[valid_faces])
+    mesh.polygons.foreach_set("material_index", polygon_slots)
+    try:
+        mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=bool))
+    except Exception:
+        pass
 
     try:
         uv_layer = mesh.uv_layers.new(name="UVMap")
@@ -756,7 +758,7 @@ def _import_wrld(path: str, decode_textures: bool = True, write_log: bool = True
     lines: List[str] = []
     lines.append(f"[wrld] loading '{path}' ({len(data)} bytes)")
     lines.append(
-        f"[wrld] magic={header.magic} type={header.wrld_type} size={header.total_size} "
+        f"[wrld] magic={header.magic} type={header.wrld_type} ({world.wrld_type_label(header.wrld_type)}) size={header.total_size} "
         f"g0=0x{header.global0:08X} g1=0x{header.global1:08X} gcnt={header.global_count} "
         f"cont=0x{header.continuation:08X} resv=0x{header.reserved:08X}"
     )
@@ -16,18 +16,25 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import mmap
 import struct
-import traceback
 
 import bpy
+import numpy as np
 from bpy.types import Operator
 from bpy.props import StringProperty, CollectionProperty
 from bpy_extras.io_utils import ImportHelper
 
 from ..leedsLib.worldblock import read_chinatown as RC
 
+_MDL_COUNTS = struct.Struct("<bh")
+_MDL_FACTORS = struct.Struct("<2f")
+_MDL_PART = struct.Struct("<HH")
+
 def ensure_bytes(file_bytes):
-    if isinstance(file_bytes, (bytes, bytearray, memoryview)):
+    if isinstance(file_bytes, (bytes, mmap.mmap)):
+        return file_bytes
+    if isinstance(file_bytes, (bytearray, memoryview)):
         return bytes(file_bytes)
     if isinstance(file_bytes, str):
         with open(file_bytes, "rb") as fh:
@@ -39,89 +46,88 @@ def ensure_bytes(file_bytes):
 class worldblock_importer:
 
     @staticmethod
-    def build_wbl(
-        file_bytes,
-        mesh_offset: int,
-        pos_xyz,
-        material_bank: RC.MaterialBank,
-        collection: bpy.types.Collection,
-        wbl_stem: str,
-        logf=None,
-    ):
+    def decode_wbl(file_bytes, mesh_offset: int, pos_xyz):
+        # The bpy-free half of build_wbl, so it can run off the main thread.
+        # Returns None for an out-of-bounds mesh, else (verts, uvs, faces,
+        # parts) with parts as (tex_id, face_count) in file order.
         file_bytes = ensure_bytes(file_bytes)
 
-        PX, PY, PZ = pos_xyz
         if mesh_offset < 0 or mesh_offset + 48 > len(file_bytes):
-            RC.dprint(f"[0x{mesh_offset:06X}] out of bounds", logf)
             return None
 
-        numMaterials = struct.unpack_from("<b", file_bytes, mesh_offset + 5)[0]
-        numVertices = struct.unpack_from("<h", file_bytes, mesh_offset + 6)[0]
-        translationFactor = struct.unpack_from("<f", file_bytes, mesh_offset + 40)[0]
-        scaleFactor = struct.unpack_from("<f", file_bytes, mesh_offset + 44)[0]
+        numMaterials, numVertices = _MDL_COUNTS.unpack_from(file_bytes, mesh_offset + 5)
+        translationFactor, scaleFactor = _MDL_FACTORS.unpack_from(file_bytes, mesh_offset + 40)
 
         stride = 16
         vbase = mesh_offset + 48
 
-        all_verts = []
-        all_uvs = []
-
-        for vi in range(numVertices):
-            off = vbase + vi * stride
-            x_raw = struct.unpack_from("<h", file_bytes, off + 0)[0]
-            y_raw = struct.unpack_from("<h", file_bytes, off + 2)[0]
-            z_raw = struct.unpack_from("<h", file_bytes, off + 4)[0]
-            u_raw = struct.unpack_from("<h", file_bytes, off + 12)[0]
-            v_raw = struct.unpack_from("<h", file_bytes, off + 14)[0]
-
-            x = x_raw / scaleFactor + PX
-            y = y_raw / scaleFactor + PY
-            z = z_raw / scaleFactor + PZ
-            u = (u_raw / 2048.0) + translationFactor * 2
-            v = 1.0 - (v_raw / 2048.0)
-
-            all_verts.append((x, y, z))
-            all_uvs.append((u, v))
+        positions, uv_rows = RC.decode_vertices(
+            file_bytes, vbase, numVertices, scaleFactor, pos_xyz, translationFactor
+        )
 
         verts = []
         uvs = []
         faces = []
-        face_mats = []
+        parts = []
 
+        base = 0
         vert_offset = 0
         mtab = vbase + numVertices * stride
 
         for mi in range(numMaterials):
-            m_off = mtab + mi * 12
-            tex_id = struct.unpack_from("<H", file_bytes, m_off + 0)[0]
-            vertex_count = struct.unpack_from("<H", file_bytes, m_off + 2)[0]
+            tex_id, vertex_count = _MDL_PART.unpack_from(file_bytes, mtab + mi * 12)
+
+            end = vert_offset + vertex_count
+            # A part running past numVertices would read into the next
+            # part's vertices or get truncated faces from the slice.
+            if end > numVertices:
+                raise ValueError(
+                    f"MDL at 0x{mesh_offset:X}: part {mi} needs vertices "
+                    f"{vert_offset}-{end - 1}, mesh has {numVertices}"
+                )
+            verts.append(positions[vert_offset:end])
+            uvs.append(uv_rows[vert_offset:end])
 
-            base = len(verts)
-            for i in range(vertex_count):
-                idx = vert_offset + i
-                verts.append(all_verts[idx])
-                uvs.append(all_uvs[idx])
+            local_faces = RC.tri_strip_to_tris(len(uvs[-1]))
 
-            local_faces = RC.tri_strip_to_tris(vertex_count)
-            mat_slot = material_bank.get_slot(tex_id)
+            faces.append(local_faces + base)
+            parts.append((tex_id, len(local_faces)))
+
+            base += len(uvs[-1])
+            vert_offset = end
+
+        faces = np.concatenate(faces) if faces else np.empty((0, 3), dtype=np.int32)
+        verts = np.concatenate(verts) if verts else np.empty((0, 3), dtype=np.float64)
+        uvs = np.concatenate(uvs) if uvs else np.empty((0, 2), dtype=np.float64)
+        return verts, uvs, faces, parts
+
+    @staticmethod
+    def build_wbl_mesh(
+        decoded,
+        mesh_offset: int,
+        material_bank: RC.MaterialBank,
+        collection: bpy.types.Collection,
+        wbl_stem: str,
+        logf=None,
+    ):
+        if decoded is None:
+            if RC.DEBUG_MODE:
+                RC.dprint(f"[0x{mesh_offset:06X}] out of bounds", logf)
+            return None
 
-            for (a, b, c) in local_faces:
-                faces.append((base + a, base + b, base + c))
-                face_mats.append(mat_slot)
+        verts, uvs, faces, parts = decoded
 
-            vert_offset += vertex_count
+        face_mats = []
+        for tex_id, face_count in parts:
+            face_mats.extend([material_bank.get_slot(tex_id)] * face_count)
 
         name = f"CW_Worldblock{wbl_stem}_MDL_{mesh_offset:06X}"
         mesh = bpy.data.meshes.new(name)
-        mesh.from_pydata(verts, [], faces)
-        mesh.update()
+        RC.fill_tri_mesh(mesh, verts, faces)
 
         uv_layer = mesh.uv_layers.new(name="UVMap")
-        for poly_index, poly in enumerate(mesh.polygons):
-            poly.material_index = face_mats[poly_index]
-            for loop_index in poly.loop_indices:
-                v_idx = mesh.loops[loop_index].vertex_index
-                uv_layer.data[loop_index].uv = uvs[v_idx]
+        uv_layer.data.foreach_set("uv", uvs.astype(np.float32)[faces.ravel()].ravel())
+        mesh.polygons.foreach_set("material_index", np.asarray(face_mats, dtype=np.int32))
 
         material_bank.append_all_to_mesh(mesh)
 
@@ -130,6 +136,25 @@ class worldblock_importer:
 
         return obj
 
+    @staticmethod
+    def build_wbl(
+        file_bytes,
+        mesh_offset: int,
+        pos_xyz,
+        material_bank: RC.MaterialBank,
+        collection: bpy.types.Collection,
+        wbl_stem: str,
+        logf=None,
+    ):
+        return worldblock_importer.build_wbl_mesh(
+            worldblock_importer.decode_wbl(file_bytes, mesh_offset, pos_xyz),
+            mesh_offset,
+            material_bank,
+            collection,
+            wbl_stem,
+            logf,
+        )
+
 class IMPORT_OT_wbl(Operator, ImportHelper):
 
     bl_idname = "import_scene.cw_worldblock"
@@ -152,11 +177,15 @@ class IMPORT_OT_wbl(Operator, ImportHelper):
         else:
             filepaths.append(self.filepath)
 
+        # Shared by every file, so textures common to several WBLs are
+        # built once per import.
+        material_cache = {}
         for fp in filepaths:
             try:
 
-                RC.import_wbl(fp, context)
+                RC.import_wbl(fp, context, material_cache)
             except Exception as exc:
+                import traceback
                 tb = traceback.format_exc()
                 self.report({"ERROR"}, f"Failed to import '{fp}': {exc}")
                 print(tb)